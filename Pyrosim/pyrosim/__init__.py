@@ -1 +1,3 @@
-from .pyrosim import Simulator
\ No newline at end of file
+from .pyrosim import Simulator
+from .server import SimulatorServer
+from .cache import ResultCache
@@ -0,0 +1,93 @@
+"""asyncio front end for pyrosim simulations (python 3 only)
+
+Each simulation runs in an asyncio subprocess, so a single event loop can
+keep many simulations in flight without a thread per Popen.communicate()
+and can interleave them with other asynchronous work.
+
+    data = await sim.run_async()
+    results = await run_simulations(sims, max_concurrent=8)
+"""
+import asyncio
+import weakref
+from subprocess import PIPE
+
+# event loop -> {server: asyncio.Lock}. A server evaluates one scene at a
+# time, so simulations bound to the same server take turns on it.
+_server_locks = weakref.WeakKeyDictionary()
+
+
+def _get_server_lock(server):
+    """Returns the lock of a server for the running event loop"""
+    locks = _server_locks.setdefault(asyncio.get_running_loop(),
+                                     weakref.WeakKeyDictionary())
+    if server not in locks:
+        locks[server] = asyncio.Lock()
+    return locks[server]
+
+
+async def run_simulation(sim):
+    """Runs a simulation to completion without blocking the event loop
+
+    Parameters
+    ----------
+    sim : Simulator
+        A simulation that has not been started yet
+
+    Returns
+    -------
+    numpy matrix
+        The same matrix Simulator.wait_to_finish() returns
+    """
+    if sim.server is not None:
+        # servers are driven through blocking pipes, keep them off the loop.
+        # simulations sharing a server run one after the other.
+        loop = asyncio.get_running_loop()
+        async with _get_server_lock(sim.server):
+            await loop.run_in_executor(None, sim.start)
+            return await loop.run_in_executor(None, sim.wait_to_finish)
+
+    sim._prepare_to_start()
+
+    if sim._lookup_cache():
+        return sim.wait_to_finish()
+
+    process = await asyncio.create_subprocess_exec(
+        *sim._get_commands(), stdin=PIPE, stdout=PIPE, stderr=PIPE)
+
+    stdout, stderr = await process.communicate(
+        sim.get_simulation_string().encode('utf-8'))
+
+    if not sim.binary_output:
+        stdout = stdout.decode('utf-8')
+        stderr = stderr.decode('utf-8', 'replace')
+
+    return sim._finish((stdout, stderr))
+
+
+async def run_simulations(sims, max_concurrent=None):
+    """Runs many simulations concurrently
+
+    Parameters
+    ----------
+    sims           : iterable of Simulator
+        Simulations that have not been started yet. Simulations bound to
+        the same SimulatorServer are evaluated one at a time.
+    max_concurrent : int, optional
+        The largest number of simulator processes alive at once. None runs
+        every simulation at the same time. (the default is None)
+
+    Returns
+    -------
+    list
+        The sensor data of each simulation, in the order of sims
+    """
+    if max_concurrent is None:
+        return await asyncio.gather(*[run_simulation(sim) for sim in sims])
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def run_limited(sim):
+        async with semaphore:
+            return await run_simulation(sim)
+
+    return await asyncio.gather(*[run_limited(sim) for sim in sims])
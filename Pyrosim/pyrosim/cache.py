@@ -0,0 +1,163 @@
+from __future__ import division, print_function
+import hashlib
+import io
+import os
+import sqlite3
+import threading
+
+import numpy as np
+
+_build_ids = {}
+_open_caches = {}
+
+
+def get_build_id(simulator_path):
+    """Returns a digest of the simulator binary
+
+    Results of a rebuilt simulator are keyed differently from the old ones,
+    so changes to the physics never return stale trajectories.
+
+    Parameters
+    ----------
+    simulator_path : str
+        The simulator executable
+
+    Returns
+    -------
+    str
+        Hex digest of the executable, computed once per process for each
+        version of the file
+    """
+    stat = os.stat(simulator_path)
+    key = (os.path.abspath(simulator_path), stat.st_mtime, stat.st_size)
+    if key not in _build_ids:
+        digest = hashlib.sha1()
+        with open(simulator_path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        _build_ids[key] = digest.hexdigest()
+    return _build_ids[key]
+
+
+class ResultCache(object):
+    """An on disk store of finished simulations
+
+    Results are keyed by a hash of the simulation string (see
+    Simulator.get_simulation_string) and the build id of the simulator
+    binary (see get_key), and stored as compressed numpy arrays in an
+    sqlite file.
+    Simulators created with Simulator(cache=...) look themselves up on
+    start() and return the stored sensor data from wait_to_finish()
+    without running the physics again. Only blind simulations are cached.
+
+    A cache can be shared by the threads and processes of a run. It
+    pickles as its path, so robots can carry it to other workers.
+
+    Attributes
+    ----------
+    path   : str
+        The sqlite file
+    hits   : int
+        Simulations returned from the cache by this process
+    misses : int
+        Simulations of this process which had to be run
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=60,
+                                           check_same_thread=False)
+        self._connection.execute('CREATE TABLE IF NOT EXISTS Results'
+                                 ' (key TEXT PRIMARY KEY, data BLOB)')
+        self._connection.commit()
+
+        _open_caches.setdefault(os.path.abspath(path), self)
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute(
+                'SELECT COUNT(*) FROM Results').fetchone()[0]
+
+    def __reduce__(self):
+        return open_cache, (self.path,)
+
+    @staticmethod
+    def get_key(sim):
+        """Returns the key of a simulation
+
+        Parameters
+        ----------
+        sim : Simulator
+            A simulation with all of its commands sent
+
+        Returns
+        -------
+        str
+            Hex digest of the simulator build id and the simulation string
+        """
+        digest = hashlib.sha1(
+            get_build_id(sim.pyrosim_path + '/simulator').encode('utf-8'))
+        digest.update(sim.get_simulation_string().encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Looks up the sensor data of a simulation
+
+        Parameters
+        ----------
+        key : str
+            The key of the simulation, see get_key
+
+        Returns
+        -------
+        dict or None
+            The arrays stored by put: 'sensor_<id>', the series of each
+            has_sensors returned when the simulation was run, 'abort', its
+            (abort_code, abort_step), and 'reduced' if it had reducers
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT data FROM Results WHERE key=?', (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        with np.load(io.BytesIO(row[0])) as payload:
+            return dict((name, payload[name]) for name in payload.files)
+
+    def put(self, key, **arrays):
+        """Stores the arrays of a finished simulation under key
+
+        Simulators store the series of each returned has_sensors as
+        sensor_<id>, their (abort_code, abort_step) as abort and the values
+        of their reducers as reduced.
+        """
+        buf = io.BytesIO()
+        np.savez_compressed(buf, **dict((name, np.asarray(value))
+                                        for name, value in arrays.items()))
+
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO Results (key, data) VALUES (?, ?)',
+                (key, sqlite3.Binary(buf.getvalue())))
+            self._connection.commit()
+
+    def close(self):
+        """Closes the sqlite connection"""
+        with self._lock:
+            self._connection.close()
+        if _open_caches.get(os.path.abspath(self.path)) is self:
+            del _open_caches[os.path.abspath(self.path)]
+
+
+def open_cache(path):
+    """Returns the ResultCache of a file, shared within this process"""
+    key = os.path.abspath(path)
+    if key not in _open_caches:
+        _open_caches[key] = ResultCache(path)
+    return _open_caches[key]
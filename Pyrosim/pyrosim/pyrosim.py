@@ -2,6 +2,7 @@ from __future__ import division, print_function
 import math
 import multiprocessing
 import os
+import struct
 import sys
 import numpy as np
 
@@ -31,6 +32,20 @@ hpr = [121, -27.5000, 0.0000]
 xyz = [0.8317, -0.9817, 0.8000]
 gravity = -1.0
 
+# binary sensor data protocol (see simulator/sensorWriter.h)
+BINARY_HEADER = struct.Struct('<4i')  # sensor id, values, time steps, dtype
+BINARY_END_OF_DATA = -1
+BINARY_ABORT = -2  # abort code, time step, sensor id. no values
+BINARY_REDUCED = -3  # number of reducers, 1, dtype. one value per reducer
+BINARY_DTYPES = {0: np.dtype('<f4'), 1: np.dtype('<f8')}
+
+# abort criteria (see simulator/abortCriterion.h), keyed by name
+ABORT_CRITERIA = {'max_step_xy': 1, 'max_speed': 2}
+
+# sensor reducers (see simulator/reducer.h), keyed by name
+REDUCERS = {'final': 0, 'mean': 1, 'sum_abs_delta': 2, 'max_abs_delta': 3,
+            'path_length_xy': 4, 'max_step_xy': 5}
+
 
 def make_sure_path_exists(path):
     """checks to se if path exists, if not creates path"""
@@ -80,6 +95,18 @@ class Simulator(object):
     capture     : bool, optional
             If True captures frames of the simulation every capture
             timesteps.  Meaningless if playing blind.  (the default is False)
+    binary_output : bool, optional
+            If True the simulator returns has_sensors data as raw float32
+            blocks instead of ASCII text, which is much faster to parse for
+            long evaluations. (the default is False)
+    server      : SimulatorServer, optional
+            If given the simulation is evaluated by this persistent
+            simulator process instead of a freshly started one. Only
+            blind simulations can use a server. (the default is None)
+    cache       : ResultCache, optional
+            If given, blind simulations which were already run return
+            their stored sensor data instead of running again, and new
+            results are added to the cache. (the default is None)
     """
     WORLD = -1
     FOREVER = -1
@@ -91,11 +118,15 @@ class Simulator(object):
                  gravity=gravity,
                  window_size=WINDOW_SIZE,
                  xyz=xyz, hpr=hpr, use_textures=False,
-                 debug=False, capture=0):
+                 debug=False, capture=0, binary_output=False,
+                 server=None, cache=None):
         assert play_blind is False or eval_time > 0, ('Cannot run'
                                                       ' blind forever')
         assert eval_time > 0, ('Cannot run forever: FIXXX MEEE')
         assert quasi_static_ratio > 0, ('Must be positive integer')
+        assert server is None or play_blind is True, ('Only blind'
+                                                      ' simulations can'
+                                                      ' use a server')
 
         self.strings_to_send = []
 
@@ -103,6 +134,7 @@ class Simulator(object):
         self._num_joints = 0
         self._num_sensors = 0
         self._num_neurons = 0
+        self._num_reducers = 0
         self._collision_groups = []
         self._collision_matrix = None
         self._matrix_created = False
@@ -115,6 +147,16 @@ class Simulator(object):
         self.gravity = gravity
         self.debug = debug
         self.use_textures = use_textures
+        self.binary_output = binary_output
+        self.server = server
+        self.cache = cache
+
+        self._cache_key = None
+        self._cached_data = None
+
+        # sensor id -> True if its series is returned, see send_sensor_output
+        self._sensor_output = {}
+        self.sensor_output_sent = False
 
         self.capture = capture
         if (self.capture):
@@ -123,12 +165,19 @@ class Simulator(object):
         self.evaluated = False
         self.collision_matrix_sent = False
 
+        # set by wait_to_finish if an abort criterion stopped the simulation
+        self.abort_code = 0
+        self.abort_step = -1
+
         self.pyrosim_path = os.path.dirname(
             os.path.abspath(__file__)) + '/simulator'
 
         self.body_to_follow = -1
 
+        # sensor id -> (values, time steps) array of every returned has_sensors
+        self.sensor_data = {}
         self.data = np.empty(self.eval_time, dtype=np.float64)
+        self.reduced_data = np.zeros(0, dtype=np.float64)
 
         if debug:
             print ('Simulator exec location ', self.pyrosim_path, '\n')
@@ -153,6 +202,11 @@ class Simulator(object):
             self._send('Debug', 1)
         else:
             self._send('Debug', 0)
+
+        if (self.binary_output):
+            self._send('BinaryOutput', 1)
+        else:
+            self._send('BinaryOutput', 0)
         self.send_camera(xyz, hpr)
 
 # ------Collisions-------------------------
@@ -254,6 +308,25 @@ class Simulator(object):
 
 # ------Getters--------------------------
 
+    @property
+    def data(self):
+        """The has_sensors values as a [sensor, 4, time step] matrix
+
+        Built from sensor_data the first time it is read after a
+        simulation, sensors which were not returned are all zeros.
+        """
+        if self._data is None:
+            self._data = np.zeros([self._num_sensors, 4,
+                                   self.eval_time], dtype='f')
+            for sensor_id, series in self.sensor_data.items():
+                self._data[sensor_id, :series.shape[0],
+                           :series.shape[1]] = series
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+
     def get_data(self):
         """Get all has_sensors data back as numpy matrix"""
         assert self.evaluated is True, 'Simulation has not run yet'
@@ -287,10 +360,30 @@ class Simulator(object):
         """Returns the number of neurons"""
         return self._num_neurons
 
+    def get_num_reducers(self):
+        """Returns the number of reducers"""
+        return self._num_reducers
+
     def get_num_sensors(self):
         """Returns the number of sensors"""
         return self._num_sensors
 
+    def get_reduced_value(self, reducer_id):
+        """Get the post simulation value of a reducer
+
+        Parameters
+        ----------
+        reducer_id : int
+                The id returned by send_reducer
+
+        Returns
+        -------
+        float
+                The value the reducer computed over the simulation
+        """
+        assert self.evaluated is True, 'Simulation has not run yet'
+        return self.reduced_data[reducer_id]
+
     def get_sensor_data(self, sensor_id, svi=0):
         """Get the post simulation data from a specified has_sensors
 
@@ -308,9 +401,13 @@ class Simulator(object):
         -------
         list of float
                 Returns the list of has_sensors values over the simulation.
+                All zeros if the has_sensors was not returned.
         """
         assert self.evaluated is True, 'Simulation has not run yet'
-        return self.data[sensor_id, svi, :]
+        series = self.sensor_data.get(sensor_id)
+        if series is None or svi >= series.shape[0]:
+            return np.zeros(self.eval_time, dtype='f')
+        return series[svi]
 
     def get_eval_time(self):
         """
@@ -1278,6 +1375,116 @@ class Simulator(object):
 
         return sensor_id
 
+# ------AbortCriteria------------------------------
+    def send_abort_criterion(self, sensor_id=0, criterion='max_step_xy',
+                             threshold=0.1):
+        """Stops the simulation early when a position sensor diverges
+
+        The criterion is checked by the simulator after every time step.
+        When it trips the simulation ends, the has_sensors values of the
+        remaining time steps are left at zero and wait_to_finish() sets
+        abort_code and abort_step.
+
+        Parameters
+        ----------
+        sensor_id : int, optional
+                The id of a position sensor
+        criterion : str, optional
+                'max_step_xy' trips when the sensor moves more than
+                threshold in the xy plane during a single time step.
+                'max_speed' trips when its speed exceeds threshold.
+                (the default is 'max_step_xy')
+        threshold : float, optional
+                The largest allowed value (the default is 0.1)
+
+        Returns
+        -------
+        int
+                The abort code reported when this criterion trips
+        """
+        assert sensor_id < self._num_sensors, ('Sensor with id ' +
+                                               str(sensor_id) +
+                                               ' has not been sent')
+        assert criterion in ABORT_CRITERIA, ('Unknown abort criterion ' +
+                                             str(criterion))
+
+        abort_code = ABORT_CRITERIA[criterion]
+        self._send('AbortCriterion', sensor_id, abort_code, threshold)
+
+        return abort_code
+
+# ------Reducers------------------------------
+    def send_reducer(self, sensor_id=0, reducer='final', svi=0):
+        """Reduces the values of a has_sensors to a single number
+
+        The reduction is computed by the simulator at the end of the
+        evaluation, so only the result has to be sent back. Time steps
+        after an abort are not reduced.
+
+        Parameters
+        ----------
+        sensor_id : int, optional
+                The id of the has_sensors to reduce
+        reducer   : str, optional
+                'final' and 'mean' are the last and the mean value of
+                svi. 'sum_abs_delta' and 'max_abs_delta' are the sum and
+                the largest of the absolute changes of svi between time
+                steps. 'path_length_xy' and 'max_step_xy' are the same
+                over the distance moved in the xy plane by a position
+                sensor, for which svi is ignored. (the default is 'final')
+        svi       : int, optional
+                The has_sensors value index (the default is 0)
+
+        Returns
+        -------
+        int
+                The id of the reducer, see get_reduced_value
+        """
+        assert sensor_id < self._num_sensors, ('Sensor with id ' +
+                                               str(sensor_id) +
+                                               ' has not been sent')
+        assert reducer in REDUCERS, ('Unknown reducer ' + str(reducer))
+
+        reducer_id = self._num_reducers
+        self._num_reducers += 1
+
+        self._send('Reducer', sensor_id, REDUCERS[reducer], svi)
+
+        return reducer_id
+
+# ------SensorOutput------------------------------
+    def send_sensor_output(self, sensor_id=0, series=True):
+        """Selects whether the values of a has_sensors are returned
+
+        By default every has_sensors is returned. Once a has_sensors is
+        marked with series=True only the marked sensors are returned, and
+        series=False leaves out a single has_sensors. Sensors which are not
+        returned still feed neurons, abort criteria and reducers, but their
+        values are never serialized and they are missing from sensor_data.
+
+        Parameters
+        ----------
+        sensor_id : int, optional
+                The id of the has_sensors
+        series    : bool, optional
+                Return the values of the has_sensors or not
+                (the default is True)
+
+        Returns
+        -------
+        bool
+                True if successful, False otherwise
+        """
+        assert sensor_id < self._num_sensors, ('Sensor with id ' +
+                                               str(sensor_id) +
+                                               ' has not been sent')
+        assert not self.sensor_output_sent, ('Sensor output has already'
+                                             ' been sent')
+
+        self._sensor_output[sensor_id] = bool(series)
+
+        return True
+
 # ------Synapses------------------------------
     def send_synapse(self, source_neuron_id=0, target_neuron_id=0,
                      weight=0.0):
@@ -1311,6 +1518,59 @@ class Simulator(object):
                                             start_time=0.,
                                             end_time=0.)
 
+    def send_synapse_matrix(self, source_ids, target_ids, weights):
+        """Sends a block of synapses to the simulator in a single command
+
+        Equivalent to calling send_synapse for every weight, but the block is
+        encoded and parsed in one pass, which matters for large networks.
+        Weights can be given either as a dense matrix or as a list of
+        (source, target, weight) triples.
+
+        Parameters
+        ----------
+        source_ids : list of ints
+                The ids of the source neurons
+        target_ids : list of ints
+                The ids of the target neurons
+        weights    : 2d or 1d array of floats
+                If 2d, weights[i, j] is the weight from source_ids[j] to
+                target_ids[i] and synapses are created target by target. If
+                1d, weights[k] is the weight from source_ids[k] to
+                target_ids[k] and all three must have the same length.
+
+        Returns
+        -------
+        bool
+                True if successful, False otherwise
+        """
+        source_ids = np.asarray(source_ids, dtype=int).ravel()
+        target_ids = np.asarray(target_ids, dtype=int).ravel()
+        weights = np.asarray(weights, dtype=np.float64)
+
+        for ids in (source_ids, target_ids):
+            assert np.all(ids < self._num_neurons), (
+                'Neuron with id ' + str(np.max(ids)) + ' has not been sent')
+
+        if weights.ndim == 2:
+            assert weights.shape == (len(target_ids), len(source_ids)), (
+                'Weight matrix must have one row per target and one'
+                ' column per source')
+            header = [1, len(target_ids), len(source_ids)]
+            ids = np.concatenate((target_ids, source_ids))
+        else:
+            assert (weights.ndim == 1 and
+                    len(weights) == len(source_ids) == len(target_ids)), (
+                'Sparse synapses need one source and target per weight')
+            header = [0, len(weights)]
+            ids = np.concatenate((source_ids, target_ids))
+
+        # repr keeps every digit so the weights match send_synapse exactly
+        self._send('SynapseMatrix', *header + [
+            ' '.join(map(str, ids.tolist())),
+            ' '.join(map(repr, weights.ravel().tolist()))])
+
+        return True
+
     def send_developing_synapse(self, source_neuron_id=0, target_neuron_id=0,
                                 start_weight=0.0, end_weight=0.0,
                                 start_time=0., end_time=1.0):
@@ -1409,30 +1669,24 @@ class Simulator(object):
     def start(self):
         """Starts the simulation"""
 
-        assert self.evaluated is False, (
-            'Simulation has already been evaluated')
+        self._prepare_to_start()
 
-        if (not self.collision_matrix_sent and self.get_num_groups() != 0):
-            self._send_collision_matrix()
+        if self._lookup_cache():
+            return True
 
-        # build initial commands
-        commands = [self.pyrosim_path + '/simulator']
-        if (self.play_blind is True):
-            commands.append('-blind')
-        else:
-            if self.use_textures is False:
-                commands.append('-notex')
+        if self.server is not None:
+            return self.server.send_scene(self)
 
-        if (self.play_paused is True):
-            commands.append('-pause')
+        commands = self._get_commands()
 
         self.pipe = Popen(commands, bufsize=0, stdout=PIPE, stdin=PIPE,
-                          stderr=PIPE, universal_newlines=True)
+                          stderr=PIPE,
+                          universal_newlines=not self.binary_output)
 
         for string_to_send in self.strings_to_send:
-            self.pipe.stdin.write(string_to_send)
+            self._write_to_pipe(string_to_send)
 
-        self.pipe.stdin.write('Done\n')
+        self._write_to_pipe('Done\n')
 
         if self.debug:
             print ('Done \n')
@@ -1447,34 +1701,77 @@ class Simulator(object):
         returns the string to send to the physics engine to run the evaluation
         :return: String
         """
-        to_send = self.strings_to_send
-        to_send.append("Done\n")
-        return ''.join(to_send)
+        return ''.join(self.strings_to_send) + 'Done\n'
 
-    def wait_to_finish(self):
+    def wait_to_finish(self, dense=True):
         """Waits to for the simulation to finish and collects data
 
+        Parameters
+        ----------
+        dense : bool, optional
+                If False return sensor_data instead of building the matrix
+                (the default is True)
+
         Returns
         -------
-        numpy matrix
+        numpy matrix or dict
                 A matrix of the has_sensors values for each time step of
-                the simulation
+                the simulation, or the (values, time steps) array of each
+                returned has_sensors keyed by its id
         """
 
-        data_from_simulator = self.pipe.communicate()
+        if self._cached_data is not None:
+            self.sensor_data = self._cached_data
+            self.data = None
+            self.evaluated = True
+            return self.data if dense else self.sensor_data
+
+        if self.server is not None:
+            data_from_simulator = self.server.receive_results(self)
+        else:
+            data_from_simulator = self.pipe.communicate()
+
+        return self._finish(data_from_simulator, dense)
+
+    def run_async(self):
+        """Runs the simulation in an asyncio subprocess (python 3 only)
+
+        Equivalent to start() followed by wait_to_finish() but does not
+        block the event loop. See pyrosim.asyncsim for helpers that run
+        many simulations at once.
+
+        Returns
+        -------
+        coroutine
+                Awaiting it returns the same matrix as wait_to_finish()
+        """
+        from .asyncsim import run_simulation
+
+        return run_simulation(self)
+
+# --------------------- Private methods ---------------------------
+    def _finish(self, data_from_simulator, dense=True):
+        """Collects the (stdout, stderr) output of a finished simulation"""
 
         if self.eval_time >= 0:
             self._collect_sensor_data(data_from_simulator)
             self.evaluated = True
 
-            return self.data
+            if self._cache_key is not None:
+                series = dict(('sensor_%d' % sensor_id, values)
+                              for sensor_id, values
+                              in self.sensor_data.items())
+                self.cache.put(self._cache_key,
+                               abort=(self.abort_code, self.abort_step),
+                               reduced=self.reduced_data, **series)
+
+            return self.data if dense else self.sensor_data
         else:
             self.evaluated = True
             print (data_from_simulator[0])
             print (data_from_simulator[1])
             return 'No results during infinite run'
 
-# --------------------- Private methods ---------------------------
     def _add_group(self, group):
         """Appends group handle to list and returns index"""
         index = len(self._collision_groups)
@@ -1501,13 +1798,47 @@ class Simulator(object):
         assert flag is True, ('Vector parameters of ' + name +
                               ' cannot be all zeros')
 
+    def _collect_binary_sensor_data(self, raw_data):
+        """Unpack binary has_sensors records from ODE into the numpy array"""
+
+        offset = 0
+        while offset < len(raw_data):
+            (sensor_id, num_sensor_vals,
+             num_steps, dtype) = BINARY_HEADER.unpack_from(raw_data, offset)
+            offset += BINARY_HEADER.size
+
+            if sensor_id == BINARY_END_OF_DATA:
+                break
+
+            if sensor_id == BINARY_ABORT:
+                self.abort_code, self.abort_step = num_sensor_vals, num_steps
+                continue
+
+            if sensor_id == BINARY_REDUCED:
+                self.reduced_data = np.frombuffer(
+                    raw_data, dtype=BINARY_DTYPES[dtype],
+                    count=num_sensor_vals, offset=offset).copy()
+                offset += self.reduced_data.nbytes
+                continue
+
+            values = np.frombuffer(raw_data, dtype=BINARY_DTYPES[dtype],
+                                   count=num_sensor_vals * num_steps,
+                                   offset=offset)
+            offset += values.nbytes
+
+            # records are time major, one block of svi values per time step
+            self.sensor_data[sensor_id] = \
+                values.reshape(num_steps, num_sensor_vals).T.copy()
+
     def _collect_sensor_data(self, data_from_simulator):
         """Get has_sensors data back from ODE and store it in numpy array"""
 
-        self.data = np.zeros([self._num_sensors, 4,
-                              self.eval_time], dtype='f')
+        self.sensor_data = {}
+        self.data = None
 
         debug_output = data_from_simulator[1]
+        if self.binary_output:
+            debug_output = debug_output.decode('utf-8', 'replace')
 
         if self.debug:
             chop_start = debug_output.find('Simulation test environment')
@@ -1518,6 +1849,10 @@ class Simulator(object):
                 print (debug_output)
 
         data_from_simulator = data_from_simulator[0]
+        if self.binary_output:
+            self._collect_binary_sensor_data(data_from_simulator)
+            return
+
         data_from_simulator = data_from_simulator.split()
 
         if (data_from_simulator == []):
@@ -1525,12 +1860,29 @@ class Simulator(object):
 
         index = 0
         while (data_from_simulator[index] != 'Done'):
+            if data_from_simulator[index] == 'Abort':
+                self.abort_code = int(data_from_simulator[index + 1])
+                self.abort_step = int(data_from_simulator[index + 2])
+                index = index + 4
+                continue
+
+            if data_from_simulator[index] == 'Reduced':
+                num_reducers = int(data_from_simulator[index + 1])
+                self.reduced_data = np.array(
+                    data_from_simulator[index + 2:index + 2 + num_reducers],
+                    dtype=np.float64)
+                index = index + 2 + num_reducers
+                continue
+
             sensor_id = int(data_from_simulator[index])
             index = index + 1
 
             num_sensor_vals = int(data_from_simulator[index])
             index = index + 1
 
+            series = np.zeros([num_sensor_vals, self.eval_time], dtype='f')
+            self.sensor_data[sensor_id] = series
+
             for t in range(0, self.eval_time):  # time step
                 for s in range(0, num_sensor_vals):  # svi
                     try:
@@ -1539,9 +1891,63 @@ class Simulator(object):
                         print (index, data_from_simulator)
                         print (debug_output)
                         raise IndexError
-                    self.data[sensor_id, s, t] = sensor_value
+                    series[s, t] = sensor_value
                     index = index + 1
         # print(self.data)
+    def _get_commands(self):
+        """Returns the command line used to launch the simulator"""
+
+        commands = [self.pyrosim_path + '/simulator']
+        if (self.play_blind is True):
+            commands.append('-blind')
+        else:
+            if self.use_textures is False:
+                commands.append('-notex')
+
+        if (self.play_paused is True):
+            commands.append('-pause')
+
+        return commands
+
+    def _lookup_cache(self):
+        """Looks the simulation up in the result cache
+
+        Returns
+        -------
+        bool
+                True if the results are cached and the simulator does not
+                need to run
+        """
+        if self.cache is None or not self.play_blind:
+            return False
+
+        self._cache_key = self.cache.get_key(self)
+        cached = self.cache.get(self._cache_key)
+        # payloads without an abort record are incomplete, run them again
+        if cached is not None and 'abort' in cached:
+            self._cached_data = dict(
+                (int(name[len('sensor_'):]), cached[name])
+                for name in cached if name.startswith('sensor_'))
+            self.abort_code, self.abort_step = (int(v)
+                                                for v in cached['abort'])
+            if 'reduced' in cached:
+                self.reduced_data = cached['reduced']
+            self._cache_key = None
+
+        return self._cached_data is not None
+
+    def _prepare_to_start(self):
+        """Checks the simulation can start and sends pending commands"""
+
+        assert self.evaluated is False, (
+            'Simulation has already been evaluated')
+
+        if (not self.collision_matrix_sent and self.get_num_groups() != 0):
+            self._send_collision_matrix()
+
+        if not self.sensor_output_sent:
+            self._send_sensor_output()
+
     def _send_collision_matrix(self):
         """sends the collision matrix"""
 
@@ -1562,6 +1968,24 @@ class Simulator(object):
         self._send('CollisionMatrix', self.get_num_groups(), *send_string)
         return True
 
+    def _get_hidden_sensors(self):
+        """Returns the ids of the sensors which are not returned"""
+
+        if any(self._sensor_output.values()):
+            return set(sensor_id for sensor_id in range(self._num_sensors)
+                       if not self._sensor_output.get(sensor_id, False))
+
+        return set(sensor_id for sensor_id, series
+                   in self._sensor_output.items() if not series)
+
+    def _send_sensor_output(self):
+        """Sends the sensors which are not returned"""
+
+        self.sensor_output_sent = True
+
+        for sensor_id in sorted(self._get_hidden_sensors()):
+            self._send('SensorOutput', sensor_id, 0)
+
     def _send(self, command_string, *args):
         """Send a command to the simulator"""
 
@@ -1576,4 +2000,11 @@ class Simulator(object):
             print(string_to_send,)
         self.strings_to_send.append(string_to_send)
 
+    def _write_to_pipe(self, string_to_send):
+        """Write a command string to the simulator's stdin"""
+
+        if self.binary_output:
+            string_to_send = string_to_send.encode('utf-8')
+        self.pipe.stdin.write(string_to_send)
+
 
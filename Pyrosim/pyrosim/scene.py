@@ -0,0 +1,107 @@
+from __future__ import division, print_function
+
+
+def get_scene_state(sim):
+    """Returns the id counters of a simulator as a tuple
+
+    Ids handed out by the send_* methods depend only on these counters, so
+    two simulators with the same state assign the same ids to the same
+    sequence of commands.
+    """
+    return (sim.get_num_bodies(), sim.get_num_joints(),
+            sim.get_num_sensors(), sim.get_num_neurons(),
+            sim.get_num_groups(), sim.get_num_reducers())
+
+
+class SceneTemplate(object):
+    """A recorded block of simulator commands which can be replayed
+
+    Recording starts when the template is created from a simulator and
+    ends with finish(). Everything sent to the simulator in between (the
+    body of a robot, its sensors, motor neurons...) is kept as a single
+    string together with the ids it used, and replay() appends it to other
+    simulators without building any of the commands again.
+
+    A template can only be replayed into a simulator whose state (see
+    get_scene_state) matches the one it was recorded from, since the ids
+    inside the commands are absolute. Calls that change more than the
+    commands and the id counters, such as film_body, are not recorded.
+
+    Attributes
+    ----------
+    ids : dict
+        User data stored by finish(), typically the ids of the recorded
+        bodies and neurons
+    """
+
+    def __init__(self, sim):
+        self.start_state = get_scene_state(sim)
+        self.end_state = None
+        self.commands = None
+        self.collision_groups = None
+        self.ids = {}
+
+        self._sim = sim
+        self._start = len(sim.strings_to_send)
+
+    def is_finished(self):
+        """Returns True once the template has been recorded"""
+        return self.commands is not None
+
+    def finish(self, sim, **ids):
+        """Stops recording
+
+        Parameters
+        ----------
+        sim  : Simulator
+            The simulator the template was created from
+        **ids
+            Data to keep alongside the commands, returned by replays
+
+        Returns
+        -------
+        SceneTemplate
+            self
+        """
+        assert sim is self._sim, ('Template was recorded from another'
+                                  ' simulator')
+        assert not self.is_finished(), ('Template has already been'
+                                        ' recorded')
+
+        self.commands = ''.join(sim.strings_to_send[self._start:])
+        self.collision_groups = list(
+            sim._collision_groups[self.start_state[4]:])
+        self.end_state = get_scene_state(sim)
+        self.ids = ids
+
+        self._sim = None
+
+        return self
+
+    def replay(self, sim):
+        """Appends the recorded commands to a simulator
+
+        Parameters
+        ----------
+        sim : Simulator
+            A simulator in the same state the template was recorded from
+
+        Returns
+        -------
+        dict
+            The ids stored by finish()
+        """
+        assert self.is_finished(), ('Template is still recording')
+        assert get_scene_state(sim) == self.start_state, (
+            'Simulator state does not match the template')
+
+        if sim.debug:
+            print(self.commands,)
+        sim.strings_to_send.append(self.commands)
+
+        (sim._num_bodies, sim._num_joints,
+         sim._num_sensors, sim._num_neurons, _,
+         sim._num_reducers) = self.end_state
+        sim._collision_groups.extend(self.collision_groups)
+
+        return self.ids
@@ -0,0 +1,182 @@
+from __future__ import division, print_function
+import os
+
+from subprocess import Popen, PIPE
+
+from .pyrosim import BINARY_HEADER, BINARY_END_OF_DATA, BINARY_ABORT
+from .pyrosim import BINARY_DTYPES
+
+
+class SimulatorServer(object):
+    """A long lived simulator process which evaluates scene after scene
+
+    Starting a simulator process initialises ODE and allocates the
+    collision matrix every time. A server pays that cost once: each scene
+    is written to the same process, which resets its world after sending
+    the results back. Bind simulators to a server with
+    Simulator(server=...); they are then started and collected as usual.
+    Only blind simulations can run on a server, one at a time.
+
+    Attributes
+    ----------
+    debug       : bool, optional
+            If True the simulator's stderr is passed through to this
+            process, otherwise it is discarded. (the default is False)
+    """
+
+    def __init__(self, debug=False):
+        self.debug = debug
+        self.pyrosim_path = os.path.dirname(
+            os.path.abspath(__file__)) + '/simulator'
+
+        self.pipe = None
+        self.num_evaluations = 0
+        self._active = None
+        self._stderr = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def is_running(self):
+        """Returns True if the simulator process is alive"""
+        return self.pipe is not None and self.pipe.poll() is None
+
+    def start(self):
+        """Starts the simulator process if it is not already running"""
+        if self.is_running():
+            return True
+
+        commands = [self.pyrosim_path + '/simulator', '-blind', '-server']
+
+        if self.debug:
+            self._stderr = None
+        else:
+            self._stderr = open(os.devnull, 'wb')
+
+        self.pipe = Popen(commands, stdout=PIPE, stdin=PIPE,
+                          stderr=self._stderr)
+        self._active = None
+
+        return True
+
+    def close(self):
+        """Stops the simulator process after its current scene"""
+        if self.pipe is not None:
+            try:
+                self.pipe.stdin.close()
+            except (IOError, OSError):
+                pass  # the process has already exited
+            self.pipe.wait()
+            self.pipe.stdout.close()
+            self.pipe = None
+
+        if self._stderr is not None:
+            self._stderr.close()
+            self._stderr = None
+
+        self._active = None
+
+        return True
+
+    def send_scene(self, sim):
+        """Writes the scene of a simulator to the server
+
+        Parameters
+        ----------
+        sim : Simulator
+            The simulator whose commands are evaluated next
+
+        Returns
+        -------
+        bool
+            True if successful
+        """
+        assert sim.play_blind is True, ('Only blind simulations can run'
+                                        ' on a server')
+        assert self._active is None, ('Server is already running a'
+                                      ' simulation')
+
+        self.start()
+
+        try:
+            self.pipe.stdin.write(
+                sim.get_simulation_string().encode('utf-8'))
+            self.pipe.stdin.flush()
+        except (IOError, OSError):
+            self._crashed()
+
+        # only a scene that was written is waiting for its results
+        self._active = sim
+
+        return True
+
+    def receive_results(self, sim):
+        """Reads back the results of the scene sent by sim
+
+        Returns
+        -------
+        tuple
+            (stdout, stderr) in the same form as Popen.communicate() for
+            the simulator's output mode. stderr is always empty.
+        """
+        assert self._active is sim, ('Simulation was not sent to'
+                                     ' this server')
+        self._active = None
+
+        if sim.binary_output:
+            result = self._read_binary_results()
+            self.num_evaluations += 1
+            return result, b''
+        else:
+            result = self._read_text_results()
+            self.num_evaluations += 1
+            return result, ''
+
+# --------------------- Private methods ---------------------------
+    def _read_binary_results(self):
+        """Reads binary sensor records up to the end of data record"""
+        chunks = []
+        while True:
+            header = self._read_exactly(BINARY_HEADER.size)
+            chunks.append(header)
+
+            (sensor_id, num_sensor_vals,
+             num_steps, dtype) = BINARY_HEADER.unpack(header)
+            if sensor_id == BINARY_END_OF_DATA:
+                break
+            if sensor_id == BINARY_ABORT:
+                continue
+
+            chunks.append(self._read_exactly(
+                num_sensor_vals * num_steps * BINARY_DTYPES[dtype].itemsize))
+
+        return b''.join(chunks)
+
+    def _read_text_results(self):
+        """Reads text sensor lines up to the closing Done"""
+        lines = []
+        while True:
+            line = self.pipe.stdout.readline()
+            if not line:
+                self._crashed()
+            lines.append(line)
+            if line.strip() == b'Done':
+                break
+
+        return b''.join(lines).decode('utf-8')
+
+    def _read_exactly(self, num_bytes):
+        """Reads num_bytes from the simulator or fails if it has exited"""
+        data = self.pipe.stdout.read(num_bytes)
+        if len(data) < num_bytes:
+            self._crashed()
+        return data
+
+    def _crashed(self):
+        """Cleans up after the simulator process died mid scene"""
+        self.close()
+        raise RuntimeError('Simulator server exited unexpectedly')
@@ -0,0 +1,52 @@
+#ifndef _ABORT_CRITERION_CPP
+#define _ABORT_CRITERION_CPP
+
+#include "abortCriterion.h"
+#include "positionSensor.h"
+
+ABORT_CRITERION::ABORT_CRITERION(int mySensorID, int myKind, double myThreshold, POSITION_SENSOR *sensor) {
+
+	sensorID = mySensorID;
+
+	kind = myKind;
+
+	threshold = myThreshold;
+
+	positionSensor = sensor;
+}
+
+ABORT_CRITERION::~ABORT_CRITERION(void) {
+
+}
+
+int  ABORT_CRITERION::Get_Sensor_ID(void) {
+
+	return sensorID;
+}
+
+int  ABORT_CRITERION::Check(int t, double dt) {
+
+	// returns the abort code of this criterion if it tripped at time step t, NOT_ABORTED otherwise.
+	// the position sensor must already have been polled at t.
+
+	if ( t == 0 )
+
+		return NOT_ABORTED;
+
+	if ( kind == ABORT_MAX_STEP_XY ) {
+
+		if ( positionSensor->Get_Step_Displacement(t,true) > threshold )
+
+			return ABORT_MAX_STEP_XY;
+	}
+	else if ( kind == ABORT_MAX_SPEED ) {
+
+		if ( positionSensor->Get_Step_Displacement(t,false) / dt > threshold )
+
+			return ABORT_MAX_SPEED;
+	}
+
+	return NOT_ABORTED;
+}
+
+#endif
@@ -0,0 +1,37 @@
+#ifndef _ABORT_CRITERION_H
+#define _ABORT_CRITERION_H
+
+// Abort codes reported back to python, one per kind of criterion.
+// NOT_ABORTED is reported when every criterion held for the whole evaluation.
+
+const int NOT_ABORTED = 0;
+
+const int ABORT_MAX_STEP_XY = 1;
+
+const int ABORT_MAX_SPEED = 2;
+
+class POSITION_SENSOR;
+
+class ABORT_CRITERION {
+
+private:
+
+	int sensorID;
+
+	int kind;
+
+	double threshold;
+
+	POSITION_SENSOR *positionSensor;
+
+public:
+	ABORT_CRITERION(int mySensorID, int myKind, double myThreshold, POSITION_SENSOR *sensor);
+
+	~ABORT_CRITERION(void);
+
+	int  Get_Sensor_ID(void);
+
+	int  Check(int t, double dt);
+};
+
+#endif
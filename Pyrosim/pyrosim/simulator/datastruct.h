@@ -19,8 +19,9 @@ struct Data
   int trackBody;
   int followBody;
   int collisionMatrix[MAX_GROUPS][MAX_GROUPS];
-  int numCollisionGroups;
+  int numCollisionGroups = 0;
   int capture;
+  int binaryOutput = 0;
 
   int windowWidth = 750;
   int windowHeight = 450;
@@ -2,6 +2,7 @@
 #define _ENVIRONMENT_CPP
 
 #include "environment.h"
+#include "sensorWriter.h"
 #include "iostream"
 
 
@@ -27,10 +28,32 @@ ENVIRONMENT::ENVIRONMENT(void) {
 	numberOfJoints = 0;
 
 	neuralNetwork = NULL;
+
+	abortCode = NOT_ABORTED;
+
+	abortStep = -1;
+
+	abortSensorID = -1;
 }
 
 ENVIRONMENT::~ENVIRONMENT(void) {
 
+	for (int i=0;i<numberOfBodies;i++)
+		delete objects[i];
+
+	for (int j=0;j<numberOfJoints;j++)
+		delete joints[j];
+
+	delete [] objects;
+	delete [] joints;
+
+	delete neuralNetwork;
+
+	for (unsigned int c=0;c<abortCriteria.size();c++)
+		delete abortCriteria[c];
+
+	for (unsigned int r=0;r<reducers.size();r++)
+		delete reducers[r];
 }
 
 void ENVIRONMENT::Actuate_Joints(bool update) {
@@ -39,6 +62,31 @@ void ENVIRONMENT::Actuate_Joints(bool update) {
                 joints[j]->Actuate(update);
 }
 
+void ENVIRONMENT::Check_Abort_Criteria(int timeStep, double dt) {
+
+        // called once the sensors have been polled. the first criterion to trip stops the evaluation.
+
+        if ( abortCode != NOT_ABORTED )
+
+                return;
+
+        for (unsigned int c=0;c<abortCriteria.size();c++) {
+
+                int code = abortCriteria[c]->Check(timeStep,dt);
+
+                if ( code != NOT_ABORTED ) {
+
+                        abortCode = code;
+
+                        abortStep = timeStep;
+
+                        abortSensorID = abortCriteria[c]->Get_Sensor_ID();
+
+                        return;
+                }
+        }
+}
+
 void ENVIRONMENT::Draw(int debug) {
 
         for (int i=0;i<numberOfBodies;i++)
@@ -60,13 +108,18 @@ void ENVIRONMENT::Get_Object_Position(float *xyz, int bodyID){
         xyz[2] = pos[2];
 }
 
+int  ENVIRONMENT::Is_Aborted(void) {
+
+        return abortCode != NOT_ABORTED;
+}
+
 void ENVIRONMENT::Read_From_Python(dWorldID world, dSpaceID space, Data *data)
 {
        char incomingString[10000];
 
         std::cin >> incomingString;
 
-        while ( strcmp(incomingString,"Done") != 0 ) {
+        while ( std::cin.good() && strcmp(incomingString,"Done") != 0 ) {
                 std::cerr << incomingString << "\n";
                 //Simulator options
                 if ( strcmp(incomingString,"EvaluationTime") == 0 )
@@ -81,6 +134,8 @@ void ENVIRONMENT::Read_From_Python(dWorldID world, dSpaceID space, Data *data)
                         std::cin >> data->texturePathStr;
                 else if ( strcmp(incomingString,"Debug") == 0)
                         std::cin >> data->debug;
+                else if ( strcmp(incomingString,"BinaryOutput") == 0)
+                        std::cin >> data->binaryOutput;
                 else if ( strcmp(incomingString,"ExternalForce") == 0){
                         int bodyID;
                         float x,y,z;
@@ -177,6 +232,18 @@ void ENVIRONMENT::Read_From_Python(dWorldID world, dSpaceID space, Data *data)
 
                         Create_Vestibular_Sensor(data->evaluationTime);
 
+                else if ( strcmp(incomingString,"AbortCriterion") == 0 )
+
+                        Create_Abort_Criterion();
+
+                else if ( strcmp(incomingString,"Reducer") == 0 )
+
+                        Create_Reducer();
+
+                else if ( strcmp(incomingString,"SensorOutput") == 0 )
+
+                        Create_Sensor_Output();
+
                 else if ( strcmp(incomingString,"LightSource") == 0 )
 
                         Create_Light_Source();
@@ -199,12 +266,18 @@ void ENVIRONMENT::Read_From_Python(dWorldID world, dSpaceID space, Data *data)
 
                 else if ( strcmp(incomingString,"FunctionNeuron") == 0)
                         Create_Function_Neuron(data->evaluationTime);
+                else if ( strcmp(incomingString,"SynapseMatrix") == 0)
+                        Create_Synapse_Matrix();
                 //Synapse
                 else
                         Create_Synapse();
 
                 std::cin >> incomingString;
         }
+
+        if ( neuralNetwork )
+
+                neuralNetwork->Freeze();
 }
 
 void ENVIRONMENT::Poll_Sensors(int timeStep) {
@@ -231,15 +304,26 @@ void ENVIRONMENT::Update_Forces(int timeStep){
         objects[i]->Apply_Stored_Forces(timeStep);
     }
 }
-void ENVIRONMENT::Write_Sensor_Data(int evalPeriod) {
+void ENVIRONMENT::Write_Sensor_Data(int evalPeriod, int binaryOutput) {
+
+    SENSOR_WRITER writer(binaryOutput);
+
+    for (unsigned int r=0;r<reducers.size();r++)
+    	writer.Add_Reducer(reducers[r]);
+    for (unsigned int h=0;h<hiddenSensors.size();h++)
+    	writer.Hide_Series(hiddenSensors[h]);
 
     std::cerr << "finishing" << std::endl;
+    if ( abortCode != NOT_ABORTED ) {
+    	writer.Write_Abort(abortCode,abortStep,abortSensorID);
+    	writer.Set_Num_Steps(abortStep+1);
+    }
 	for (int i=0;i<numberOfBodies;i++)
-		objects[i]->Write_To_Python(evalPeriod);
+		objects[i]->Write_To_Python(evalPeriod,&writer);
     for (int j=0;j<numberOfJoints;j++)
-    	joints[j]->Write_To_Python(evalPeriod);
+    	joints[j]->Write_To_Python(evalPeriod,&writer);
 
-	std::cout << "Done\n";
+	writer.Finish();
 }
 
 // ----------------------- Private methods ---------------------------
@@ -258,6 +342,36 @@ void ENVIRONMENT::Add_Sensor_Neuron(int ID, int sensorID, int sensorValueIndex)
         Connect_Sensor_To_Sensor_Neuron( sensorID, sensorNeuron );
 }
 
+void ENVIRONMENT::Create_Abort_Criterion(void) {
+
+        int sensorID;
+
+        std::cin >> sensorID;
+
+        int kind;
+
+        std::cin >> kind;
+
+        double threshold;
+
+        std::cin >> threshold;
+
+        POSITION_SENSOR *sensor = NULL;
+
+        for (int i=0;(i<numberOfBodies) && (sensor == NULL);i++)
+
+                sensor = objects[i]->Get_Position_Sensor(sensorID);
+
+        if ( sensor == NULL ) {
+
+                std::cerr << "Abort criterion ignored: sensor " << sensorID << " is not a position sensor" << std::endl;
+
+                return;
+        }
+
+        abortCriteria.push_back(new ABORT_CRITERION(sensorID,kind,threshold,sensor));
+}
+
 void ENVIRONMENT::Create_Bias_Neuron(void) {
 
         int ID;
@@ -431,6 +545,38 @@ void ENVIRONMENT::Create_Position_Sensor(int evalPeriod) {
     objects[objectIndex]->Create_Position_Sensor(ID,evalPeriod);	
 }
 
+void ENVIRONMENT::Create_Reducer(void) {
+
+    int sensorID;
+
+    std::cin >> sensorID;
+
+    int kind;
+
+    std::cin >> kind;
+
+    int svi;
+
+    std::cin >> svi;
+
+    reducers.push_back(new REDUCER(sensorID,kind,svi));
+}
+
+void ENVIRONMENT::Create_Sensor_Output(void) {
+
+    int sensorID;
+
+    std::cin >> sensorID;
+
+    int series;
+
+    std::cin >> series;
+
+    if ( !series )
+
+        hiddenSensors.push_back(sensorID);
+}
+
 void ENVIRONMENT::Create_Proprioceptive_Sensor(int evalPeriod) {
 
     int jointIndex;
@@ -502,6 +648,15 @@ void ENVIRONMENT::Create_Synapse(void) {
         neuralNetwork->Add_Synapse();
 }
 
+void ENVIRONMENT::Create_Synapse_Matrix(void) {
+
+        if ( neuralNetwork == NULL )
+
+                Create_Neural_Network();
+
+        neuralNetwork->Add_Synapse_Matrix();
+}
+
 void ENVIRONMENT::Create_Touch_Sensor(int evalPeriod) {
 
     int objectIndex;
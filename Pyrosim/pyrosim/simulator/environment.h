@@ -5,7 +5,10 @@
 #include "joint.h"
 #include "object.h"
 #include "neuralNetwork.h"
+#include "abortCriterion.h"
+#include "reducer.h"
 #include "datastruct.h"
+#include <vector>
 
 class ENVIRONMENT {
  
@@ -22,6 +25,14 @@ private:
 
 	NEURAL_NETWORK *neuralNetwork;
 
+	std::vector<ABORT_CRITERION *> abortCriteria;
+
+	int abortCode, abortStep, abortSensorID;
+
+	std::vector<REDUCER *> reducers;
+
+	std::vector<int> hiddenSensors;
+
 public:
 	ENVIRONMENT(void);
 
@@ -29,10 +40,14 @@ public:
 
 	void Actuate_Joints(bool update);
 
+	void Check_Abort_Criteria(int timeStep, double dt);
+
 	void Draw(int debug=0);
 
 	void Get_Object_Position(float *xyz, int bodyID);
 
+	int  Is_Aborted(void);
+
         void Poll_Sensors(int timeStep);
 
     void Read_From_Python(dWorldID world, dSpaceID space, Data *data);
@@ -41,7 +56,7 @@ public:
 
 	void Update_Forces(int timeStep);
 
-	void Write_Sensor_Data(int evalPeriod);
+	void Write_Sensor_Data(int evalPeriod, int binaryOutput);
 
 private:
     void Add_Motor_Neuron(int ID, int jointID, double tau, double alpha, double start);
@@ -52,6 +67,8 @@ private:
 
 	void Connect_Sensor_To_Sensor_Neuron( int sensorID , NEURON *sensorNeuron );
 
+	void Create_Abort_Criterion(void);
+
 	void Create_Bias_Neuron( void );
 
 	void Create_Function_Neuron(int evalPeriod);
@@ -76,12 +93,18 @@ private:
 
 	void Create_Position_Sensor(int evalPeriod);
 
+	void Create_Reducer(void);
+
+	void Create_Sensor_Output(void);
+
 	void Create_Proprioceptive_Sensor(int evalPeriod);
 
 	void Create_Sensor_Neuron(void);
 
 	void Create_Synapse(void);
 
+	void Create_Synapse_Matrix(void);
+
 	void Create_Touch_Sensor(int evalPeriod);
 
 	void Create_Vestibular_Sensor(int evalPeriod);
@@ -2,12 +2,13 @@
 #define _IS_SEEN_SENSOR_CPP
 
 #include "iostream"
+#include "sensorWriter.h"
 #include "isSeenSensor.h"
 #include "neuron.h"
 
 IS_SEEN_SENSOR::IS_SEEN_SENSOR(int myID, int evalPeriod){
     ID = myID;
-    values = new int[evalPeriod];
+    values = new double[evalPeriod]();
 
     for (int t=0; t<evalPeriod; t++){
         values[t] = 0;
@@ -16,7 +17,9 @@ IS_SEEN_SENSOR::IS_SEEN_SENSOR(int myID, int evalPeriod){
     mySensorNeuron = NULL;
 }
 
-IS_SEEN_SENSOR::~IS_SEEN_SENSOR(void){}
+IS_SEEN_SENSOR::~IS_SEEN_SENSOR(void){
+    delete [] values;
+}
 
 void IS_SEEN_SENSOR::Connect_To_Sensor_Neuron(NEURON *sensorNeuron){
     mySensorNeuron = sensorNeuron;
@@ -37,17 +40,9 @@ void IS_SEEN_SENSOR::Update_Sensor_Neurons(int t) {
                 mySensorNeuron->Set( values[t] );
 }
 
-void IS_SEEN_SENSOR::Write_To_Python(int evalPeriod) {
-
-        char outString[100000];
-        sprintf(outString,"%d %d ",ID,1);
-
-        for ( int t=0; t < evalPeriod; t++ ){
-            sprintf(outString,"%s %d ",outString,values[t]);
-        }
+void IS_SEEN_SENSOR::Write_To_Python(int evalPeriod, SENSOR_WRITER *writer) {
 
-        sprintf(outString,"%s \n",outString);
-        std::cout << outString;
+        writer->Write_Sensor(ID,1,evalPeriod,&values,1);
 }
 
 #endif
\ No newline at end of file
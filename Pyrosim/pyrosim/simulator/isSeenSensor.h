@@ -4,10 +4,12 @@
 #include <ode/ode.h>
 class NEURON;
 
+class SENSOR_WRITER;
+
 class IS_SEEN_SENSOR {
 private:
     int ID;
-    int *values;
+    double *values;
     NEURON *mySensorNeuron;
 
 public:
@@ -22,7 +24,7 @@ public:
 
     void Update_Sensor_Neurons(int t);
 
-    void Write_To_Python(int evalPeriod);
+    void Write_To_Python(int evalPeriod, SENSOR_WRITER *writer);
 };
 
 #endif
\ No newline at end of file
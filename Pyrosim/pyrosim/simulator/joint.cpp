@@ -2,6 +2,7 @@
 #define _JOINT_CPP
 
 #include "iostream"
+#include "sensorWriter.h"
 
 #include "joint.h"
 
@@ -56,6 +57,7 @@ JOINT::JOINT(int jointType) {
 
 JOINT::~JOINT(void) {
 
+	delete proprioceptiveSensor;
 }
 
 void JOINT::Actuate(bool update) {
@@ -334,11 +336,11 @@ void JOINT::Update_Sensor_Neurons(int t) {
                 proprioceptiveSensor->Update_Sensor_Neurons(t);
 }
 
-void JOINT::Write_To_Python(int evalPeriod) {
+void JOINT::Write_To_Python(int evalPeriod, SENSOR_WRITER *writer) {
 
         if ( proprioceptiveSensor )
 
-                proprioceptiveSensor->Write_To_Python(evalPeriod);
+                proprioceptiveSensor->Write_To_Python(evalPeriod,writer);
 }
 
 // ------------------- Private methods --------------------------
@@ -98,7 +98,7 @@ public:
     }
 	void Update_Sensor_Neurons(int t);
 
-	void Write_To_Python(int evalPeriod);
+	void Write_To_Python(int evalPeriod, SENSOR_WRITER *writer);
 
 private:
 	//void Create_Fixed_Joint_In_Simulator(dWorldID world, OBJECT *firstObject, OBJECT *secondObject);
@@ -2,6 +2,7 @@
 #define _LIGHT_SENSOR_CPP
 
 #include "iostream"
+#include "sensorWriter.h"
 #include "lightSensor.h"
 #include "neuron.h"
 
@@ -9,13 +10,14 @@ LIGHT_SENSOR::LIGHT_SENSOR(int myID, int evalPeriod) {
 
 	ID = myID;
 
-	values = new double[evalPeriod];
+	values = new double[evalPeriod]();
 
 	mySensorNeuron = NULL;
 }
 
 LIGHT_SENSOR::~LIGHT_SENSOR(void) {
 
+	delete [] values;
 }
 
 void LIGHT_SENSOR::Connect_To_Sensor_Neuron(NEURON *sensorNeuron) {
@@ -54,19 +56,9 @@ void LIGHT_SENSOR::Update_Sensor_Neurons(int t) {
 		mySensorNeuron->Set( values[t] );
 }
 
-void LIGHT_SENSOR::Write_To_Python(int evalPeriod) {
+void LIGHT_SENSOR::Write_To_Python(int evalPeriod, SENSOR_WRITER *writer) {
 
-        char outString[1000000];
-
-        sprintf(outString,"%d %d ",ID,1);
-
-        for ( int  t = 0 ; t < evalPeriod ; t++ )
-
-                sprintf(outString,"%s %f ",outString,values[t]);
-
-        sprintf(outString,"%s \n",outString);
-
-        std::cout << outString;
+        writer->Write_Sensor(ID,1,evalPeriod,&values);
 }
 
 #endif
@@ -5,6 +5,8 @@
 
 class NEURON;
 
+class SENSOR_WRITER;
+
 class LIGHT_SENSOR {
 
 private:
@@ -28,7 +30,7 @@ public:
 
 	void Update_Sensor_Neurons(int t);
 
-	void Write_To_Python(int evalPeriod);
+	void Write_To_Python(int evalPeriod, SENSOR_WRITER *writer);
 };
 
 #endif
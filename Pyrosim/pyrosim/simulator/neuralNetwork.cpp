@@ -20,10 +20,23 @@ NEURAL_NETWORK::NEURAL_NETWORK(void) {
 	Initialize_Neurons();
 
 	Initialize_Synapses();
+
+	frozen = false;
 }
 
 NEURAL_NETWORK::~NEURAL_NETWORK(void) {
 
+	for (int n = 0 ; n < numNeurons ; n++ )
+
+		delete neurons[n];
+
+	for (int s = 0 ; s < numSynapses ; s++ )
+
+		delete synapses[s];
+
+	delete [] neurons;
+
+	delete [] synapses;
 }
 
 void NEURAL_NETWORK::Add_Bias_Neuron(int ID) {
@@ -67,8 +80,154 @@ void NEURAL_NETWORK::Add_Synapse(void) {
     numSynapses ++; 
 }
 
+void NEURAL_NETWORK::Add_Synapse_Matrix(void) {
+
+    // dense blocks send every weight from a set of sources to a set of
+    // targets, sparse blocks send a (source, target, weight) triple per
+    // synapse. synapses are added in the order they are sent.
+    int isDense;
+    std::cin >> isDense;
+
+    if ( isDense ) {
+        int numTargets, numSources;
+        std::cin >> numTargets;
+        std::cin >> numSources;
+
+        int *targets = new int[numTargets];
+        int *sources = new int[numSources];
+        for (int t = 0 ; t < numTargets ; t++ )
+            std::cin >> targets[t];
+        for (int s = 0 ; s < numSources ; s++ )
+            std::cin >> sources[s];
+
+        double weight;
+        for (int t = 0 ; t < numTargets ; t++ )
+            for (int s = 0 ; s < numSources ; s++ ) {
+                std::cin >> weight;
+                synapses[numSynapses] = new SYNAPSE(sources[s], targets[t], weight);
+                numSynapses++;
+            }
+
+        delete [] targets;
+        delete [] sources;
+    }
+    else {
+        int numEntries;
+        std::cin >> numEntries;
+
+        int *sources = new int[numEntries];
+        int *targets = new int[numEntries];
+        for (int i = 0 ; i < numEntries ; i++ )
+            std::cin >> sources[i];
+        for (int i = 0 ; i < numEntries ; i++ )
+            std::cin >> targets[i];
+
+        double weight;
+        for (int i = 0 ; i < numEntries ; i++ ) {
+            std::cin >> weight;
+            synapses[numSynapses] = new SYNAPSE(sources[i], targets[i], weight);
+            numSynapses++;
+        }
+
+        delete [] sources;
+        delete [] targets;
+    }
+}
+
+void NEURAL_NETWORK::Freeze(void) {
+
+	// Copies the network into contiguous arrays once all of it has been read,
+	// so Update makes a single pass over them. Networks with developing
+	// synapses, whose weights change every time step, keep the old path.
+
+	for ( int s = 0 ; s < numSynapses ; s++ ) {
+
+		if ( synapses[s]->Is_Developing() )
+
+			return;
+
+		int sni = synapses[s]->Get_Source_Neuron_Index();
+
+		int tni = synapses[s]->Get_Target_Neuron_Index();
+
+		if ( sni < 0 || sni >= numNeurons || tni < 0 || tni >= numNeurons )
+
+			return;
+	}
+
+	types.resize(numNeurons);
+
+	values.resize(numNeurons);
+
+	previousValues.resize(numNeurons);
+
+	taus.resize(numNeurons);
+
+	alphas.resize(numNeurons);
+
+	functionValues.resize(numNeurons);
+
+	connectedNeurons.clear();
+
+	for ( int n = 0 ; n < numNeurons ; n++ ) {
+
+		types[n] = neurons[n]->Get_Type();
+
+		values[n] = neurons[n]->Get_Value();
+
+		previousValues[n] = neurons[n]->Get_Previous_Value();
+
+		taus[n] = neurons[n]->Get_Tau();
+
+		alphas[n] = neurons[n]->Get_Alpha();
+
+		functionValues[n] = neurons[n]->Get_Time_Values();
+
+		if ( types[n] == SENSOR_NEURON || types[n] == MOTOR_NEURON )
+
+			connectedNeurons.push_back(n);
+	}
+
+	// counting sort by target. It is stable, so each neuron still sums its
+	// inputs in the order the synapses were sent.
+
+	firstSynapses.assign(numNeurons + 1, 0);
+
+	for ( int s = 0 ; s < numSynapses ; s++ )
+
+		firstSynapses[ synapses[s]->Get_Target_Neuron_Index() + 1 ]++;
+
+	for ( int n = 0 ; n < numNeurons ; n++ )
+
+		firstSynapses[n + 1] += firstSynapses[n];
+
+	std::vector<int> nextSynapse(firstSynapses.begin(), firstSynapses.end() - 1);
+
+	sourceIndices.resize(numSynapses);
+
+	weights.resize(numSynapses);
+
+	for ( int s = 0 ; s < numSynapses ; s++ ) {
+
+		int k = nextSynapse[ synapses[s]->Get_Target_Neuron_Index() ]++;
+
+		sourceIndices[k] = synapses[s]->Get_Source_Neuron_Index();
+
+		weights[k] = synapses[s]->Get_Weight();
+	}
+
+	frozen = true;
+}
+
 void NEURAL_NETWORK::Update(int timeStep) {
 
+	if ( frozen ) {
+
+		Update_Frozen(timeStep);
+
+		return;
+	}
+
 	Push_Current_Values_To_Previous_Values();
 
 	Reset_Neuron_Values(timeStep);
@@ -142,4 +301,53 @@ void NEURAL_NETWORK::Update_Neurons(void) {
 
 }
 
+void NEURAL_NETWORK::Update_Frozen(int timeStep) {
+
+	// Same arithmetic, in the same order, as Push_Current_Values_To_Previous_Values,
+	// Reset_Neuron_Values, Update_Neurons and Threshold_Neurons.
+
+	// the sensors have set their neurons since the last update
+
+	for ( unsigned int i = 0 ; i < connectedNeurons.size() ; i++ )
+
+		values[ connectedNeurons[i] ] = neurons[ connectedNeurons[i] ]->Get_Value();
+
+	previousValues = values;
+
+	for ( int n = 0 ; n < numNeurons ; n++ ) {
+
+		int type = types[n];
+
+		double value;
+
+		if ( type == BIAS_NEURON )
+
+			value = 1.0;
+
+		else if ( type == FUNCTION_NEURON )
+
+			value = functionValues[n][timeStep];
+
+		else {
+			value = timeStep > 0 ? 0.0 : values[n];
+
+			for ( int k = firstSynapses[n] ; k < firstSynapses[n + 1] ; k++ )
+
+				value += weights[k] * previousValues[ sourceIndices[k] ];
+
+			if ( type != SENSOR_NEURON )
+
+				value = tanh( alphas[n] * previousValues[n] + taus[n] * value );
+		}
+
+		values[n] = value;
+	}
+
+	// the joints read their motor neurons
+
+	for ( unsigned int i = 0 ; i < connectedNeurons.size() ; i++ )
+
+		neurons[ connectedNeurons[i] ]->Set( values[ connectedNeurons[i] ] );
+}
+
 #endif
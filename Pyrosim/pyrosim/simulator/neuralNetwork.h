@@ -1,6 +1,8 @@
 #ifndef _NEURAL_NETWORK_H
 #define _NEURAL_NETWORK_H
 
+#include <vector>
+
 #include "neuron.h"
 
 #include "synapse.h"
@@ -16,6 +18,33 @@ private:
 
         int    numSynapses;
 
+	// Contiguous copy of the network made by Freeze. Synapses are stored in
+	// compressed sparse rows, grouped by target neuron.
+
+	bool   frozen;
+
+	std::vector<int>    types;
+
+	std::vector<double> values;
+
+	std::vector<double> previousValues;
+
+	std::vector<double> taus;
+
+	std::vector<double> alphas;
+
+	std::vector<double *> functionValues;
+
+	std::vector<int>    firstSynapses;
+
+	std::vector<int>    sourceIndices;
+
+	std::vector<double> weights;
+
+	// sensor and motor neurons, shared with the sensors and joints
+
+	std::vector<int>    connectedNeurons;
+
 public:
 	NEURAL_NETWORK(void);
 
@@ -33,6 +62,10 @@ public:
 
 	void   Add_Synapse(void);
 
+	void   Add_Synapse_Matrix(void);
+
+	void   Freeze(void);
+
 	void Update(int timeStep);
 
 private:
@@ -49,6 +82,8 @@ private:
 	void Update_Synapses(int timeStep);
 
 	void Update_Neurons(void);
+
+	void Update_Frozen(int timeStep);
 };
 
 #endif
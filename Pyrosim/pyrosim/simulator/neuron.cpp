@@ -42,6 +42,12 @@ NEURON::NEURON(int myID, double *tv){
 
 NEURON::~NEURON(void) {
 
+	delete [] timeValues;
+}
+
+double NEURON::Get_Alpha(void) {
+
+	return alpha;
 }
 
 int  NEURON::Get_ID(void) {
@@ -74,6 +80,11 @@ double NEURON::Get_Tau(void) {
 	return tau;
 }
 
+double *NEURON::Get_Time_Values(void) {
+
+	return timeValues;
+}
+
 double NEURON::Get_Value(void) {
 
 	return value;
@@ -147,7 +158,7 @@ void NEURON::Initialize(int myID, int neuronType, double t, double a, double las
     this->value = value;
 
 previousValue = lastValue;
-	//timeValues = NULL;
+	timeValues = NULL;
 
 }
 
@@ -4,6 +4,7 @@
 #include "constants.h"
 #include "object.h"
 #include "iostream"
+#include "sensorWriter.h"
 #include <drawstuff/drawstuff.h>
 #include "texturepath.h"
 
@@ -32,6 +33,13 @@ OBJECT::OBJECT(void) {
 
 OBJECT::~OBJECT(void) {
 
+	// ODE bodies and geoms are owned by the world and space
+	delete raySensor;
+	delete lightSensor;
+	delete positionSensor;
+	delete touchSensor;
+	delete vestibularSensor;
+	delete isSeenSensor;
 }
 
 void OBJECT::Add_External_Force(float x, float y, float z, int timeStep){
@@ -153,6 +161,15 @@ dBodyID OBJECT::Get_Body(void) {
 int OBJECT::Get_ID(void){
     return ID;
 }
+POSITION_SENSOR *OBJECT::Get_Position_Sensor(int sensorID) {
+
+	if ( positionSensor )
+		if ( positionSensor->Get_ID() == sensorID )
+			return positionSensor;
+
+	return NULL;
+}
+
 double OBJECT::Get_Green_Component(void) {
     return g;
 }
@@ -252,32 +269,32 @@ void OBJECT::Update_Sensor_Neurons(int t) {
         vestibularSensor->Update_Sensor_Neurons(t);
 }
 
-void OBJECT::Write_To_Python(int evalPeriod) {
+void OBJECT::Write_To_Python(int evalPeriod, SENSOR_WRITER *writer) {
     std::cerr << "writing sensors in body " << this->Get_ID() << " to python " << std::endl;
 	if ( raySensor ){
         std::cerr << "  writing ray sensor to python "  << std::endl;
-		raySensor->Write_To_Python(evalPeriod);
+		raySensor->Write_To_Python(evalPeriod,writer);
     }
 
 	if ( lightSensor ){
-		lightSensor->Write_To_Python(evalPeriod);
+		lightSensor->Write_To_Python(evalPeriod,writer);
         std::cerr << "  writing light sensor to python "  << std::endl;
     }
 	if ( positionSensor ){
         std::cerr << "  writing position sensor to python "  << std::endl;
-		positionSensor->Write_To_Python(evalPeriod);
+		positionSensor->Write_To_Python(evalPeriod,writer);
     }
 	if ( touchSensor ){
         std::cerr << "  writing touch sensor to python "  << std::endl;
-		touchSensor->Write_To_Python(evalPeriod);
+		touchSensor->Write_To_Python(evalPeriod,writer);
     }
     if ( vestibularSensor ){
         std::cerr << "  writing vestib sensor to python "  << std::endl;
-        vestibularSensor->Write_To_Python(evalPeriod);
+        vestibularSensor->Write_To_Python(evalPeriod,writer);
     }
     if ( isSeenSensor ){
         std::cerr << "  writing is seen sensor to python "  << std::endl;
-        isSeenSensor->Write_To_Python(evalPeriod);
+        isSeenSensor->Write_To_Python(evalPeriod,writer);
     }
 }
 
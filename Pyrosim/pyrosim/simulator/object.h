@@ -14,6 +14,8 @@
 
 class NEURON;
 
+class SENSOR_WRITER;
+
 class OBJECT {
 
 private:
@@ -83,6 +85,8 @@ public:
 	dBodyID Get_Body(void);
 	double Get_Green_Component(void);
 
+	POSITION_SENSOR *Get_Position_Sensor(int sensorID);
+
     int Get_Group(void);
     int Get_ID(void);
     
@@ -102,7 +106,7 @@ public:
 	void IsSeen_Sensor_Fires(int t);
 	void Update_Sensor_Neurons(int t);
 
-	void Write_To_Python(int evalPeriod);
+	void Write_To_Python(int evalPeriod, SENSOR_WRITER *writer);
 
 private:
 	int  Contains_A_Light_Source(void);
@@ -2,6 +2,8 @@
 #define _POSITION_SENSOR_CPP
 
 #include "iostream"
+#include <math.h>
+#include "sensorWriter.h"
 #include "positionSensor.h"
 #include "neuron.h"
 
@@ -9,11 +11,11 @@ POSITION_SENSOR::POSITION_SENSOR(int myID, int evalPeriod) {
 
 	ID = myID;
 
-	x = new double[evalPeriod];
+	x = new double[evalPeriod]();
 
-	y = new double[evalPeriod];
+	y = new double[evalPeriod]();
 
-	z = new double[evalPeriod];
+	z = new double[evalPeriod]();
 
 	for ( int i = 0 ; i < 3 ; i++)
 
@@ -22,6 +24,11 @@ POSITION_SENSOR::POSITION_SENSOR(int myID, int evalPeriod) {
 
 POSITION_SENSOR::~POSITION_SENSOR(void) {
 
+	delete [] x;
+
+	delete [] y;
+
+	delete [] z;
 }
 
 void POSITION_SENSOR::Connect_To_Sensor_Neuron(NEURON *sensorNeuron) {
@@ -34,6 +41,19 @@ int  POSITION_SENSOR::Get_ID(void) {
         return ID;
 }
 
+double POSITION_SENSOR::Get_Step_Displacement(int t, bool planar) {
+
+        // distance moved between time steps t-1 and t, in the xy plane or in 3d.
+
+        double dx = x[t] - x[t-1];
+
+        double dy = y[t] - y[t-1];
+
+        double dz = planar ? 0.0 : z[t] - z[t-1];
+
+        return sqrt(dx*dx + dy*dy + dz*dz);
+}
+
 void POSITION_SENSOR::Poll(dBodyID body, int t) {
 
         const dReal *pos;
@@ -63,20 +83,11 @@ void POSITION_SENSOR::Update_Sensor_Neurons(int t) {
                 mySensorNeurons[2]->Set( z[t] );
 }
 
-void POSITION_SENSOR::Write_To_Python(int evalPeriod) {
-
-        char outString[1000000];
-
-        sprintf(outString,"%d %d ",ID,3);
-
-        for ( int  t = 0 ; t < evalPeriod ; t++ ) {
-                sprintf(outString,"%s %f %f %f ",outString,x[t],y[t],z[t]);
-        }
+void POSITION_SENSOR::Write_To_Python(int evalPeriod, SENSOR_WRITER *writer) {
 
-        sprintf(outString,"%s \n",outString);
+        double *channels[3] = {x,y,z};
 
-        std::cout << outString;
-        
+        writer->Write_Sensor(ID,3,evalPeriod,channels);
 }
 
 #endif
@@ -5,6 +5,8 @@
 
 class NEURON;
 
+class SENSOR_WRITER;
+
 class POSITION_SENSOR {
 
 private:
@@ -24,11 +26,13 @@ public:
 
 	int  Get_ID(void);
 
+	double Get_Step_Displacement(int t, bool planar);
+
 	void Poll(dBodyID body, int t);
 
 	void Update_Sensor_Neurons(int t);
 
-	void Write_To_Python(int evalPeriod);
+	void Write_To_Python(int evalPeriod, SENSOR_WRITER *writer);
 };
 
 #endif
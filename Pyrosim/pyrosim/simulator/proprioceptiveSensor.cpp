@@ -2,6 +2,7 @@
 #define _PROPRIOCEPTIVE_SENSOR_CPP
 
 #include "iostream"
+#include "sensorWriter.h"
 
 #include "proprioceptiveSensor.h"
 
@@ -15,13 +16,14 @@ PROPRIOCEPTIVE_SENSOR::PROPRIOCEPTIVE_SENSOR(int myID, int evalPeriod) {
 
 	ID = myID;
 
-	angles = new double[evalPeriod];
+	angles = new double[evalPeriod]();
 
         mySensorNeuron = NULL;
 }
 
 PROPRIOCEPTIVE_SENSOR::~PROPRIOCEPTIVE_SENSOR(void) {
 
+	delete [] angles;
 }
 
 void PROPRIOCEPTIVE_SENSOR::Connect_To_Sensor_Neuron(NEURON *sensorNeuron) {
@@ -51,19 +53,9 @@ void PROPRIOCEPTIVE_SENSOR::Update_Sensor_Neurons(int t) {
                 mySensorNeuron->Set( angles[t] );
 }
 
-void PROPRIOCEPTIVE_SENSOR::Write_To_Python(int evalPeriod) {
+void PROPRIOCEPTIVE_SENSOR::Write_To_Python(int evalPeriod, SENSOR_WRITER *writer) {
 
-        char outString[1000000];
-
-        sprintf(outString,"%d %d ",ID,1);
-
-        for ( int  t = 0 ; t < evalPeriod ; t++ ) 
-
-                sprintf(outString,"%s %f ",outString,angles[t]);
-
-        sprintf(outString,"%s \n",outString);
-
-        std::cout << outString;
+        writer->Write_Sensor(ID,1,evalPeriod,&angles);
 }
 
 #endif
@@ -2,6 +2,7 @@
 #define _RAY_SENSOR_CPP
 
 #include "iostream"
+#include "sensorWriter.h"
 #include "raySensor.h"
 #include "object.h"
 #include <drawstuff/drawstuff.h>
@@ -44,6 +45,13 @@ RAY_SENSOR::RAY_SENSOR(dSpaceID space, OBJECT *myObj, int myID, int evalPeriod)
 
 RAY_SENSOR::~RAY_SENSOR(void) {
 
+	delete [] distances;
+
+	delete [] r;
+
+	delete [] g;
+
+	delete [] b;
 }
 
 void RAY_SENSOR::Add_To_Object(void) {
@@ -86,13 +94,13 @@ int  RAY_SENSOR::Get_ID(void) {
 
 void RAY_SENSOR::Initialize(int evalPeriod) {
 
-        distances = new double[evalPeriod];
+        distances = new double[evalPeriod]();
 
-        r = new double[evalPeriod];
+        r = new double[evalPeriod]();
 
-        g = new double[evalPeriod];
+        g = new double[evalPeriod]();
 
-        b = new double[evalPeriod];
+        b = new double[evalPeriod]();
 
         for (int t=0;t<evalPeriod;t++) {
 
@@ -147,19 +155,11 @@ void RAY_SENSOR::Update_Sensor_Neurons(int t) {
                 mySensorNeurons[3]->Set( b[t] );
 }
 
-void RAY_SENSOR::Write_To_Python(int evalPeriod) {
-
-	char outString[100000];
-
-	sprintf(outString,"%d %d ",ID,4);
+void RAY_SENSOR::Write_To_Python(int evalPeriod, SENSOR_WRITER *writer) {
 
-	for ( int  t = 0 ; t < evalPeriod ; t++ ){
-	   sprintf(outString,"%s %f %f %f %f ",outString,distances[t],r[t],g[t],b[t]);
-       
-    }
+	double *channels[4] = {distances,r,g,b};
 
-	sprintf(outString,"%s \n",outString);
-    std::cout << outString;
+	writer->Write_Sensor(ID,4,evalPeriod,channels);
 }
 
 #endif
@@ -7,6 +7,8 @@ class OBJECT;
 
 class NEURON;
 
+class SENSOR_WRITER;
+
 class RAY_SENSOR {
 
 private:
@@ -49,7 +51,7 @@ public:
 
         void Update_Sensor_Neurons(int t);
 
-	void Write_To_Python(int evalPeriod);
+	void Write_To_Python(int evalPeriod, SENSOR_WRITER *writer);
 };
 
 #endif
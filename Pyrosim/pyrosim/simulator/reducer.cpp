@@ -0,0 +1,100 @@
+#ifndef _REDUCER_CPP
+#define _REDUCER_CPP
+
+#include <math.h>
+#include "reducer.h"
+
+REDUCER::REDUCER(int mySensorID, int myKind, int mySvi) {
+
+	sensorID = mySensorID;
+
+	kind = myKind;
+
+	svi = mySvi;
+
+	value = 0.0;
+}
+
+REDUCER::~REDUCER(void) {
+
+}
+
+int    REDUCER::Get_Sensor_ID(void) {
+
+	return sensorID;
+}
+
+double REDUCER::Get_Value(void) {
+
+	return value;
+}
+
+void   REDUCER::Reduce(int numValues, int numSteps, double **values) {
+
+	// values[s][t] as handed to SENSOR_WRITER::Write_Sensor, for the numSteps simulated time steps.
+
+	value = 0.0;
+
+	int xy = (kind == REDUCE_PATH_LENGTH_XY) || (kind == REDUCE_MAX_STEP_XY);
+
+	if ( numSteps == 0 || svi >= numValues || (xy && numValues < 2) )
+
+		return;
+
+	if ( kind == REDUCE_FINAL ) {
+
+		value = Sample(values,svi,numSteps-1);
+
+		return;
+	}
+
+	for ( int t = 0 ; t < numSteps ; t++ ) {
+
+		if ( kind == REDUCE_MEAN ) {
+
+			value += Sample(values,svi,t) / numSteps;
+
+			continue;
+		}
+
+		if ( t == 0 )
+
+			continue;
+
+		double delta;
+
+		// differences are taken in float32, like numpy does on the sensor data
+
+		if ( xy ) {
+
+			float dx = float(Sample(values,0,t)) - float(Sample(values,0,t-1));
+
+			float dy = float(Sample(values,1,t)) - float(Sample(values,1,t-1));
+
+			float squared = dx*dx + dy*dy;
+
+			delta = sqrt(double(squared));
+		}
+		else
+			delta = fabs(float(Sample(values,svi,t)) - float(Sample(values,svi,t-1)));
+
+		if ( kind == REDUCE_SUM_ABS_DELTA || kind == REDUCE_PATH_LENGTH_XY )
+
+			value += delta;
+
+		else if ( delta > value )
+
+			value = delta;
+	}
+}
+
+// ----------------------- Private methods ---------------------------
+
+double REDUCER::Sample(double **values, int s, int t) {
+
+	// reduce the values python would have received, which are sent as float32
+
+	return double(float(values[s][t]));
+}
+
+#endif
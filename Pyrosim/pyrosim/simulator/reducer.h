@@ -0,0 +1,46 @@
+#ifndef _REDUCER_H
+#define _REDUCER_H
+
+// Kinds of reducers. The xy reducers combine the first two values of a
+// sensor (x and y of a position sensor), the others use a single value.
+
+const int REDUCE_FINAL = 0;
+
+const int REDUCE_MEAN = 1;
+
+const int REDUCE_SUM_ABS_DELTA = 2;
+
+const int REDUCE_MAX_ABS_DELTA = 3;
+
+const int REDUCE_PATH_LENGTH_XY = 4;
+
+const int REDUCE_MAX_STEP_XY = 5;
+
+class REDUCER {
+
+private:
+
+	int sensorID;
+
+	int kind;
+
+	int svi;
+
+	double value;
+
+public:
+	REDUCER(int mySensorID, int myKind, int mySvi);
+
+	~REDUCER(void);
+
+	int    Get_Sensor_ID(void);
+
+	double Get_Value(void);
+
+	void   Reduce(int numValues, int numSteps, double **values);
+
+private:
+	double Sample(double **values, int s, int t);
+};
+
+#endif
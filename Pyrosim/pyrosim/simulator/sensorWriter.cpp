@@ -0,0 +1,190 @@
+#ifndef _SENSOR_WRITER_CPP
+#define _SENSOR_WRITER_CPP
+
+#include "iostream"
+#include <algorithm>
+#include <stdarg.h>
+#include <stdio.h>
+#include <vector>
+#include "sensorWriter.h"
+
+SENSOR_WRITER::SENSOR_WRITER(int binaryOutput) {
+
+	binary = binaryOutput;
+
+	numSteps = -1;
+}
+
+SENSOR_WRITER::~SENSOR_WRITER(void) {
+
+}
+
+void SENSOR_WRITER::Add_Reducer(REDUCER *reducer) {
+
+	reducers.push_back(reducer);
+}
+
+void SENSOR_WRITER::Finish(void) {
+
+	if ( binary ) {
+
+		if ( reducers.size() > 0 ) {
+
+			std::vector<double> reduced(reducers.size());
+
+			for ( unsigned int r = 0 ; r < reducers.size() ; r++ )
+
+				reduced[r] = reducers[r]->Get_Value();
+
+			Write_Header(REDUCED, reduced.size(), 1, DTYPE_FLOAT64);
+
+			std::cout.write((const char *)reduced.data(), reduced.size() * sizeof(double));
+		}
+
+		Write_Header(END_OF_DATA, 0, 0, DTYPE_FLOAT32);
+	}
+	else {
+
+		if ( reducers.size() > 0 ) {
+
+			Append_Text("Reduced %d ", int(reducers.size()));
+
+			for ( unsigned int r = 0 ; r < reducers.size() ; r++ )
+
+				Append_Text("%.17g ", reducers[r]->Get_Value());
+
+			Append_Text("\n");
+		}
+
+		Append_Text("Done\n");
+
+		Flush_Text();
+	}
+
+	std::cout.flush();
+}
+
+void SENSOR_WRITER::Hide_Series(int ID) {
+
+	hiddenSensors.push_back(ID);
+}
+
+int  SENSOR_WRITER::Is_Binary(void) {
+
+	return binary;
+}
+
+void SENSOR_WRITER::Set_Num_Steps(int steps) {
+
+	numSteps = steps;
+}
+
+void SENSOR_WRITER::Write_Abort(int abortCode, int timeStep, int sensorID) {
+
+	if ( binary )
+
+		Write_Header(ABORTED, abortCode, timeStep, sensorID);
+	else
+		Append_Text("Abort %d %d %d \n", abortCode, timeStep, sensorID);
+}
+
+void SENSOR_WRITER::Write_Sensor(int ID, int numValues, int evalPeriod, double **values, int integers) {
+
+	// values[s][t] for the evalPeriod time steps. Sensors with integer values
+	// (touch, is seen) are printed as integers in text output.
+
+	// reducers only see the time steps that were simulated
+
+	int steps = (numSteps >= 0 && numSteps < evalPeriod) ? numSteps : evalPeriod;
+
+	for ( unsigned int r = 0 ; r < reducers.size() ; r++ )
+
+		if ( reducers[r]->Get_Sensor_ID() == ID )
+
+			reducers[r]->Reduce(numValues, steps, values);
+
+	if ( std::find(hiddenSensors.begin(), hiddenSensors.end(), ID) != hiddenSensors.end() )
+
+		return;
+
+	if ( !binary ) {
+
+		Write_Text_Sensor(ID, numValues, evalPeriod, values, integers);
+
+		return;
+	}
+
+	// values[s][t] is interleaved so that each time step is one contiguous block,
+	// matching the order of the text protocol.
+
+	std::vector<float> block(numValues * evalPeriod);
+
+	for ( int t = 0 ; t < evalPeriod ; t++ )
+
+		for ( int s = 0 ; s < numValues ; s++ )
+
+			block[t * numValues + s] = float(values[s][t]);
+
+	Write_Header(ID, numValues, evalPeriod, DTYPE_FLOAT32);
+
+	std::cout.write((const char *)block.data(), block.size() * sizeof(float));
+}
+
+// ----------------------- Private methods ---------------------------
+
+void SENSOR_WRITER::Append_Text(const char *format, ...) {
+
+	// large enough for any double printed with %f
+
+	char field[512];
+
+	va_list args;
+
+	va_start(args, format);
+
+	int length = vsnprintf(field, sizeof(field), format, args);
+
+	va_end(args);
+
+	text.append(field, std::min(length, int(sizeof(field)) - 1));
+
+	if ( int(text.size()) >= TEXT_CHUNK_SIZE )
+
+		Flush_Text();
+}
+
+void SENSOR_WRITER::Flush_Text(void) {
+
+	std::cout.write(text.data(), text.size());
+
+	text.clear();
+}
+
+void SENSOR_WRITER::Write_Header(int ID, int numValues, int evalPeriod, int dtype) {
+
+	int header[4] = {ID, numValues, evalPeriod, dtype};
+
+	std::cout.write((const char *)header, sizeof(header));
+}
+
+void SENSOR_WRITER::Write_Text_Sensor(int ID, int numValues, int evalPeriod, double **values, int integers) {
+
+	Append_Text("%d %d ", ID, numValues);
+
+	for ( int t = 0 ; t < evalPeriod ; t++ ) {
+
+		Append_Text(" ");
+
+		for ( int s = 0 ; s < numValues ; s++ )
+
+			if ( integers )
+
+				Append_Text("%d ", int(values[s][t]));
+			else
+				Append_Text("%f ", values[s][t]);
+	}
+
+	Append_Text(" \n");
+}
+
+#endif
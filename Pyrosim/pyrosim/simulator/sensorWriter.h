@@ -0,0 +1,78 @@
+#ifndef _SENSOR_WRITER_H
+#define _SENSOR_WRITER_H
+
+// Binary sensor records start with four little-endian int32s:
+// sensor ID, values per time step, number of time steps, dtype code.
+// The record with ID END_OF_DATA terminates the stream.
+// An evaluation stopped by an abort criterion starts with the record
+// ABORTED, abort code, time step, sensor ID and no values.
+// The values of all reducers come last, in the order they were sent, as a
+// single REDUCED record of float64s.
+//
+// Text output has one line per sensor: sensor ID, values per time step, and
+// the values of each time step in turn. It ends with an "Abort" line if the
+// evaluation was aborted, a "Reduced" line holding the number of reducers and
+// their values, and "Done".
+
+const int END_OF_DATA = -1;
+
+const int ABORTED = -2;
+
+const int REDUCED = -3;
+
+const int DTYPE_FLOAT32 = 0;
+
+const int DTYPE_FLOAT64 = 1;
+
+// Text output is buffered and written in chunks of this many bytes.
+
+const int TEXT_CHUNK_SIZE = 1 << 16;
+
+#include <string>
+#include <vector>
+#include "reducer.h"
+
+class SENSOR_WRITER {
+
+private:
+
+	int binary;
+
+	int numSteps;
+
+	std::vector<REDUCER *> reducers;
+
+	std::vector<int> hiddenSensors;
+
+	std::string text;
+
+public:
+	SENSOR_WRITER(int binaryOutput);
+
+	~SENSOR_WRITER(void);
+
+	void Add_Reducer(REDUCER *reducer);
+
+	void Finish(void);
+
+	void Hide_Series(int ID);
+
+	int  Is_Binary(void);
+
+	void Set_Num_Steps(int steps);
+
+	void Write_Abort(int abortCode, int timeStep, int sensorID);
+
+	void Write_Sensor(int ID, int numValues, int evalPeriod, double **values, int integers = 0);
+
+private:
+	void Append_Text(const char *format, ...);
+
+	void Flush_Text(void);
+
+	void Write_Header(int ID, int numValues, int evalPeriod, int dtype);
+
+	void Write_Text_Sensor(int ID, int numValues, int evalPeriod, double **values, int integers);
+};
+
+#endif
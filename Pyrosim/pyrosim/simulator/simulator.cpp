@@ -59,6 +59,10 @@ void Set_Distance_Sensor(dGeomID o);
 
 void Terminate(void);
 
+void Create_World(void);
+
+void Destroy_World(void);
+
 void Handle_Ray_Sensor(dGeomID o1, dGeomID o2) {
 
     if ( dGeomGetClass(o1) == dRayClass ) {
@@ -202,6 +206,8 @@ void Simulate_For_One_Time_Step(void) {
 
   environment->Poll_Sensors(timer);
 
+  environment->Check_Abort_Criteria(timer,data->dt);
+
   if (timer %data->quasiStaticRatio == 0) {
       environment->Actuate_Joints(true);
       environment->Update_Neural_Network(timer);
@@ -217,9 +223,6 @@ void Simulate_For_One_Time_Step(void) {
   dJointGroupEmpty(contactgroup);
 
   timer++;
-
-  if ( timer==data->evaluationTime )
-    Terminate();
 }
 
 static void simLoop (int pause)
@@ -244,6 +247,9 @@ static void simLoop (int pause)
       // accumulator -= data->dt;
       if ( !pause ){
           Simulate_For_One_Time_Step();
+
+          if ( timer==data->evaluationTime || environment->Is_Aborted() )
+            Terminate();
  
           if (data->followBody>=0)
           {
@@ -296,6 +302,11 @@ static void simLoop (int pause)
 void Initialize_ODE(void) {
 
     dInitODE2(0);
+    Create_World();
+}
+
+void Create_World(void) {
+
     world = dWorldCreate();
     space = dHashSpaceCreate (0);
     contactgroup = dJointGroupCreate (0);
@@ -306,6 +317,14 @@ void Initialize_ODE(void) {
     timer = 0;
 }
 
+void Destroy_World(void) {
+
+    // destroying the space also destroys every geom (ground, bodies, rays) in it
+    dJointGroupDestroy(contactgroup);
+    dSpaceDestroy(space);
+    dWorldDestroy(world);
+}
+
 void Initialize_Draw_Stuff(void){
     // setup pointers to drawstuff callback functions
     fn.version = DS_VERSION;
@@ -329,28 +348,87 @@ void Read_From_Python(void) {
 }
 
 void Terminate(void) {
-    environment->Write_Sensor_Data(data->evaluationTime);
+    environment->Write_Sensor_Data(data->evaluationTime, data->binaryOutput);
     delete data;
     exit(0);
 }
 
 void Run_Blind(void) {
 
-    while ( 1 )
+    while ( timer < data->evaluationTime && !environment->Is_Aborted() )
 
         Simulate_For_One_Time_Step();
+
+    Terminate();
+}
+
+void Reset_Simulation(void) {
+
+    delete environment;
+    Destroy_World();
+
+    // only the part of the collision matrix used by the last scene is dirty
+    for (int i=0;i<data->numCollisionGroups;i++)
+        for (int j=0;j<data->numCollisionGroups;j++)
+            data->collisionMatrix[i][j] = 0;
+    data->numCollisionGroups = 0;
+    data->binaryOutput = 0;
+    data->quasiStaticRatio = 1;
+
+    Create_World();
+    Initialize_Environment();
+}
+
+void Run_Server(void) {
+
+    // Evaluate scene after scene from python until stdin is closed,
+    // reusing the ODE initialisation and the Data block between scenes.
+    std::cin >> std::ws;
+
+    while ( !std::cin.eof() ) {
+
+        Read_From_Python();
+        dWorldSetGravity(world,0,0,data->gravity);
+
+        while ( timer < data->evaluationTime && !environment->Is_Aborted() )
+
+            Simulate_For_One_Time_Step();
+
+        environment->Write_Sensor_Data(data->evaluationTime, data->binaryOutput);
+
+        Reset_Simulation();
+
+        std::cin >> std::ws;
+    }
+
+    delete environment;
+    Destroy_World();
+    dCloseODE();
+    delete data;
 }
 
 int main (int argc, char **argv)
 {
     data->runBlind = false; 
+    int runServer = false;
 
     if ( (argc > 1) && (strcmp(argv[1],"-blind")==0) )
         data->runBlind = true;
 
+    for (int i=1;i<argc;i++)
+        if ( strcmp(argv[i],"-server")==0 ) {
+            runServer = true;
+            data->runBlind = true;
+        }
 
     Initialize_ODE();
     Initialize_Environment();
+
+    if ( runServer ) {
+        Run_Server();
+        return 0;
+    }
+
     Read_From_Python();
     dWorldSetGravity(world,0,0,data->gravity);
 
@@ -16,6 +16,16 @@ SYNAPSE::SYNAPSE(void) {
     //Read_From_Python();
 }
 
+SYNAPSE::SYNAPSE(int sourceNeuronIndex, int targetNeuronIndex, double weight) {
+    this->sourceNeuronIndex = sourceNeuronIndex;
+    this->targetNeuronIndex = targetNeuronIndex;
+    startWeight = weight;
+    endWeight = weight;
+    startTime = 0;
+    endTime = 0;
+    this->weight = weight;
+}
+
 SYNAPSE::~SYNAPSE(void) {
 
 }
@@ -45,6 +55,11 @@ double SYNAPSE::Get_Weight(void) {
         return weight; 
 }
 
+int SYNAPSE::Is_Developing(void) {
+
+	return (startWeight != endWeight) || (startTime != endTime);
+}
+
 void SYNAPSE::Print(void) {
 	std::cerr << sourceNeuronIndex << " ";
     std::cerr << targetNeuronIndex << " ";
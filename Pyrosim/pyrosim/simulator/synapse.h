@@ -16,6 +16,8 @@ private:
 public:
         SYNAPSE(void);
 
+        SYNAPSE(int sourceNeuronIndex, int targetNeuronIndex, double weight);
+
 	~SYNAPSE(void);
 	void Read_From_Python(void);
 
@@ -25,6 +27,8 @@ public:
 
 	double Get_Weight(void);
 
+	int  Is_Developing(void);
+
 	void Print(void);
 
 	void Update_Weight(int time);
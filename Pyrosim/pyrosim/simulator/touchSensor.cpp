@@ -2,6 +2,7 @@
 #define _TOUCH_SENSOR_CPP
 
 #include "iostream"
+#include "sensorWriter.h"
 #include "touchSensor.h"
 #include "neuron.h"
 
@@ -9,7 +10,7 @@ TOUCH_SENSOR::TOUCH_SENSOR(int myID, int evalPeriod) {
 
 	ID = myID;
 
-	values = new int[evalPeriod];
+	values = new double[evalPeriod]();
 
 	for (int t = 0 ; t < evalPeriod ; t++ )
 
@@ -20,6 +21,7 @@ TOUCH_SENSOR::TOUCH_SENSOR(int myID, int evalPeriod) {
 
 TOUCH_SENSOR::~TOUCH_SENSOR(void) {
 
+	delete [] values;
 }
 
 void TOUCH_SENSOR::Connect_To_Sensor_Neuron(NEURON *sensorNeuron) {
@@ -44,19 +46,9 @@ void TOUCH_SENSOR::Update_Sensor_Neurons(int t) {
                 mySensorNeuron->Set( values[t] );
 }
 
-void TOUCH_SENSOR::Write_To_Python(int evalPeriod) {
+void TOUCH_SENSOR::Write_To_Python(int evalPeriod, SENSOR_WRITER *writer) {
 
-        char outString[1000000];
-
-        sprintf(outString,"%d %d ",ID,1);
-
-        for ( int  t = 0 ; t < evalPeriod ; t++ )
-
-                sprintf(outString,"%s %d ",outString,values[t]);
-
-        sprintf(outString,"%s \n",outString);
-
-        std::cout << outString;
+        writer->Write_Sensor(ID,1,evalPeriod,&values,1);
 }
 
 #endif
@@ -5,12 +5,14 @@
 
 class NEURON;
 
+class SENSOR_WRITER;
+
 class TOUCH_SENSOR {
 
 private:
 
 	int    ID;
-	int *values;
+	double *values;
     NEURON *mySensorNeuron;
 
 public:
@@ -26,7 +28,7 @@ public:
 
         void Update_Sensor_Neurons(int t);
 
-	void Write_To_Python(int evalPeriod);
+	void Write_To_Python(int evalPeriod, SENSOR_WRITER *writer);
 };
 
 #endif
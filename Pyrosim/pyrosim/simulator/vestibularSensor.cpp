@@ -2,6 +2,7 @@
 #define _VESTIBULAR_SENSOR_CPP
 
 #include "iostream"
+#include "sensorWriter.h"
 #include "vestibularSensor.h"
 #include "neuron.h"
 
@@ -9,10 +10,10 @@ VESTIBULAR_SENSOR::VESTIBULAR_SENSOR(int myID, int evalPeriod) {
 
 	ID = myID;
 
-	w = new double[evalPeriod];
-	x = new double[evalPeriod];
-	y = new double[evalPeriod];
-	z = new double[evalPeriod];
+	w = new double[evalPeriod]();
+	x = new double[evalPeriod]();
+	y = new double[evalPeriod]();
+	z = new double[evalPeriod]();
 
 
 	for (int i = 0; i < 4; i++) {
@@ -22,6 +23,10 @@ VESTIBULAR_SENSOR::VESTIBULAR_SENSOR(int myID, int evalPeriod) {
 
 VESTIBULAR_SENSOR::~VESTIBULAR_SENSOR(void) {
 
+	delete [] w;
+	delete [] x;
+	delete [] y;
+	delete [] z;
 }
 
 void VESTIBULAR_SENSOR::Connect_To_Sensor_Neuron(NEURON *sensorNeuron) {
@@ -63,19 +68,11 @@ void VESTIBULAR_SENSOR::Update_Sensor_Neurons(int t) {
         mySensorNeurons[3]->Set( z[t] );
 }
 
-void VESTIBULAR_SENSOR::Write_To_Python(int evalPeriod) {
+void VESTIBULAR_SENSOR::Write_To_Python(int evalPeriod, SENSOR_WRITER *writer) {
 
-        char outString[1000000];
+        double *channels[4] = {w,x,y,z};
 
-        sprintf(outString,"%d %d ",ID,4);
-
-        for ( int  t = 0 ; t < evalPeriod ; t++ ) {
-            sprintf(outString,"%s %f %f %f %f ",outString,w[t], x[t], y[t], z[t]);
-        }
-
-        sprintf(outString,"%s \n",outString);
-
-        std::cout << outString;
+        writer->Write_Sensor(ID,4,evalPeriod,channels);
 }
 
 static void toEulerAngle(const dReal *q, double& roll, double& pitch, double& yaw)
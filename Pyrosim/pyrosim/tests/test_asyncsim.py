@@ -0,0 +1,34 @@
+import asyncio
+
+import pyrosim
+from pyrosim.asyncsim import run_simulations
+from pyrosim.server import SimulatorServer
+
+
+class Test_Asyncsim(object):
+
+    EVAL_TIME = 200
+
+    def send_scene(self, sim, x):
+        body = sim.send_box(x=x, y=0, z=0.5)
+        return sim.send_position_sensor(body)
+
+    def make_sims(self, server=None):
+        sims = [pyrosim.Simulator(play_blind=True, eval_time=self.EVAL_TIME,
+                                  server=server) for _ in range(4)]
+        sensors = [self.send_scene(sim, x) for x, sim in enumerate(sims)]
+        return sims, sensors
+
+    def test_shared_server(self):
+        expected, sensors = self.make_sims()
+        asyncio.run(run_simulations(expected))
+
+        with SimulatorServer() as server:
+            sims, _ = self.make_sims(server)
+            asyncio.run(run_simulations(sims))
+            assert server.num_evaluations == len(sims)
+
+        for i in range(len(sims)):
+            for svi in range(3):
+                assert (sims[i].get_sensor_data(sensors[i], svi) ==
+                        expected[i].get_sensor_data(sensors[i], svi)).all()
@@ -8,7 +8,6 @@ sys.path.insert(0, "..")
 from experiments.w2v_robot import W2VRobot
 
 # import the robot morphologies
-from experiments.w2v_vecs import *
 from experiments.quadruped import Quadruped
 from experiments.twig import Twig
 from experiments.spherebot import SphereBot
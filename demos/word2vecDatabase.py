@@ -7,12 +7,327 @@ from builtins import input
 
 import sqlite3 as lite
 import pickle
+import zlib
 
-class Word2VecVectorSpace(object):
+import numpy as np
+
+# sqlite limits the number of ? parameters in a statement (999 in older builds)
+MAX_QUERY_PARAMS = 900
+
+# storage formats of the vector blobs. databases without a Metadata table are FORMAT_PICKLE.
+FORMAT_PICKLE = 1  # ascii pickles of numpy arrays
+FORMAT_RAW = 2  # raw little endian bytes, dtype (float32 or float16) and dim stored in the Metadata table
+FORMAT_INT8 = 3  # float32 scale followed by dim int8 values, vector = scale * values
+FORMAT_VERSION = FORMAT_INT8
+
+
+def quantize_int8(matrix):
+    """
+    Quantizes each row of matrix to int8 with its own scale, so that row ~= scale * values.
+
+    :return: Tuple of the float32 scales and the int8 values
+    """
+    matrix = np.atleast_2d(np.asarray(matrix, dtype=np.float32))
+    scales = np.abs(matrix).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    values = np.clip(np.rint(matrix / scales[:, None]), -127, 127).astype(np.int8)
+    return scales.astype(np.float32), values
+
+
+def iterate_word2vec_binary(w2v_file, limit=None, word_filter=None, unicode_errors="strict", buffer_size=1 << 20):
+    """
+    Streams the vectors of a word2vec binary file (such as GoogleNews-vectors-negative300.bin) one word at a time.
+
+    The file is a "<vocab size> <dim>" header line followed by records of a word, a space, and dim little endian
+    float32 values. Only buffer_size bytes are held in memory at a time.
+    :param limit: Stop after this many words of the file (the first words are the most frequent ones)
+    :param word_filter: Function of a word returning False to skip it
+    :param unicode_errors: How undecodable words are handled, as in bytes.decode
+    :return: Generator of (word, float32 vector) tuples
+    """
+    with open(w2v_file, "rb") as w2v:
+        header = w2v.readline().split()
+        vocab_size, dim = int(header[0]), int(header[1])
+        vector_bytes = 4 * dim
+        if limit is not None:
+            vocab_size = min(vocab_size, limit)
+
+        buf = b""
+        pos = 0
+        for _ in range(vocab_size):
+            end = buf.find(b" ", pos)
+            while end < 0 or len(buf) - end - 1 < vector_bytes:
+                more = w2v.read(buffer_size)
+                if not more:
+                    raise EOFError("Unexpected end of %s" % w2v_file)
+                buf = buf[pos:] + more
+                pos = 0
+                end = buf.find(b" ")
+            # records may be separated by a newline
+            word = buf[pos:end].lstrip(b"\n").decode("utf-8", unicode_errors)
+            vec = np.frombuffer(buf, dtype="<f4", count=dim, offset=end + 1).copy()
+            pos = end + 1 + vector_bytes
+            if word_filter is None or word_filter(word):
+                yield word, vec
+
+
+def _int8_record(dim):
+    """
+    :return: The numpy dtype of one FORMAT_INT8 vector blob
+    """
+    return np.dtype([("scale", "<f4"), ("values", "i1", (dim,))])
+
+
+def quantization_report(reference, quantized, words=None, sample_size=10000, seed=0, print_report=True):
+    """
+    Measures how much a quantized vector space differs from a float32 reference.
+
+    :param reference: The float32 vector space
+    :param quantized: The quantized vector space holding the same words
+    :param words: Words to compare. A random sample of sample_size reference words if None.
+    :return: dict with the reconstruction error of the vectors (relative l2 error and max absolute error, which is
+    what prenatal development sees), the cosine similarity of each vector with its quantized version, and the drift
+    of the cosine similarity between random pairs of words.
+    """
+    if words is None:
+        start, stop = reference._row_range()
+        rng = np.random.RandomState(seed)
+        rows = rng.choice(np.arange(start, stop), min(sample_size, stop - start), replace=False)
+        words = reference._get_words(rows)
+
+    exact = reference.get_vectors(words).astype(np.float32)
+    approx = quantized.get_vectors(words).astype(np.float32)
+
+    exact_norms = np.linalg.norm(exact, axis=1)
+    approx_norms = np.linalg.norm(approx, axis=1)
+    safe_norms = np.where(exact_norms > 0, exact_norms, 1.0)
+    relative_error = np.linalg.norm(exact - approx, axis=1) / safe_norms
+    self_cosine = np.sum(exact * approx, axis=1) / (safe_norms * np.where(approx_norms > 0, approx_norms, 1.0))
+
+    pairs = np.random.RandomState(seed + 1).permutation(len(words))
+    exact_unit = exact * _compute_inverse_norms(exact)[:, None]
+    approx_unit = approx * _compute_inverse_norms(approx)[:, None]
+    drift = np.abs(np.sum(exact_unit * exact_unit[pairs], axis=1) - np.sum(approx_unit * approx_unit[pairs], axis=1))
+
+    report = {"num_words": len(words),
+              "mean_relative_error": float(np.mean(relative_error)),
+              "max_relative_error": float(np.max(relative_error)),
+              "max_absolute_error": float(np.max(np.abs(exact - approx))),
+              "min_self_cosine": float(np.min(self_cosine)),
+              "mean_cosine_drift": float(np.mean(drift)),
+              "max_cosine_drift": float(np.max(drift))}
+    if print_report:
+        for key in sorted(report):
+            print("%s: %s" % (key, report[key]))
+    return report
+
+
+def _top_k(scores, rows, k):
+    """
+    :return: The k highest scores and their rows, best first.
+    """
+    if len(scores) > k:
+        best = np.argpartition(-scores, k - 1)[:k]
+        scores, rows = scores[best], rows[best]
+    order = np.argsort(-scores, kind="stable")
+    return scores[order], rows[order]
+
+
+def _compute_inverse_norms(matrix):
+    """
+    :return: 1 / the norm of every row of matrix, 0 for zero rows.
+    """
+    norms = np.linalg.norm(matrix, axis=1)
+    with np.errstate(divide="ignore"):
+        return np.where(norms > 0, 1.0 / norms, 0.0).astype(np.float32)
+
+
+def _scan_rows(args):
+    """
+    Worker of most_similar(processes > 1). Opens its own handle on the vector space and scans one range of rows.
+    """
+    space_class, path, query, k, start, stop, chunk_size = args
+    space = space_class(path)
+    return space._scan(query, k, start, stop, chunk_size)
+
+
+class VectorSearchMixin(object):
+    """
+    Cosine nearest neighbour search shared by the vector space backends.
+
+    Backends provide _get_path, _row_range, _iterate_chunks, _get_rows and _get_words. Exact search is a chunked
+    brute force scan, so memory is bounded by chunk_size rows whatever the vocabulary size. Approximate search uses a
+    random hyperplane LSH index built once with build_lsh_index and saved beside the vector space.
+    """
+
+    def most_similar(self, vector_or_word, k=10, chunk_size=65536, processes=1, approximate=False, probes=1):
+        """
+        Finds the words whose vectors are closest to the given one by cosine similarity.
+
+        :param vector_or_word: A vector, or a word whose vector is used. The word itself is left out of the results.
+        :param k: Number of words to return
+        :param chunk_size: Number of vectors scored at once
+        :param processes: Number of processes splitting the exact scan
+        :param approximate: Only score the candidates returned by the LSH index
+        :param probes: Hamming radius (0 or 1) of the LSH buckets visited in each table
+        :return: List of (word, cosine similarity) tuples, most similar first
+        """
+        exclude = None
+        if isinstance(vector_or_word, str):
+            exclude = vector_or_word
+            vector = self.get_vector(vector_or_word)
+        else:
+            vector = vector_or_word
+        query = np.asarray(vector, dtype=np.float32).ravel()
+        norm = np.linalg.norm(query)
+        if norm > 0:
+            query = query / norm
+
+        num_results = k + 1 if exclude is not None else k
+        if approximate:
+            scores, rows = self._search_lsh(query, num_results, probes)
+        elif processes > 1:
+            start, stop = self._row_range()
+            bounds = np.linspace(start, stop, processes + 1).astype(np.int64)
+            jobs = [(type(self), self._get_path(), query, num_results, bounds[i], bounds[i + 1], chunk_size)
+                    for i in range(processes)]
+            import multiprocessing
+            pool = multiprocessing.Pool(processes)
+            try:
+                results = pool.map(_scan_rows, jobs)
+            finally:
+                pool.close()
+                pool.join()
+            scores, rows = _top_k(np.concatenate([r[0] for r in results]),
+                                  np.concatenate([r[1] for r in results]), num_results)
+        else:
+            start, stop = self._row_range()
+            scores, rows = self._scan(query, num_results, start, stop, chunk_size)
+
+        results = [(word, float(score)) for word, score in zip(self._get_words(rows), scores) if word != exclude]
+        return results[:k]
+
+    def build_lsh_index(self, num_tables=8, num_bits=16, seed=0, chunk_size=65536):
+        """
+        Builds the random hyperplane LSH index used by most_similar(approximate=True) and saves it beside the
+        vector space. Each of the num_tables tables buckets vectors by the signs of num_bits random projections.
+        """
+        assert num_bits <= 32, "Codes are stored as uint32"
+        planes = None
+        all_rows = []
+        all_codes = []
+        weights = (1 << np.arange(num_bits, dtype=np.uint64)).astype(np.uint32)
+        for rows, matrix in self._iterate_chunks(*self._row_range(), chunk_size=chunk_size):
+            if planes is None:
+                planes = np.random.RandomState(seed).normal(size=(num_tables, num_bits, matrix.shape[1]))
+                planes = planes.astype(np.float32)
+            bits = np.einsum("tbd,nd->tnb", planes, matrix) > 0
+            all_codes.append(np.dot(bits, weights).astype(np.uint32))
+            all_rows.append(rows)
+
+        if planes is None:
+            raise ValueError("Cannot index an empty vector space")
+        rows = np.concatenate(all_rows)
+        codes = np.concatenate(all_codes, axis=1)
+        order = np.argsort(codes, axis=1, kind="stable")
+        sorted_codes = np.take_along_axis(codes, order, axis=1)
+        np.savez(self._get_path() + ".lsh.npz", planes=planes, rows=rows, order=order.astype(np.int64),
+                 sorted_codes=sorted_codes)
+        self._lsh = None
+
+    def _load_lsh(self):
+        if getattr(self, "_lsh", None) is None:
+            path = self._get_path() + ".lsh.npz"
+            if not os.path.exists(path):
+                raise IOError("No LSH index at %s, run build_lsh_index first" % path)
+            with np.load(path) as lsh:
+                self._lsh = dict((name, lsh[name]) for name in lsh.files)
+        return self._lsh
+
+    def _search_lsh(self, query, k, probes):
+        lsh = self._load_lsh()
+        planes, sorted_codes = lsh["planes"], lsh["sorted_codes"]
+        num_tables, num_bits = planes.shape[0], planes.shape[1]
+        weights = (1 << np.arange(num_bits, dtype=np.uint64)).astype(np.uint32)
+        codes = np.dot(np.dot(planes, query) > 0, weights).astype(np.uint32)
+
+        candidates = []
+        for t in range(num_tables):
+            probe_codes = [codes[t]]
+            if probes >= 1:
+                probe_codes += [codes[t] ^ weights[b] for b in range(num_bits)]
+            for code in probe_codes:
+                lo = np.searchsorted(sorted_codes[t], code, side="left")
+                hi = np.searchsorted(sorted_codes[t], code, side="right")
+                candidates.append(lsh["order"][t, lo:hi])
+        candidates = np.unique(np.concatenate(candidates))
+        if len(candidates) == 0:
+            return np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.int64)
+
+        rows = lsh["rows"][candidates]
+        matrix = self._get_rows(rows)
+        return _top_k(self._score(matrix, query), rows, k)
+
+    def _scan(self, query, k, start, stop, chunk_size):
+        best_scores = np.zeros(0, dtype=np.float32)
+        best_rows = np.zeros(0, dtype=np.int64)
+        for rows, matrix in self._iterate_chunks(start, stop, chunk_size):
+            best_scores, best_rows = _top_k(np.concatenate((best_scores, self._score(matrix, query, rows))),
+                                            np.concatenate((best_rows, rows)), k)
+        return best_scores, best_rows
+
+    def _score(self, matrix, query, rows=None):
+        """
+        Cosine similarity of every row of matrix with the unit query vector.
+        """
+        return np.dot(matrix, query) * self._inverse_norms(matrix, rows)
+
+    def _inverse_norms(self, matrix, rows=None):
+        return _compute_inverse_norms(matrix)
+
+
+class Word2VecVectorSpace(VectorSearchMixin):
     def __init__(self, database_file):
         self.database_file = database_file
         self.con = lite.connect(database_file)
         self.cur = self.con.cursor()
+        self.read_metadata()
+        self.ensure_index()
+
+    def read_metadata(self):
+        """
+        Loads the storage format of the database: format_version, and for raw blobs their dtype and dim.
+        """
+        self.format_version = FORMAT_PICKLE
+        self.dtype = None
+        self.dim = None
+
+        self.cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='Metadata'")
+        if self.cur.fetchone() is None:
+            return
+        self.cur.execute("SELECT key, value FROM Metadata")
+        metadata = dict(self.cur.fetchall())
+        self.format_version = int(metadata["format_version"])
+        if self.format_version in (FORMAT_RAW, FORMAT_INT8):
+            self.dtype = np.dtype(metadata["dtype"])
+            self.dim = int(metadata["dim"])
+
+    def ensure_index(self):
+        """
+        Makes sure lookups by name use an index. Databases built before names were indexed get one on first open.
+        """
+        self.cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='Vectors'")
+        if self.cur.fetchone() is None:
+            return
+        self.cur.execute("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='Vectors'")
+        if self.cur.fetchone() is not None:
+            return
+        try:
+            self.cur.execute("CREATE INDEX IF NOT EXISTS Vectors_name ON Vectors(name)")
+            self.con.commit()
+        except lite.OperationalError as e:
+            # read only database, fall back to full scans
+            print("Could not index %s: %s" % (self.database_file, e))
 
     def get_vector(self, word):
         """
@@ -30,37 +345,418 @@ class Word2VecVectorSpace(object):
         if raw_vector is None:
             raise KeyError("Vector not found")
         else:
-            vector = pickle.loads(raw_vector[1])
+            vector = self._decode(raw_vector[1])
         return vector
 
-    def build_database(self, w2v_file, print_progress=False):
-        from gensim.models import KeyedVectors
-        def add_vector(name, vec):
-            self.cur.execute("insert into Vectors values (?,?)", (name, pickle.dumps(vec, protocol=0)))
-            self.con.commit()
+    def get_vectors(self, words):
+        """
+        Searches for the vectors of many strings at once
+
+        :param words: Iterable of strings to locate vectors for
+        :return: 2d numpy array with one row per word, in the order of words.
+        If any word has no corresponding vector, raises a KeyError Exception listing them
+        ;rtype: numpy.ndarray
+        """
+        words = list(words)
+        unique_words = list(set(words))
+        found = {}
+        for start in range(0, len(unique_words), MAX_QUERY_PARAMS):
+            chunk = unique_words[start:start + MAX_QUERY_PARAMS]
+            string = "SELECT name, vector FROM Vectors WHERE name IN (%s)" % ",".join("?" * len(chunk))
+            self.cur.execute(string, chunk)
+            for name, raw_vector in self.cur.fetchall():
+                found[name] = self._decode(raw_vector)
+
+        missing = [word for word in unique_words if word not in found]
+        if missing:
+            raise KeyError("Vectors not found: %s" % ", ".join(sorted(missing)))
+        if not words:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.stack([found[word] for word in words])
+
+    def build_database(self, w2v_file, print_progress=False, batch_size=10000, dtype=np.float32, limit=None,
+                       word_filter=None):
+        """
+        Builds the database from a word2vec binary file, streaming it so memory is bounded by batch_size.
+
+        :param w2v_file: word2vec binary file, such as GoogleNews-vectors-negative300.bin
+        :param limit: Only load the first limit words of the file
+        :param word_filter: Function of a word returning False to leave it out
+        :return: The number of rows loaded
+        """
+        rows = iterate_word2vec_binary(w2v_file, limit=limit, word_filter=word_filter)
+        return self.bulk_load(rows, print_progress=print_progress, batch_size=batch_size, dtype=dtype)
 
-        def reset_database():
+    def iterate_vectors(self):
+        """
+        :return: Generator of every (name, vector) pair in the database, in storage order.
+        """
+        cur = self.con.cursor()
+        cur.execute("SELECT name, vector FROM Vectors")
+        for name, raw_vector in cur:
+            yield name, self._decode(raw_vector)
+
+    @staticmethod
+    def migrate(old_database_file, new_database_file, print_progress=False, dtype=np.float32):
+        """
+        Converts a database of any older format into a new database of the current format.
+
+        :param old_database_file: Existing database, left untouched
+        :param new_database_file: Database to create
+        :param dtype: Storage dtype of the new database, see bulk_load
+        :return: The new Word2VecVectorSpace
+        """
+        old = Word2VecVectorSpace(old_database_file)
+        new = Word2VecVectorSpace(new_database_file)
+        new.bulk_load(old.iterate_vectors(), print_progress=print_progress, dtype=dtype)
+        old.con.close()
+        return new
+
+    def bulk_load(self, rows, print_progress=False, batch_size=10000, dtype=np.float32):
+        """
+        Replaces the contents of the database with the given vectors in a single transaction.
+
+        The rollback journal is kept in memory and syncing is turned off for the duration of the load, since a build
+        interrupted by a crash is simply rerun. The name index is only created once all rows are in.
+        :param rows: Iterable of (name, vector) tuples. All vectors must have the same length.
+        :param print_progress: Print the number of rows loaded and the load rate after every batch
+        :param batch_size: Number of rows handed to each executemany call
+        :param dtype: The dtype the vectors are stored as: float32, float16, or int8 with a scale per vector.
+        Quantized vectors are converted back to float32 when read.
+        :return: The number of rows loaded
+        """
+        dtype = np.dtype(dtype).newbyteorder("<")
+        assert dtype in (np.float32, np.float16, np.int8), "Unsupported storage dtype %s" % dtype
+        dim = None
+        self.cur.execute("PRAGMA journal_mode=MEMORY")
+        self.cur.execute("PRAGMA synchronous=OFF")
+        self.cur.execute("PRAGMA temp_store=MEMORY")
+        self.cur.execute("PRAGMA cache_size=-262144")  # 256 MB, used by the index build
+
+        numb = 0
+        start_time = time.time()
+        try:
+            self.cur.execute("BEGIN")
             self.cur.execute("drop table if exists Vectors")
             self.cur.execute("create table Vectors(name TEXT, vector BLOB)")
 
-        reset_database()
-        word_vectors = KeyedVectors.load_word2vec_format(w2v_file, binary=True)
-        numb = 0
-        if print_progress: print(len(word_vectors.vocab))
-        for key in word_vectors.vocab:
-            if numb % 100 == 0 and print_progress:
-                print(numb, "\t\t", sep="", end="")
-                sys.stdout.flush()
-            numb += 1
-            metadata = word_vectors.vocab[key]
-            vec = word_vectors.vectors[metadata.index]
-            add_vector(key, vec)
+            batch = []
+            for name, vec in rows:
+                vec = np.ravel(vec)
+                if dim is None:
+                    dim = len(vec)
+                assert len(vec) == dim, "Vector of %s has %d values, expected %d" % (name, len(vec), dim)
+                if dtype == np.int8:
+                    scale, values = quantize_int8(vec)
+                    batch.append((name, scale.tobytes() + values.tobytes()))
+                else:
+                    batch.append((name, np.ascontiguousarray(vec, dtype=dtype).tobytes()))
+                if len(batch) == batch_size:
+                    self.cur.executemany("insert into Vectors values (?,?)", batch)
+                    numb += len(batch)
+                    batch = []
+                    if print_progress:
+                        self._print_load_progress(numb, start_time)
+            if batch:
+                self.cur.executemany("insert into Vectors values (?,?)", batch)
+                numb += len(batch)
+
+            if print_progress:
+                self._print_load_progress(numb, start_time)
+                print("Indexing...")
+            self.cur.execute("CREATE INDEX Vectors_name ON Vectors(name)")
+
+            self.cur.execute("drop table if exists Metadata")
+            self.cur.execute("create table Metadata(key TEXT PRIMARY KEY, value TEXT)")
+            self.cur.executemany("insert into Metadata values (?,?)",
+                                 [("format_version", str(FORMAT_INT8 if dtype == np.int8 else FORMAT_RAW)),
+                                  ("dtype", dtype.str), ("dim", str(dim or 0))])
+            self.con.commit()
+        except:
+            self.con.rollback()
+            raise
+        finally:
+            self.cur.execute("PRAGMA synchronous=FULL")
+            self.cur.execute("PRAGMA journal_mode=DELETE")
+
+        if print_progress:
+            print("Loaded %d rows in %.1f s" % (numb, time.time() - start_time))
+        self.read_metadata()
+        return numb
+
+    def _get_path(self):
+        return self.database_file
+
+    def _row_range(self):
+        self.cur.execute("SELECT min(rowid), max(rowid) FROM Vectors")
+        first, last = self.cur.fetchone()
+        if first is None:
+            return 0, 0
+        return first, last + 1
+
+    def _iterate_chunks(self, start, stop, chunk_size):
+        cur = self.con.cursor()
+        while start < stop:
+            cur.execute("SELECT rowid, vector FROM Vectors WHERE rowid >= ? AND rowid < ? ORDER BY rowid LIMIT ?",
+                        (int(start), int(stop), chunk_size))
+            fetched = cur.fetchall()
+            if not fetched:
+                break
+            rows = np.array([row for row, _ in fetched], dtype=np.int64)
+            yield rows, self._decode_many([raw_vector for _, raw_vector in fetched])
+            start = rows[-1] + 1
+
+    def _select_by_rowid(self, column, rows):
+        found = {}
+        rows = [int(row) for row in rows]
+        for start in range(0, len(rows), MAX_QUERY_PARAMS):
+            chunk = rows[start:start + MAX_QUERY_PARAMS]
+            self.cur.execute("SELECT rowid, %s FROM Vectors WHERE rowid IN (%s)" % (column, ",".join("?" * len(chunk))),
+                             chunk)
+            found.update(self.cur.fetchall())
+        return [found[row] for row in rows]
+
+    def _get_words(self, rows):
+        return self._select_by_rowid("name", rows)
+
+    def _get_rows(self, rows):
+        return self._decode_many(self._select_by_rowid("vector", rows))
+
+    def _decode_many(self, raw_vectors):
+        """
+        Decodes a list of vector blobs into a float32 matrix.
+        """
+        if self.format_version == FORMAT_RAW:
+            matrix = np.frombuffer(b"".join(raw_vectors), dtype=self.dtype).reshape(len(raw_vectors), self.dim)
+        elif self.format_version == FORMAT_INT8:
+            records = np.frombuffer(b"".join(raw_vectors), dtype=_int8_record(self.dim))
+            matrix = records["values"].astype(np.float32) * records["scale"][:, None]
+        else:
+            matrix = np.array([pickle.loads(raw_vector) for raw_vector in raw_vectors])
+        return matrix.astype(np.float32, copy=False)
+
+    def _decode(self, raw_vector):
+        """
+        Decodes a vector blob. Raw float32 blobs are decoded without copying, so the returned array is read only.
+        Quantized blobs are converted back to float32.
+        """
+        if self.format_version == FORMAT_RAW:
+            vector = np.frombuffer(raw_vector, dtype=self.dtype, count=self.dim)
+            return vector.astype(np.float32, copy=False)
+        if self.format_version == FORMAT_INT8:
+            record = np.frombuffer(raw_vector, dtype=_int8_record(self.dim), count=1)[0]
+            return record["values"].astype(np.float32) * record["scale"]
+        return pickle.loads(raw_vector)
+
+    @staticmethod
+    def _print_load_progress(numb, start_time):
+        elapsed = max(time.time() - start_time, 1e-9)
+        print("%d rows, %.0f rows/s" % (numb, numb / elapsed))
+        sys.stdout.flush()
+
+class Word2VecMemmapVectorSpace(VectorSearchMixin):
+    """
+    Read only vector space backed by memory mapped files instead of SQLite.
+
+    A space stored at base_path is made of:
+        base_path.vectors.npy   the (num words, dim) vector matrix
+        base_path.vocab         the utf-8 words, one per line, in row order
+        base_path.offsets.npy   byte offset of each word in the vocab file (num words + 1 entries)
+        base_path.index.npy     open addressing hash table (crc32, linear probing) mapping words to rows, -1 if empty
+        base_path.norms.npy     1 / the norm of each vector, used by most_similar
+        base_path.scales.npy    only for int8 vectors, the scale of each row (vector = scale * row)
+    The matrix can be float32, float16 or int8. Quantized vectors are converted back to float32 when read.
+    Every file is opened with mmap, so processes on the same node share a single copy through the page cache.
+    Build one from an existing database with from_database.
+    """
+    def __init__(self, base_path):
+        self.base_path = base_path
+        self.vectors = np.load(base_path + ".vectors.npy", mmap_mode="r")
+        self.vocab = np.memmap(base_path + ".vocab", dtype=np.uint8, mode="r")
+        self.offsets = np.load(base_path + ".offsets.npy", mmap_mode="r")
+        self.index = np.load(base_path + ".index.npy", mmap_mode="r")
+        self._mask = len(self.index) - 1
+
+        self.scales = None
+        if os.path.exists(base_path + ".scales.npy"):
+            self.scales = np.load(base_path + ".scales.npy", mmap_mode="r")
+
+        # written by from_database. spaces exported before norms were saved compute them while searching.
+        self.inverse_norms = None
+        if os.path.exists(base_path + ".norms.npy"):
+            self.inverse_norms = np.load(base_path + ".norms.npy", mmap_mode="r")
+
+    def __len__(self):
+        return len(self.vectors)
+
+    def __contains__(self, word):
+        return self.get_row(word) >= 0
+
+    def get_row(self, word):
+        """
+        :return: The row of the given word in the vector matrix, or -1 if it is not in the vocabulary.
+        """
+        key = word.encode("utf-8")
+        slot = zlib.crc32(key) & self._mask
+        while True:
+            row = int(self.index[slot])
+            if row < 0:
+                return -1
+            if self.vocab[self.offsets[row]:self.offsets[row + 1] - 1].tobytes() == key:
+                return row
+            slot = (slot + 1) & self._mask
+
+    def get_word(self, row):
+        return self.vocab[self.offsets[row]:self.offsets[row + 1] - 1].tobytes().decode("utf-8")
+
+    def get_vector(self, word):
+        """
+        Searches for the vector representing the given string
+
+        :param word: String to locate vector for
+        :return: Numpy array of the vector corresponding to the word. The array is a read only view of the mapped
+        matrix. If no corresponding vector is found, rasies a KeyError Exception
+        ;rtype: numpy.ndarray
+        """
+        row = self.get_row(word)
+        if row < 0:
+            raise KeyError("Vector not found")
+        return self._dequantize(self.vectors[row], row)
+
+    def get_vectors(self, words):
+        """
+        Searches for the vectors of many strings at once
+
+        :param words: Iterable of strings to locate vectors for
+        :return: 2d numpy array with one row per word, in the order of words.
+        If any word has no corresponding vector, raises a KeyError Exception listing them
+        ;rtype: numpy.ndarray
+        """
+        words = list(words)
+        rows = np.array([self.get_row(word) for word in words], dtype=np.int64)
+        if np.any(rows < 0):
+            missing = sorted(set(word for word, row in zip(words, rows) if row < 0))
+            raise KeyError("Vectors not found: %s" % ", ".join(missing))
+        return self._dequantize(self.vectors[rows], rows)
+
+    def _dequantize(self, values, rows):
+        """
+        Converts rows of the stored matrix to float32. float32 rows are returned without copying.
+        """
+        if self.scales is None:
+            return np.asarray(values, dtype=np.float32)
+        scales = np.asarray(self.scales[rows], dtype=np.float32)
+        return values.astype(np.float32) * (scales[..., None] if scales.ndim else scales)
+
+    def _get_path(self):
+        return self.base_path
+
+    def _row_range(self):
+        return 0, len(self.vectors)
+
+    def _iterate_chunks(self, start, stop, chunk_size):
+        for chunk_start in range(int(start), int(stop), chunk_size):
+            chunk_stop = min(chunk_start + chunk_size, int(stop))
+            rows = np.arange(chunk_start, chunk_stop, dtype=np.int64)
+            yield rows, self._dequantize(self.vectors[chunk_start:chunk_stop], rows)
+
+    def _get_words(self, rows):
+        return [self.get_word(row) for row in rows]
+
+    def _get_rows(self, rows):
+        return self._dequantize(self.vectors[rows], rows)
+
+    def _inverse_norms(self, matrix, rows=None):
+        if self.inverse_norms is None or rows is None:
+            return _compute_inverse_norms(matrix)
+        return np.asarray(self.inverse_norms[rows])
+
+    @staticmethod
+    def from_database(database, base_path, print_progress=False, dtype=np.float32):
+        """
+        Writes the memory mapped files for every vector of a Word2VecVectorSpace.
+
+        :param database: The Word2VecVectorSpace to export, of any storage format
+        :param base_path: Prefix of the files to write
+        :param dtype: The dtype of the vector matrix: float32, float16, or int8 with a scale per vector
+        :return: The new Word2VecMemmapVectorSpace
+        """
+        dtype = np.dtype(dtype)
+        assert dtype in (np.float32, np.float16, np.int8), "Unsupported storage dtype %s" % dtype
+        database.cur.execute("SELECT count(*) FROM Vectors")
+        num_words = database.cur.fetchone()[0]
+
+        vectors = None
+        scales = np.ones(num_words, dtype=np.float32)
+        offsets = np.zeros(num_words + 1, dtype=np.int64)
+        start_time = time.time()
+        with open(base_path + ".vocab", "wb") as vocab_file:
+            for row, (name, vec) in enumerate(database.iterate_vectors()):
+                if vectors is None:
+                    vectors = np.lib.format.open_memmap(base_path + ".vectors.npy", mode="w+",
+                                                        dtype=dtype, shape=(num_words, len(vec)))
+                if dtype == np.int8:
+                    scale, vec = quantize_int8(vec)
+                    scales[row] = scale[0]
+                vectors[row] = vec
+                key = name.encode("utf-8") + b"\n"
+                vocab_file.write(key)
+                offsets[row + 1] = offsets[row] + len(key)
+                if print_progress and (row + 1) % 100000 == 0:
+                    database._print_load_progress(row + 1, start_time)
+        if vectors is None:
+            vectors = np.lib.format.open_memmap(base_path + ".vectors.npy", mode="w+", dtype=dtype, shape=(0, 0))
+        vectors.flush()
+        np.save(base_path + ".offsets.npy", offsets)
+        if dtype == np.int8:
+            np.save(base_path + ".scales.npy", scales)
+        elif os.path.exists(base_path + ".scales.npy"):
+            os.remove(base_path + ".scales.npy")
+
+        # pre-computed so similarity searches only need one pass over the vectors
+        inverse_norms = np.zeros(num_words, dtype=np.float32)
+        for start in range(0, num_words, 65536):
+            chunk = np.asarray(vectors[start:start + 65536], dtype=np.float32)
+            if dtype == np.int8:
+                chunk *= scales[start:start + len(chunk), None]
+            inverse_norms[start:start + len(chunk)] = _compute_inverse_norms(chunk)
+        np.save(base_path + ".norms.npy", inverse_norms)
+        del vectors
+
+        # at most half full, so probe sequences stay short
+        size = 1
+        while size < 2 * max(num_words, 1):
+            size *= 2
+        index = np.full(size, -1, dtype=np.int32 if num_words < 2 ** 31 else np.int64)
+        mask = size - 1
+        with open(base_path + ".vocab", "rb") as vocab_file:
+            for row, key in enumerate(vocab_file):
+                slot = zlib.crc32(key[:-1]) & mask
+                while index[slot] >= 0:
+                    slot = (slot + 1) & mask
+                index[slot] = row
+        np.save(base_path + ".index.npy", index)
+
+        if print_progress:
+            print("Exported %d vectors in %.1f s" % (num_words, time.time() - start_time))
+        return Word2VecMemmapVectorSpace(base_path)
+
 
 if __name__ == "__main__":
     from scipy import spatial
 
+    if len(sys.argv) in (4, 5) and sys.argv[1] == "migrate":
+        # python word2vecDatabase.py migrate <old.db> <new.db> [float32|float16|int8]
+        storage = sys.argv[4] if len(sys.argv) == 5 else "float32"
+        Word2VecVectorSpace.migrate(sys.argv[2], sys.argv[3], print_progress=True, dtype=storage)
+        exit(0)
+    if len(sys.argv) == 4 and sys.argv[1] == "report":
+        # python word2vecDatabase.py report <float32.db> <quantized.db>
+        quantization_report(Word2VecVectorSpace(sys.argv[2]), Word2VecVectorSpace(sys.argv[3]))
+        exit(0)
+
     db = Word2VecVectorSpace(database_file='w2vVectorSpace-google.db')
-    cmd = input("Please type a command: EXIT, FIND, COMPARE: ")
+    cmd = input("Please type a command: EXIT, FIND, COMPARE, SIMILAR: ")
     while cmd.rstrip() != "EXIT":
         if cmd == "FIND" or cmd == "F":
             word = input("Please type a word to look for: ")
@@ -106,6 +802,15 @@ if __name__ == "__main__":
                         print("Vector Not Found")
                     else:
                         print("Cos similarity is: ", 1 - spatial.distance.cosine(v1+v2, v3))
+        elif cmd == "SIMILAR" or cmd == "S":
+            w1 = input("Please type a word: ")
+            try:
+                similar = db.most_similar(w1, k=10)
+            except KeyError:
+                print("Vector Not Found")
+            else:
+                for word, similarity in similar:
+                    print("%s\t%.4f" % (word, similarity))
         elif cmd == "PRINT" or cmd == "P":
             w1 = input("Please type a word: ")
             try:
@@ -116,5 +821,5 @@ if __name__ == "__main__":
             else:
                 print(list(v1))
 
-        cmd = input("Please type a command: EXIT, FIND, COMPARE: ")
+        cmd = input("Please type a command: EXIT, FIND, COMPARE, SIMILAR: ")
 
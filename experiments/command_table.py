@@ -0,0 +1,157 @@
+import os
+import sys
+
+import numpy
+
+from experiments.prenatal import digest_array
+
+# the command words used by job.py, extracted from the google news vectors.
+DEFAULT_COMMAND_TABLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "w2v_vecs.npz")
+
+
+def save_command_table(path, vectors):
+    """
+    Writes word vectors to a binary command table.
+    :param path: File to write. numpy appends .npz if it is missing.
+    :param vectors: Dict of word -> vector.
+    :return: None
+    """
+    numpy.savez(path, **{word: numpy.ravel(numpy.asarray(vec, dtype=numpy.float64)) for word, vec in vectors.items()})
+
+
+def load_command_table(path=DEFAULT_COMMAND_TABLE):
+    """
+    Reads a command table written by save_command_table.
+    :param path: The .npz file to read. Defaults to the command words shipped with the experiments.
+    :return: Dict of word -> 1d float64 numpy array. Each call returns new arrays, so they may be modified in place.
+    """
+    with numpy.load(path) as table:
+        return {word: numpy.array(table[word], dtype=numpy.float64) for word in table.files}
+
+
+def extract_command_table(vector_space, words, path):
+    """
+    Looks up words in a vector store and writes them to a command table.
+    :param vector_space: A Word2VecVectorSpace or Word2VecMemmapVectorSpace (see demos/word2vecDatabase.py).
+    :param words: The words to extract. Raises a KeyError if any of them is missing from the vector store.
+    :param path: File to write.
+    :return: The extracted dict of word -> vector.
+    """
+    words = list(words)
+    vectors = dict(zip(words, vector_space.get_vectors(words)))
+    save_command_table(path, vectors)
+    return vectors
+
+
+# registries loaded from disk in this process, shared by every robot that references them. see CommandRegistry
+_loaded_commands = {}
+
+
+class CommandRegistry(object):
+    """
+    Shared store of the command encodings of a run, referenced by small integer ids.
+    Robots keep the ids of their commands and resolve them here, so the vectors are not pickled with every individual.
+    Once saved, a registry pickles as just its path and workers load the file the first time a command is resolved,
+    once per process. Registries that were never saved, or that gained commands since, pickle their commands instead.
+    """
+    def __init__(self, path=None):
+        """
+        :param path: Optional file of a saved registry to load lazily.
+        """
+        self.path = path
+        self._commands = None if path is not None else []
+        self._ids = None
+        self._dirty = False
+
+    def __len__(self):
+        return len(self._get_commands())
+
+    def __getitem__(self, cmd_id):
+        """
+        :return: The command encoding registered under cmd_id, a 2d array with one row per word.
+        """
+        return self._get_commands()[cmd_id]
+
+    def __getstate__(self):
+        if self.path is not None and not self._dirty:
+            return {"path": self.path}
+        return {"path": self.path, "commands": self._get_commands()}
+
+    def __setstate__(self, state):
+        self.path = state["path"]
+        self._commands = state.get("commands")
+        self._ids = None
+        self._dirty = self._commands is not None and self.path is not None
+
+    def register(self, cmd):
+        """
+        Adds a command to the registry. Registering the same values again returns the existing id.
+        :param cmd: A command encoding, an iterable of vectorized words.
+        :return: The id of the command.
+        """
+        encoding = numpy.array([numpy.ravel(numpy.asarray(word, dtype=numpy.float64)) for word in cmd])
+        encoding.setflags(write=False)
+        ids = self._get_ids()
+        key = (encoding.shape, digest_array(encoding))
+        if key not in ids:
+            commands = self._get_commands()
+            ids[key] = len(commands)
+            commands.append(encoding)
+            self._dirty = True
+        return ids[key]
+
+    def register_all(self, cmds):
+        """
+        Registers the commands of a task dictionary.
+        :param cmds: Dict of task -> list of command encodings, as given to W2VRobot.
+        :return: Dict of task -> list of command ids.
+        """
+        return {task: [self.register(cmd) for cmd in cmds[task]] for task in cmds}
+
+    def save(self, path=None):
+        """
+        Writes the registry to disk. Pickled copies made afterwards only carry the path.
+        :param path: File to write, defaults to the path the registry was loaded from or last saved to.
+        :return: None
+        """
+        if path is not None:
+            self.path = path
+        assert self.path is not None, "A path is needed to save the registry."
+        commands = self._get_commands()
+        with open(self.path, "wb") as f:
+            numpy.savez(f, **{str(cmd_id): cmd for cmd_id, cmd in enumerate(commands)})
+        _loaded_commands[os.path.abspath(self.path)] = commands
+        self._dirty = False
+
+    def _get_commands(self):
+        if self._commands is None:
+            key = os.path.abspath(self.path)
+            if key not in _loaded_commands:
+                with numpy.load(self.path) as table:
+                    commands = [table[str(cmd_id)] for cmd_id in range(len(table.files))]
+                for cmd in commands:
+                    cmd.setflags(write=False)
+                _loaded_commands[key] = commands
+            self._commands = _loaded_commands[key]
+        return self._commands
+
+    def _get_ids(self):
+        if self._ids is None:
+            self._ids = {(cmd.shape, digest_array(cmd)): cmd_id for cmd_id, cmd in enumerate(self._get_commands())}
+        return self._ids
+
+
+if __name__ == "__main__":
+    # python -m experiments.command_table <vector store> <table.npz> word [word ...]
+    # the vector store is either an sqlite database or the base path of a memory mapped export.
+    assert len(sys.argv) >= 4, "please run as python -m experiments.command_table <vector store> <table.npz> words..."
+    from demos.word2vecDatabase import Word2VecVectorSpace, Word2VecMemmapVectorSpace
+
+    store = sys.argv[1]
+    if os.path.exists(store + ".vectors.npy"):
+        vector_space = Word2VecMemmapVectorSpace(store)
+    else:
+        vector_space = Word2VecVectorSpace(database_file=store)
+
+    extracted = extract_command_table(vector_space, sys.argv[3:], sys.argv[2])
+    print("Wrote %d command vectors to %s" % (len(extracted), sys.argv[2]))
@@ -0,0 +1,102 @@
+import hashlib
+
+import numpy
+
+from experiments.lru_cache import LRUCache
+from experiments.prenatal import digest_array, flatten_command
+
+
+def digest_robot(robot):
+    """
+    Stable digest of everything about a robot that changes how it behaves: its type, its scalar settings (sensors,
+    number of hidden neurons, tau...) and its synapses. Neuron ids and hidden neuron states are left out, they are
+    recomputed for every simulation.
+    :param robot: A Quadruped, Twig or SphereBot.
+    :return: A hex digest.
+    """
+    h = hashlib.sha1(type(robot).__name__.encode("utf-8"))
+    for name in sorted(robot.__dict__):
+        value = robot.__dict__[name]
+        if isinstance(value, (bool, int, float, str)):
+            h.update(("%s=%r;" % (name, value)).encode("utf-8"))
+    for name in ("h_synapses", "m_synapses"):
+        synapses = numpy.asarray(getattr(robot, name))
+        h.update(("%s%r" % (name, synapses.shape)).encode("utf-8"))
+        h.update(digest_array(synapses).encode("utf-8"))
+    return h.hexdigest()
+
+
+def digest_command(cmd):
+    return digest_array(flatten_command(cmd))
+
+
+class FitnessCache(LRUCache):
+    """
+    Bounded LRU cache of evaluated fitness tuples.
+    Entries are keyed on a digest of the robot, the evaluation settings and the commands (see W2VRobot.get_fitness_key),
+    so genetically identical individuals and no-op mutations are not simulated again.
+    Lookups are also counted per generation. Every robot calls end_generation() when it ages, the first of them closes
+    the counts of the generation that just finished, see W2VRobot.iterate_generation.
+    """
+    def __init__(self, max_size=10000):
+        super().__init__(max_size)
+        self.generation = 0
+        self.generation_hits = 0
+        self.generation_misses = 0
+        self.history = []  # (generation, hits, misses) of each finished generation
+
+    def get(self, key, record=True):
+        """
+        :param record: Count the lookup in the hit rates.
+        :return: A copy of the cached fitness tuple for key, or None.
+        """
+        fitness = super().get(key, record=record)
+        if record:
+            if fitness is None:
+                self.generation_misses += 1
+            else:
+                self.generation_hits += 1
+        return copy_fitness(fitness) if fitness is not None else None
+
+    def put(self, key, fitness):
+        super().put(key, copy_fitness(fitness))
+
+    def end_generation(self):
+        """
+        Closes the statistics of the current generation and starts the next one. Does nothing until lookups of the new
+        generation are recorded, so it can be called by every robot of the population.
+        :return: The (generation, hits, misses) of the closed generation, also appended to history, or None.
+        """
+        if self.generation_hits + self.generation_misses == 0:
+            return None
+        record = (self.generation, self.generation_hits, self.generation_misses)
+        self.history.append(record)
+        self.generation += 1
+        self.generation_hits = 0
+        self.generation_misses = 0
+        return record
+
+    def get_generation_report(self, record):
+        """
+        :param record: A (generation, hits, misses) entry of history.
+        :return: One line summarizing the lookups of that generation.
+        """
+        generation, hits, misses = record
+        lookups = hits + misses
+        return "FitnessCache generation %d: %d hits, %d misses (%.1f%% hit rate), %d entries" % (
+            generation, hits, misses, 100.0 * hits / lookups if lookups else 0.0, len(self))
+
+    def clear(self):
+        super().clear()
+        self.generation = 0
+        self.generation_hits = 0
+        self.generation_misses = 0
+        self.history = []
+
+
+def copy_fitness(fitness):
+    return tuple({task: list(values) for task, values in part.items()} for part in fitness)
+
+
+# shared by every robot of this process.
+fitness_cache = FitnessCache()
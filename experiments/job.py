@@ -1,3 +1,4 @@
+import os
 import random
 import sys
 
@@ -13,7 +14,7 @@ sys.path.insert(0, "..")
 from experiments.w2v_robot import W2VRobot
 
 # import the robot morphologies
-from experiments.w2v_vecs import *
+from experiments.command_table import load_command_table, CommandRegistry
 from experiments.quadruped import Quadruped
 from experiments.twig import Twig
 from experiments.spherebot import SphereBot
@@ -32,6 +33,7 @@ EVAL_TIME = 500
 POP_SIZE = 50
 GENS = 6000
 MAX_RUNTIME = 12 # 12 hours of walltime.
+MAX_PARALLEL_SIMS = 1 # simulations of one robot run at once by a worker. None for one per cpu of the worker.
 
 if __name__ == '__main__':
     assert len(sys.argv) >= 3, "please run as python job.py seed experiment_name"
@@ -44,12 +46,20 @@ if __name__ == '__main__':
     if len(sys.argv) >= 5:
         parallel_evaluate.MAX_THREADS = int(sys.argv[5])
 
+    if len(sys.argv) >= 7:
+        MAX_PARALLEL_SIMS = int(sys.argv[6])
+
     numpy.random.seed(seed)
     random.seed(seed)
 
     numpy.set_printoptions(suppress=True, formatter={'float_kind': lambda x: '%4.2f' % x})
 
     # generate commands
+    vecs = load_command_table()
+    forward, foward = vecs["forward"], vecs["foward"]
+    backward, backwards = vecs["backward"], vecs["backwards"]
+    stop, cease, suspend, halt = vecs["stop"], vecs["cease"], vecs["suspend"], vecs["halt"]
+
     # are we running a Balanced training set or the default one?
     if "Balance" in name:
         forwardTaskTrain = [[forward], [foward]]
@@ -131,11 +141,22 @@ if __name__ == '__main__':
                 for vec in tcmd:
                     shuffle_vec(vec)
 
+    # simulate the test commands only for the individuals that are reported?
+    lazy_test = "LazyTest" in name
+
+    # register the commands once, robots only carry their ids and the workers load the vectors from disk.
+    command_registry = CommandRegistry()
+    train_cmd_ids = command_registry.register_all(train_cmds)
+    test_cmd_ids = command_registry.register_all(test_cmds)
+    command_registry.save(os.path.abspath("%s_%d_commands.npz" % (name, seed)))
+
     # Setup evo run
     if robot_factory is None:
         def robot_factory():
             internal_robot = get_internal_bot()
-            return W2VRobot(internal_robot, train_cmds, test_cmds=test_cmds, eval_time=EVAL_TIME)
+            return W2VRobot(internal_robot, train_cmd_ids, test_cmds=test_cmd_ids, eval_time=EVAL_TIME,
+                            command_registry=command_registry, lazy_test=lazy_test,
+                            max_parallel_sims=MAX_PARALLEL_SIMS)
 
     def create_new_job():
         return EvolutionaryRun(robot_factory, GENS, seed, pop_size=POP_SIZE, experiment_name=name, override_git_hash_change=False, max_time=MAX_RUNTIME, run_dir="%s_%d"%(name, seed))
@@ -0,0 +1,49 @@
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    """
+    Bounded least recently used cache which counts its hits and misses.
+    Once max_size entries are stored, putting a new one evicts the entry used longest ago.
+    """
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __str__(self):
+        return "%s: %d entries, %d hits, %d misses (%.1f%% hit rate)" % (
+            type(self).__name__, len(self), self.hits, self.misses, 100.0 * self.get_hit_rate())
+
+    def get_hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key, record=True):
+        """
+        :param record: Count the lookup in the hit rate.
+        :return: The cached value for key, or None.
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            if record:
+                self.hits += 1
+            return self._entries[key]
+        if record:
+            self.misses += 1
+        return None
+
+    def put(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
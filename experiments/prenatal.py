@@ -0,0 +1,130 @@
+import hashlib
+
+import numpy
+
+from experiments.lru_cache import LRUCache
+
+
+def flatten_command(cmd):
+    """
+    Flattens a command encoding into the sequence of values the auditory neuron hears, one per time step.
+    :param cmd: An iterable of vectorized words.
+    :return: 1d numpy array
+    """
+    words = [numpy.ravel(numpy.asarray(word, dtype=numpy.float64)) for word in cmd]
+    if len(words) == 0:
+        return numpy.zeros(0)
+    return numpy.concatenate(words)
+
+
+def compute_initial_states(synapses, commands, tau=1.0, alpha=1.0):
+    """
+    Batched prenatal development. Runs the recurrent hidden layer of many (robot, command) pairs over their commands
+    at once, with one vectorized step per time step instead of one per pair.
+    :param synapses: Stack of hidden neuron synapse matrices (see get_hidden_neuron_synapses) with shape
+        (N, num_hidden, num_hidden + 1), one per command. A single 2d matrix is shared by all the commands.
+    :param commands: N command encodings. Each is an iterable of vectorized words. Shorter commands are padded and
+        their state is held once they have been heard in full.
+    :param tau: The tau of the hidden neurons, either a scalar or one value per command.
+    :param alpha: The alpha of the hidden neurons, either a scalar or one value per command.
+    :return: A tuple (last_activations, current_activations) of arrays with shape (N, num_hidden). Row i matches
+        compute_initial_state of the robot owning synapses[i] for commands[i].
+    :rtype: (numpy.ndarray, numpy.ndarray)
+    """
+    sequences = [flatten_command(cmd) for cmd in commands]
+    num_cmds = len(sequences)
+
+    synapses = numpy.asarray(synapses, dtype=numpy.float64)
+    if synapses.ndim == 2:
+        synapses = numpy.broadcast_to(synapses, (num_cmds,) + synapses.shape)
+    assert synapses.shape[0] == num_cmds, "Need one synapse matrix per command."
+    num_hidden = synapses.shape[1]
+
+    tau = numpy.broadcast_to(numpy.asarray(tau, dtype=numpy.float64), (num_cmds,))[:, None]
+    alpha = numpy.broadcast_to(numpy.asarray(alpha, dtype=numpy.float64), (num_cmds,))[:, None]
+
+    lengths = numpy.array([len(seq) for seq in sequences], dtype=int)
+    num_steps = lengths.max() if num_cmds else 0
+
+    # time major so each step reads one contiguous row
+    values = numpy.zeros((num_steps, num_cmds))
+    for i, seq in enumerate(sequences):
+        values[:len(seq), i] = seq
+    padded = numpy.any(lengths != num_steps)
+
+    current_activations = numpy.zeros((num_cmds, num_hidden))
+    last_activations = numpy.zeros((num_cmds, num_hidden))
+    inputs = numpy.zeros((num_cmds, num_hidden + 1, 1))  # hidden neurons + 1 auditory neuron
+
+    for t in range(num_steps):
+        inputs[:, :num_hidden, 0] = current_activations
+        inputs[:, num_hidden, 0] = values[t]
+        activation = numpy.matmul(synapses, inputs)[:, :, 0]
+        new_activations = numpy.tanh(alpha * activation + tau * current_activations)
+
+        if padded:
+            hearing = (t < lengths)[:, None]
+            last_activations = numpy.where(hearing, current_activations, last_activations)
+            current_activations = numpy.where(hearing, new_activations, current_activations)
+        else:
+            last_activations = current_activations
+            current_activations = new_activations
+
+    return last_activations, current_activations
+
+
+class PrenatalCache(LRUCache):
+    """
+    Bounded LRU cache of prenatal development results, (last_values, values) tuples.
+    Entries are keyed on a digest of the recurrent hidden synapses, tau, alpha and a digest of the command. Mutations
+    of m_synapses or of the sensor columns of h_synapses leave the key unchanged, so children reuse the states of
+    their parents instead of developing again.
+    """
+    def __init__(self, max_size=4096):
+        super().__init__(max_size)
+
+
+# shared by every robot of this process.
+prenatal_cache = PrenatalCache()
+
+
+def digest_array(values):
+    return hashlib.sha1(numpy.ascontiguousarray(values, dtype=numpy.float64).tobytes()).hexdigest()
+
+
+def cached_initial_states(synapses, commands, tau=1.0, alpha=1.0, cache=None):
+    """
+    compute_initial_states for a single robot, reusing results from the cache. Only the commands missing from the
+    cache are developed, in a single batch.
+    :param synapses: The robot's hidden neuron synapse matrix (see get_hidden_neuron_synapses).
+    :param commands: A list of command encodings.
+    :param cache: The PrenatalCache to use. Defaults to the shared prenatal_cache.
+    :return: Same as compute_initial_states.
+    """
+    if cache is None:
+        cache = prenatal_cache
+
+    synapses = numpy.asarray(synapses, dtype=numpy.float64)
+    base_key = (synapses.shape, digest_array(synapses), float(tau), float(alpha))
+
+    num_hidden = synapses.shape[0]
+    last_activations = numpy.zeros((len(commands), num_hidden))
+    current_activations = numpy.zeros((len(commands), num_hidden))
+
+    missing = []
+    for i, cmd in enumerate(commands):
+        key = base_key + (digest_array(flatten_command(cmd)),)
+        state = cache.get(key)
+        if state is None:
+            missing.append((i, key))
+        else:
+            last_activations[i], current_activations[i] = state
+
+    if missing:
+        last, current = compute_initial_states(synapses, [commands[i] for i, _ in missing], tau=tau, alpha=alpha)
+        for row, (i, key) in enumerate(missing):
+            last_activations[i] = last[row]
+            current_activations[i] = current[row]
+            cache.put(key, (last[row].copy(), current[row].copy()))
+
+    return last_activations, current_activations
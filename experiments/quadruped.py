@@ -2,8 +2,13 @@ import math
 import random
 import numpy
 
+from Pyrosim.pyrosim.scene import SceneTemplate, get_scene_state
+from experiments.prenatal import cached_initial_states
+
 
 class Quadruped(object):
+    body_templates = {}  # recorded bodies, keyed by morphology and simulator state. see send_body_to_simulator
+
     def __init__(self, sensors=True, num_hidden_neurons=5):
         self.has_sensors = sensors
         self.num_hidden_neurons = num_hidden_neurons
@@ -28,8 +33,12 @@ class Quadruped(object):
     def __str__(self):
         return str((self.h_synapses, self.m_synapses))
     
-    def is_exploading(self, sim_dat):
-        return False
+    def is_exploading(self, sim_dat, abort_code=0):
+        """
+        :param abort_code: The abort code of the simulation, see Simulator.send_abort_criterion.
+        :return: True if the robot diverged during the simulation.
+        """
+        return abort_code != 0
 
     def mutate(self):
         """
@@ -65,32 +74,29 @@ class Quadruped(object):
                 and the second element is the current adtivation state of the hidden neurons.
         :rtype: (numpy.ndarray, numpy.ndarray)
         """
+        last_activations, current_activations = self.compute_initial_states([cmds])
+
+        return last_activations[0], current_activations[0]
+
+    def compute_initial_states(self, commands):
+        """
+        Batched version of compute_initial_state. Develops the robot for every command at once.
+        :param commands: A list of command encodings.
+        :return: A tuple of (num commands, num hidden neurons) arrays holding the last and current activation states
+                of the hidden neurons for each command.
+        :rtype: (numpy.ndarray, numpy.ndarray)
+        """
+        if not hasattr(self, 'num_hidden_neurons'):
+            # print("Old type of robot")
+            self.num_hidden_neurons = 5
+            self.tau = 0
         if hasattr(self, "tau"):
             tau = self.tau
         else:
             tau = 1.0 # matches default of pyrosim -- quadrupeds do not override this yet
         alpha = 1.0 # matches default of pyrosim -- quadrupeds do not override this yet
 
-        # create 2d Matrix of synapses, and activation states
-        synapses = self.get_hidden_neuron_synapses()
-
-        current_activations = numpy.zeros(self.num_hidden_neurons)
-        last_activations = numpy.zeros(self.num_hidden_neurons)
-        inputs = numpy.zeros(self.num_hidden_neurons+1)                 # 5 hidden neurons + 1 auditory neuron for input to 5 hidden neurons.
-
-        for cmd in cmds:
-            for val in cmd:
-                last_activations = current_activations      # keep track of last activation states
-                inputs[0:self.num_hidden_neurons] = current_activations           # update the new inputs
-                inputs[-1:] = val
-                # print(synapses)
-                # print(inputs)
-                activation = numpy.dot(synapses, inputs)
-                current_activations = numpy.tanh(alpha * activation + tau * last_activations)
-
-
-
-        return last_activations, current_activations
+        return cached_initial_states(self.get_hidden_neuron_synapses(), commands, tau=tau, alpha=alpha)
 
     def get_hidden_neuron_synapses(self):
         """
@@ -125,12 +131,20 @@ class Quadruped(object):
         for i in range(len(last_values)):
             self.hidden_neurons_state[i] = (last_values[i], values[i])
 
-    def send_to_simulator(self, simulator, command_encoding):
+    def send_to_simulator(self, simulator, command_encoding, initial_state=None):
+        """
+        Sends the robot to the simulator, born having heard the given command.
+        :param initial_state: Optional (last_values, values) of the hidden neurons for this command, as computed by
+            compute_initial_states. Prenatal development is skipped when it is given.
+        """
         if not hasattr(self,'num_hidden_neurons'):
             # print("Old type of robot")
             self.num_hidden_neurons = 5
             self.tau = 0
-        self.preform_prenatal_development(command_encoding)
+        if initial_state is None:
+            self.preform_prenatal_development(command_encoding)
+        else:
+            self.set_hidden_neuron_state(initial_state[0], initial_state[1])
         self.send_body_to_simulator(simulator)
         self.send_synapses_to_simulator(simulator)
 
@@ -140,25 +154,21 @@ class Quadruped(object):
         # get number of hidden neurons, number of auditory neurons, number of has_sensors neurons.
         # columns come in the above described order. do not send auditory synapses.
 
-        rows, cols = self.h_synapses.shape
+        cols = self.h_synapses.shape[1]
 
         num_h = len(self.hidden_neurons)
         num_a = 1
 
-        for r in range(rows):
-            for c in range(0, num_h):
-                simulator.send_synapse(self.hidden_neurons[c], self.hidden_neurons[r], self.h_synapses[r, c])
-            # skip the auditory synapses. They are stored in the middle for ease of splicing and prenatal development
-            for i, c in enumerate(range(num_h+num_a, cols)):
-                simulator.send_synapse(self.sensor_neurons[i], self.hidden_neurons[r], self.h_synapses[r, c])
+        hidden_ids = [self.hidden_neurons[c] for c in range(num_h)]
+        sensor_ids = [self.sensor_neurons[i] for i in range(cols - num_h - num_a)]
 
-        # send synapses connecting TO motor neurons
-        # get shape of self.m_synapses.
-        rows, cols = self.m_synapses.shape
+        # skip the auditory synapses. They are stored in the middle for ease of splicing and prenatal development
+        weights = numpy.delete(self.h_synapses, num_h, axis=1)
+        simulator.send_synapse_matrix(hidden_ids + sensor_ids, hidden_ids, weights)
 
-        for r in range(rows):
-            for c in range(0, num_h):
-                simulator.send_synapse(self.hidden_neurons[c], self.motor_neurons[r], self.m_synapses[r, c])
+        # send synapses connecting TO motor neurons
+        motor_ids = [self.motor_neurons[r] for r in range(self.m_synapses.shape[0])]
+        simulator.send_synapse_matrix(hidden_ids, motor_ids, self.m_synapses[:, 0:num_h])
 
     def send_body_to_simulator(self, simulator):
         """
@@ -167,6 +177,30 @@ class Quadruped(object):
         :param simulator: the pyrosim simulator
         :return: None
         """
+        # the body, sensors, motor and sensor neurons only depend on the morphology, so they are recorded once and
+        # replayed. hidden neurons carry the state from prenatal development and are sent every time.
+        key = (self.has_sensors, get_scene_state(simulator))
+        template = Quadruped.body_templates.get(key)
+        if template is None:
+            template = SceneTemplate(simulator)
+            self.send_morphology_to_simulator(simulator)
+            template.finish(simulator, motor_neurons=dict(self.motor_neurons), sensor_neurons=dict(self.sensor_neurons))
+            Quadruped.body_templates[key] = template
+        else:
+            ids = template.replay(simulator)
+            self.motor_neurons = dict(ids["motor_neurons"])
+            self.sensor_neurons = dict(ids["sensor_neurons"])
+
+        for i in range(self.num_hidden_neurons):
+            self.hidden_neurons[i] = simulator.send_hidden_neuron(last_value=self.hidden_neurons_state[i][0],
+                                                                  value=self.hidden_neurons_state[i][1])
+
+    def send_morphology_to_simulator(self, simulator):
+        """
+        sends the body of the robot to the simulator along with its motor and sensor neurons.
+        :param simulator: the pyrosim simulator
+        :return: None
+        """
         length = 0.1
         radius = length/5
 
@@ -229,10 +263,6 @@ class Quadruped(object):
         if self.has_sensors:
             for i in range(4):
                 self.sensor_neurons[i] = simulator.send_sensor_neuron(foot_sensors[i])
-
-        for i in range(self.num_hidden_neurons):
-            self.hidden_neurons[i] = simulator.send_hidden_neuron(last_value=self.hidden_neurons_state[i][0],
-                                                                  value=self.hidden_neurons_state[i][1])
     def get_motion(self, sim_dat):
         return 1
 
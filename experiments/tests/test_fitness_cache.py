@@ -0,0 +1,50 @@
+import copy
+
+import numpy
+import pytest
+
+# W2VRobot imports the evolution and parallelism packages
+pytest.importorskip("evodevo")
+pytest.importorskip("parallelpy")
+
+from experiments.quadruped import Quadruped
+from experiments.w2v_robot import W2VRobot
+
+
+def make_robot(eval_time=500):
+    numpy.random.seed(0)
+    cmds = {"forward": [[numpy.random.normal(0, 0.1, 300)]], "stop": [[numpy.random.normal(0, 0.1, 300)]]}
+    test_cmds = {"stop": [[numpy.random.normal(0, 0.1, 300)]]}
+    return W2VRobot(Quadruped(num_hidden_neurons=5), cmds, test_cmds=test_cmds, eval_time=eval_time)
+
+
+def test_identical_genomes_share_a_key():
+    robot = make_robot()
+    key = robot.get_fitness_key()
+    assert copy.deepcopy(robot).get_fitness_key() == key
+
+    # every synapse is 0, so mutate draws gauss(0, 0) and changes nothing
+    robot.robot.h_synapses[:] = 0
+    robot.robot.m_synapses[:] = 0
+    key = robot.get_fitness_key()
+    robot.mutate()
+    assert robot.get_fitness_key() == key
+
+
+def test_changes_change_the_key():
+    robot = make_robot()
+    key = robot.get_fitness_key()
+
+    child = copy.deepcopy(robot)
+    child.robot.m_synapses[0, 0] += 0.5
+    assert child.get_fitness_key() != key
+
+    assert make_robot(eval_time=250).get_fitness_key() != key
+
+    child = copy.deepcopy(robot)
+    child.train_commands["forward"][0][0][0] += 0.5
+    assert child.get_fitness_key() != key
+
+    child = copy.deepcopy(robot)
+    child.test_commands["stop"][0][0][-1] += 0.5
+    assert child.get_fitness_key() != key
@@ -0,0 +1,39 @@
+import numpy
+
+from experiments.prenatal import prenatal_cache
+from experiments.quadruped import Quadruped
+
+
+def scalar_initial_state(synapses, cmds, tau=1.0, alpha=1.0):
+    """The one command at a time loop compute_initial_states replaced."""
+    num_hidden = synapses.shape[0]
+    current_activations = numpy.zeros(num_hidden)
+    last_activations = numpy.zeros(num_hidden)
+    inputs = numpy.zeros(num_hidden + 1)
+
+    for cmd in cmds:
+        for val in cmd:
+            last_activations = current_activations
+            inputs[0:num_hidden] = current_activations
+            inputs[-1:] = val
+            activation = numpy.dot(synapses, inputs)
+            current_activations = numpy.tanh(alpha * activation + tau * last_activations)
+
+    return last_activations, current_activations
+
+
+def test_batched_matches_scalar_loop():
+    numpy.random.seed(0)
+    robot = Quadruped(num_hidden_neurons=7)
+    robot.tau = 0.5
+    # commands of one and two words, so the batch is padded
+    commands = [[numpy.random.normal(0, 0.1, 300)] for _ in range(3)]
+    commands.append([numpy.random.normal(0, 0.1, 300), numpy.random.normal(0, 0.1, 300)])
+
+    prenatal_cache.clear()
+    last, current = robot.compute_initial_states(commands)
+    for i, cmd in enumerate(commands):
+        expected_last, expected_current = scalar_initial_state(robot.get_hidden_neuron_synapses(), cmd,
+                                                               tau=robot.tau)
+        assert numpy.allclose(last[i], expected_last, rtol=0, atol=1e-12)
+        assert numpy.allclose(current[i], expected_current, rtol=0, atol=1e-12)
@@ -1,20 +1,76 @@
+import atexit
 import math
 import uuid
 import os
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import numpy as np
 from scipy import spatial
 
 from parallelpy.utils import Work, Letter
 from Pyrosim.pyrosim import pyrosim
+from Pyrosim.pyrosim.server import SimulatorServer
 from evodevo.moo_interfaces import MOORobotInterface
+from experiments.fitness_cache import fitness_cache, digest_robot, digest_command
+
+_idle_simulator_servers = queue.LifoQueue()
+
+# robots whose position sensor moves further than this in a single time step are exploding. they get a fitness of 0
+# and the simulator stops them as soon as it happens.
+MAX_STEP_DISPLACEMENT = 0.1
+
+
+def acquire_simulator_server():
+    """
+    Returns an idle simulator server of this process, starting a new one if all are busy.
+    Workers evaluate many robots, so the simulator processes are kept alive for all of them.
+    """
+    try:
+        return _idle_simulator_servers.get_nowait()
+    except queue.Empty:
+        server = SimulatorServer()
+        atexit.register(server.close)
+        return server
+
+
+def release_simulator_server(server):
+    """
+    Returns a server obtained from acquire_simulator_server to the pool.
+    """
+    _idle_simulator_servers.put(server)
+
+
+def get_num_cpus():
+    """
+    :return: The number of cpus this process may run on.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
 
 
 class W2VRobot(MOORobotInterface):
-    def __init__(self, robot, cmds, eval_time=500, quasi_static_ratio=1, test_cmds=None):
+    def __init__(self, robot, cmds, eval_time=500, quasi_static_ratio=1, test_cmds=None, command_registry=None,
+                 result_cache=None, lazy_test=False, use_reducers=True, max_parallel_sims=1):
+        """
+        :param cmds: Dict of task -> list of training commands.
+        :param test_cmds: Optional dict of task -> list of test commands.
+        :param command_registry: Optional CommandRegistry (see experiments/command_table.py). When it is given the
+            commands are ids into the registry instead of encodings, which keeps the vectors out of every pickled
+            individual.
+        :param result_cache: Optional pyrosim ResultCache. Simulations already stored in it are not run again.
+        :param lazy_test: If True compute_work only simulates the training commands. The test commands are simulated
+            the first time their fitness is needed, see evaluate_test_commands.
+        :param use_reducers: If True the simulator reduces the position sensor to the numbers the fitness needs and no
+            sensor series are sent back, see _send_outputs.
+        :param max_parallel_sims: Largest number of this robot's simulations running at once in this process, None for
+            one per cpu available to the process. Keep it at 1 when every core already runs a worker.
+        """
         self.id = -1
         self.parent_id = -1
         self.robot = robot
+        self.command_registry = command_registry
         self.train_commands = cmds
         self.num_train_cmds = len(self._flatten(self.train_commands.values()))
 
@@ -40,8 +96,14 @@ class W2VRobot(MOORobotInterface):
             self.play_blind = True
         self.play_paused = False
         self.age = 0
+        self.max_parallel_sims = max_parallel_sims
+        self.fitness_cache_checked = False
+        self.result_cache = result_cache
+        self.lazy_test = lazy_test
+        self.use_reducers = use_reducers
 
     def __str__(self):
+        self.evaluate_test_commands()
         return "ID: %d, PID: %d, age: %d, f: %.2f, f : %.2f, %s %s"% (self.get_id(), self.get_parent_id(), self.get_age(), self.get_fitness(test=False), self.get_fitness(test=True),
                                                                       ["%.2f"%d for d in self._flatten(self.fitness[0].values())], ["%.2f"% d for d in self._flatten(self.fitness[1].values())])
 
@@ -61,13 +123,29 @@ class W2VRobot(MOORobotInterface):
 
     def iterate_generation(self):
         self.age += 1
+        # the first robot aged in a generation closes the fitness cache counts of the previous one.
+        record = fitness_cache.end_generation()
+        if record is not None:
+            print(fitness_cache.get_generation_report(record))
 
     def needs_evaluation(self):
+        if "fitness_cache_checked" not in self.__dict__:
+            self.fitness_cache_checked = False
+
+        # identical genomes evaluated before get their fitness without being sent to a worker.
+        if self.needs_eval and not self.fitness_cache_checked:
+            self.fitness_cache_checked = True
+            key = self.get_fitness_key()
+            fitness = fitness_cache.get(key) if key is not None else None
+            if fitness is not None:
+                self.fitness = fitness
+                self.needs_eval = False
         return self.needs_eval
 
     def mutate(self):
         self.parent_id = self.get_id()
         self.needs_eval = True
+        self.fitness_cache_checked = False
         self.robot.mutate()
         self.fitness = ({}, {})
 
@@ -79,6 +157,8 @@ class W2VRobot(MOORobotInterface):
 
 
     def get_fitness(self, test=False):
+        if test:
+            self.evaluate_test_commands()
         ret = np.sum(list(self._flatten(self.fitness[0].values())))
         if test:
              ret += np.sum(list(self._flatten(self.fitness[1].values())))
@@ -104,6 +184,7 @@ class W2VRobot(MOORobotInterface):
         return base
 
     def get_summary_sql_data(self):
+        self.evaluate_test_commands()
         to_ret = (self.get_id(), self.get_parent_id(), self.get_age(), self.get_fitness())
         to_add = []
         for cmd in sorted(self.train_commands.keys()):
@@ -128,31 +209,137 @@ class W2VRobot(MOORobotInterface):
         else:
             serial = False
 
-        sims = self.get_simulator_instances(test=test)
-        sims_dat = ({}, {})  # (train, test)
+        if "max_parallel_sims" not in self.__dict__:
+            self.max_parallel_sims = 1
+
+        max_parallel_sims = kwargs.get("max_parallel_sims", self.max_parallel_sims)
+
+        if "lazy_test" not in self.__dict__:
+            self.lazy_test = False
 
-        if serial or True:
-            for i in [0,1]:
-                for val in sims[i]:
-                    if val not in sims_dat[i]:
-                        sims_dat[i][val] = [None]*len(sims[i][val])
-                    for n, sim in enumerate(sims[i][val]):
-                        sims[i][val][n].start()
-                        sims_dat[i][val][n] = sims[i][val][n].wait_to_finish()
-                        print(".", end="", flush=True)
-        self.evaluate_via_sim_data(sims_dat)
+        # hit rates are recorded where the generations are run, see needs_evaluation
+        key = self.get_fitness_key()
+        self.fitness_key = key  # sent back with the fitness, see write_letter
+        fitness = fitness_cache.get(key, record=False) if key is not None else None
+        if fitness is not None:
+            self.fitness = fitness
+            return
+
+        if self.lazy_test:
+            sims = self.get_simulator_instances(test=test, command_sets=(0,))
+        else:
+            sims = self.get_simulator_instances(test=test)
+        self.evaluate_via_sim_data(*self._run_simulations(sims, serial, max_parallel_sims))
+        if key is not None:
+            fitness_cache.put(key, self.fitness)
         # print(self.fitness)
 
+    def evaluate_test_commands(self):
+        """
+        Simulates the test commands of a robot evaluated with lazy_test, if they have not been simulated yet.
+        Called before the test fitness is read, so only the individuals that are reported pay for it.
+        :return: None
+        """
+        if "lazy_test" not in self.__dict__ or not self.lazy_test or not self.test_commands:
+            return
+        if all(task in self.fitness[1] for task in self.test_commands):
+            return
+
+        key = self.get_fitness_key(test=True)
+        fitness = fitness_cache.get(key, record=False) if key is not None else None
+        if fitness is not None:
+            self.fitness = fitness
+            return
+
+        self.fitness[1].clear()
+        sims = self.get_simulator_instances(test=True, command_sets=(1,))
+        self.evaluate_via_sim_data(*self._run_simulations(sims, False, getattr(self, "max_parallel_sims", 1)))
+        if key is not None:
+            fitness_cache.put(key, self.fitness)
+
+    def _run_simulations(self, sims, serial, max_parallel_sims):
+        """
+        Runs the simulations built by get_simulator_instances.
+        :param serial: Run one simulation at a time.
+        :param max_parallel_sims: Largest number of simulations running at once, None for one per cpu available to
+            this process.
+        :return: A tuple of the sensor data, the abort code and the reduced values of each simulation, in the layout
+            of sims.
+        """
+        if max_parallel_sims is None:
+            max_parallel_sims = get_num_cpus()
+        sims_dat = ({}, {})  # (train, test)
+
+        # pre-size the results so they are evaluated in command order, whatever order sims finish in.
+        jobs = []
+        for i in [0,1]:
+            for val in sims[i]:
+                sims_dat[i][val] = [None]*len(sims[i][val])
+                for n, sim in enumerate(sims[i][val]):
+                    jobs.append((i, val, n, sim))
+
+        if serial or max_parallel_sims <= 1 or len(jobs) <= 1:
+            for i, val, n, sim in jobs:
+                sims_dat[i][val][n] = self._run_simulation(sim)
+                print(".", end="", flush=True)
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_parallel_sims, len(jobs))) as executor:
+                futures = {executor.submit(self._run_simulation, sim): (i, val, n) for i, val, n, sim in jobs}
+                for future in as_completed(futures):
+                    i, val, n = futures[future]
+                    sims_dat[i][val][n] = future.result()
+                    print(".", end="", flush=True)
+
+        abort_codes = ({}, {})  # (train, test)
+        reduced = ({}, {})  # (train, test)
+        for i in [0,1]:
+            for val in sims[i]:
+                abort_codes[i][val] = [sim.abort_code for sim in sims[i][val]]
+                reduced[i][val] = [sim.reduced_data for sim in sims[i][val]]
+        return sims_dat, abort_codes, reduced
+
     def write_letter(self):
         # print("writing letter")
-        return Letter(self.fitness, None)
+        return Letter({"fitness": self.fitness, "key": getattr(self, "fitness_key", None)}, None)
 
     def open_letter(self, letter):
         # print("opening")
-        self.fitness = letter.get_data()
+        data = letter.get_data()
+        if isinstance(data, dict):
+            self.fitness = data["fitness"]
+            if data["key"] is not None:
+                fitness_cache.put(data["key"], self.fitness)
+        else:
+            self.fitness = data
         self.needs_eval = False
         return None
 
+    def get_fitness_key(self, test=None):
+        """
+        Stable key of an evaluation, see FitnessCache. Covers the robot's morphology and synapses, the evaluation
+        settings and the commands of each task.
+        :param test: Whether the test commands are evaluated too. Defaults to what compute_work evaluates.
+        :return: A tuple, or None for robots whose commands are still stored in the old list format.
+        """
+        if type(self.train_commands) in [list, tuple]:
+            return None
+        if test is None:
+            test = not getattr(self, "lazy_test", False)
+        if "command_registry" not in self.__dict__:
+            self.command_registry = None
+        if "quasi_static_ratio" not in self.__dict__:
+            self.quasi_static_ratio = 1
+        if "use_reducers" not in self.__dict__:
+            self.use_reducers = False
+
+        command_sets = [self.train_commands]
+        if test:
+            command_sets.append(self.test_commands)
+        cmds_key = tuple(tuple((task, tuple(digest_command(self.get_command(cmd)) for cmd in commands[task]))
+                               for task in sorted(commands)) if commands is not None else None
+                         for commands in command_sets)
+        return digest_robot(self.robot), self.eval_time, self.quasi_static_ratio, self.use_reducers, cmds_key
+
 
 
     def get_num_evaluations(self, test=False):
@@ -161,9 +348,11 @@ class W2VRobot(MOORobotInterface):
         else:
             return self.num_train_cmds
 
-    def get_simulator_instances(self, test=False):
+    def get_simulator_instances(self, test=False, server=None, command_sets=(0, 1)):
         """
         Generates and returns all the simulations that need to be run to evaluate this robot.
+        :param server: Optional SimulatorServer to evaluate the simulations on (blind only).
+        :param command_sets: Which of the (train, test) commands to build simulations for.
         :return: An array of simulations to run.
         """
         if "play_paused" not in self.__dict__:
@@ -175,6 +364,15 @@ class W2VRobot(MOORobotInterface):
         if "quasi_static_ratio" not in self.__dict__:
             self.quasi_static_ratio = 1
 
+        if "command_registry" not in self.__dict__:
+            self.command_registry = None
+
+        if "result_cache" not in self.__dict__:
+            self.result_cache = None
+
+        if "use_reducers" not in self.__dict__:
+            self.use_reducers = False
+
         if type(self.train_commands) in [list, tuple]:
             self.fitness = ({}, {})
             tmp = self.train_commands
@@ -193,56 +391,136 @@ class W2VRobot(MOORobotInterface):
             end_idx = self.ttl_num_cmds
         else:
             end_idx = self.num_train_cmds
+        # prenatal development for every command in one batch. the states are consumed in the order sims are built.
+        all_cmds = []
+        for i, commands in enumerate((self.train_commands, self.test_commands)):
+            if commands is not None and i in command_sets:
+                for val in commands:
+                    all_cmds += [self.get_command(cmd) for cmd in commands[val]]
+        initial_states = iter(zip(*self.robot.compute_initial_states(all_cmds)))
+
         sims = ({}, {})  # (train, test)
-        if self.train_commands is not None:
+        if self.train_commands is not None and 0 in command_sets:
             for val in self.train_commands:
                 if val not in sims[0]:
                     sims[0][val] = []
                 for cmd in self.train_commands[val]:
                     sim = pyrosim.Simulator(debug=self.debug, eval_time=self.eval_time, play_blind=self.play_blind,
-                                      play_paused=self.play_paused, quasi_static_ratio=self.quasi_static_ratio)
+                                      play_paused=self.play_paused, quasi_static_ratio=self.quasi_static_ratio,
+                                      binary_output=True, server=server, cache=self.result_cache)
                     sims[0][val].append(sim)
-                    self.robot.send_to_simulator(sim, cmd)
+                    self.robot.send_to_simulator(sim, self.get_command(cmd), initial_state=next(initial_states))
+                    self._send_abort_criterion(sim)
+                    self._send_outputs(sim)
 
-        if self.test_commands is not None:
+        if self.test_commands is not None and 1 in command_sets:
             for val in self.test_commands:
                 if val not in sims[1]:
                     sims[1][val] = []
                 for cmd in self.test_commands[val]:
                     sim = pyrosim.Simulator(debug=self.debug, eval_time=self.eval_time, play_blind=self.play_blind,
-                                      play_paused=self.play_paused)
+                                      play_paused=self.play_paused, binary_output=True, server=server,
+                                      cache=self.result_cache)
                     sims[1][val].append(sim)
-                    self.robot.send_to_simulator(sim, cmd)
+                    self.robot.send_to_simulator(sim, self.get_command(cmd), initial_state=next(initial_states))
+                    self._send_abort_criterion(sim)
+                    self._send_outputs(sim)
         return sims
 
-    def evaluate_via_sim_data(self, sims_dat, test=False):
+    def _send_abort_criterion(self, sim):
+        """
+        Stops the simulation as soon as the robot explodes. The position sensor is the last sensor of every robot.
+        """
+        sim.send_abort_criterion(sim.get_num_sensors() - 1, 'max_step_xy', MAX_STEP_DISPLACEMENT)
+
+    def _send_outputs(self, sim):
+        """
+        Selects what the simulator sends back, only what evaluate_via_sim_data needs. With use_reducers the position
+        sensor is reduced to its final x position, its xy path length and its largest xy displacement in a single time
+        step, and none of the sensor series are returned. Otherwise only the series of the position sensor is returned.
+        """
+        position_sensor = sim.get_num_sensors() - 1
+        if not self.use_reducers:
+            sim.send_sensor_output(position_sensor)
+            return
+
+        sim.send_reducer(position_sensor, 'final', svi=0)
+        sim.send_reducer(position_sensor, 'path_length_xy')
+        sim.send_reducer(position_sensor, 'max_step_xy')
+        for sensor_id in range(sim.get_num_sensors()):
+            sim.send_sensor_output(sensor_id, series=False)
+
+    def get_command(self, cmd):
+        """
+        :param cmd: An entry of train_commands or test_commands.
+        :return: The command encoding, resolved through the command registry when the robot has one.
+        """
+        if self.command_registry is None:
+            return cmd
+        return self.command_registry[cmd]
+
+    def _run_simulation(self, sim):
+        """
+        Runs a single simulation to completion and returns its sensor data, as a dict of sensor id -> series.
+        Blind simulations are run on a pooled simulator server, so concurrent calls each get their own process.
+        """
+        if not sim.play_blind or sim.server is not None:
+            sim.start()
+            return sim.wait_to_finish(dense=False)
+
+        server = acquire_simulator_server()
+        try:
+            sim.server = server
+            sim.start()
+            data = sim.wait_to_finish(dense=False)
+        except BaseException:
+            # the server may have died or still be busy with the scene, it is not handed to another simulation
+            server.close()
+            raise
+        release_simulator_server(server)
+        return data
+
+    def evaluate_via_sim_data(self, sims_dat, abort_codes=None, reduced=None, test=False):
+        """
+        Computes the fitness of each simulation.
+        :param sims_dat: The sensor data of each simulation, keyed like get_simulator_instances. Each is a dict of sensor
+            id -> (values, time steps) array, see Simulator.sensor_data.
+        :param abort_codes: Optional abort codes of the simulations, in the same layout. Robots that exploded get a
+            fitness of 0.
+        :param reduced: Optional reduced values of the simulations, in the same layout. Simulations with reducers (see
+            _send_outputs) are scored from them instead of their sensor data.
+        """
         for i in [0,1]:
             for val in sims_dat[i]:
-                for sim_dat in sims_dat[i][val]:
+                for n, sim_dat in enumerate(sims_dat[i][val]):
+                    abort_code = abort_codes[i][val][n] if abort_codes is not None else 0
                     motion_penalty = 1
                     try:
                         motion_penalty = self.robot.get_motion(sim_dat)
                     except Exception as e:
                         print(e)
                         pass
-                    x_pos = sim_dat[-1:, 0:1, -1:][0][0][0]
-                    y_pos = sim_dat[-1:, 1:2, -1:][0][0][0]
-
-                    tmp = sim_dat[-1:, 0:1, :].flatten()
-                    x_delta = tmp[1:] - tmp[:-1]
+                    if reduced is not None and len(reduced[i][val][n]) > 0:
+                        x_pos, path_length, max_step = reduced[i][val][n]
+                    else:
+                        # the position sensor is the last sensor of every robot, and the only one returned
+                        position = sim_dat[max(sim_dat)]
+                        x_pos = position[0, -1]
 
-                    tmp = sim_dat[-1:, 1:2, :].flatten()
-                    y_delta = tmp[1:] - tmp[:-1]
+                        x_delta = position[0, 1:] - position[0, :-1]
+                        y_delta = position[1, 1:] - position[1, :-1]
 
-                    deltas = list([math.sqrt(x ** 2 + y ** 2) for x, y in zip(x_delta, y_delta)])
-                    if (np.max(np.array(deltas).flatten()) > 0.1):
+                        deltas = np.array([math.sqrt(x ** 2 + y ** 2) for x, y in zip(x_delta, y_delta)])
+                        path_length = np.sum(deltas)
+                        max_step = np.max(deltas)
+                    if self.robot.is_exploading(sim_dat, abort_code) or max_step > MAX_STEP_DISPLACEMENT:
                         fit = 0
                     elif val == "forward":
                         fit = x_pos
                     elif val == "backward":
                         fit = -1 * x_pos
                     elif val == "stop":
-                        fit = -1 * np.sum(np.array(deltas))
+                        fit = -1 * path_length
                     else:
                         raise Exception ("No fitness function for the given command.")
                     if val not in self.fitness[i]:
@@ -1,624 +0,0 @@
-# coding=utf-8
-meander = [1.29882812e-01, 2.86865234e-02, -2.08984375e-01, 4.08203125e-01, 1.77001953e-02, -1.04980469e-01,
-           -1.07421875e-01, 1.52343750e-01, -5.98144531e-02, 2.29492188e-01, -9.76562500e-02, 2.34375000e-01,
-           1.29882812e-01, 2.92968750e-01, -1.11328125e-01, -1.66992188e-01, 7.81250000e-03, 3.73046875e-01,
-           4.42504883e-03, -2.22656250e-01, -8.34960938e-02, 4.04296875e-01, -3.56445312e-02, 3.78906250e-01,
-           2.79296875e-01, -7.32421875e-02, -9.66796875e-02, 5.32226562e-02, -7.67707825e-05, -1.19628906e-01,
-           -1.75781250e-01, 1.36718750e-01, -3.18359375e-01, -2.37304688e-01, -2.50000000e-01, -1.38671875e-01,
-           2.85644531e-02, -5.35156250e-01, 8.64257812e-02, -6.78710938e-02, -1.30859375e-01, -2.11914062e-01,
-           1.31225586e-02, -2.34375000e-01, -1.43554688e-01, -2.67333984e-02, -1.68945312e-01, -3.03955078e-02,
-           -7.32421875e-02, -9.66796875e-02, -1.22070312e-01, -3.00292969e-02, 1.52343750e-01, 9.22851562e-02,
-           1.90429688e-01, 8.91113281e-03, -1.07421875e-01, -4.27734375e-01, 1.11816406e-01, 5.39550781e-02,
-           2.70996094e-02, 4.24194336e-03, 2.36328125e-01, -3.39843750e-01, 1.15234375e-01, -1.41601562e-01,
-           -3.35937500e-01, -2.29492188e-02, -9.71679688e-02, 6.10351562e-02, 1.20117188e-01, 4.02832031e-02,
-           1.53320312e-01, -4.86328125e-01, -2.83203125e-01, -2.28515625e-01, -3.08593750e-01, -3.12500000e-01,
-           -1.58691406e-02, -8.78906250e-02, -1.97265625e-01, -2.63671875e-01, 6.13403320e-03, -7.56835938e-02,
-           1.84570312e-01, 5.03906250e-01, -2.05078125e-01, -1.11816406e-01, -3.56445312e-02, 3.51562500e-01,
-           5.02929688e-02, -3.90625000e-02, -1.92382812e-01, 1.91406250e-01, -5.76171875e-02, -1.36718750e-01,
-           1.49414062e-01, 2.29492188e-01, -3.71093750e-01, -1.92382812e-01, 2.21679688e-01, 1.08398438e-01,
-           1.47460938e-01, 7.12890625e-02, 2.53906250e-02, -2.04101562e-01, 1.36718750e-01, -1.74804688e-01,
-           9.71679688e-02, -1.25000000e-01, 1.30859375e-01, -7.04956055e-03, 3.33984375e-01, -3.04687500e-01,
-           1.33789062e-01, -3.10546875e-01, 1.56250000e-01, -1.64062500e-01, 1.15234375e-01, 7.27539062e-02,
-           2.00195312e-02, 1.80664062e-01, -7.53784180e-03, -1.63574219e-02, 1.75781250e-01, -3.01513672e-02,
-           -2.96875000e-01, 6.00585938e-02, -8.64257812e-02, -1.72119141e-02, -1.39648438e-01, 6.78710938e-02,
-           2.08984375e-01, 2.41210938e-01, -1.25976562e-01, 1.04003906e-01, -8.15429688e-02, -8.00781250e-02,
-           8.83789062e-02, 1.29882812e-01, 2.79296875e-01, -2.14843750e-01, -2.75390625e-01, -2.02636719e-02,
-           -1.52343750e-01, 3.02734375e-01, -1.60156250e-01, -7.95898438e-02, -1.29882812e-01, -8.74023438e-02,
-           -1.42578125e-01, -3.47656250e-01, 1.82617188e-01, 2.63671875e-01, -6.54296875e-02, -9.27734375e-02,
-           1.56250000e-01, -7.66601562e-02, -4.06250000e-01, 1.97265625e-01, 1.39648438e-01, 1.80664062e-01,
-           -4.49218750e-02, -9.91210938e-02, 1.90429688e-01, 2.33398438e-01, 4.16015625e-01, -1.85546875e-02,
-           9.13085938e-02, -8.49609375e-02, -2.33398438e-01, 8.88671875e-02, 3.07617188e-02, 1.25976562e-01,
-           3.71093750e-02, 1.46484375e-01, -2.96875000e-01, 1.59912109e-02, 1.54296875e-01, 1.51824951e-03,
-           -3.90625000e-01, -1.56250000e-01, -8.15429688e-02, 1.33789062e-01, -1.91406250e-01, -5.71289062e-02,
-           1.88476562e-01, 1.08398438e-01, 7.61718750e-02, -1.21582031e-01, 2.89062500e-01, -1.11816406e-01,
-           8.74023438e-02, 7.56835938e-02, 6.73828125e-02, 1.06811523e-02, -4.19921875e-01, 5.98144531e-02,
-           1.29882812e-01, 2.96875000e-01, 1.66015625e-01, 7.22656250e-02, -2.53906250e-01, -2.02148438e-01,
-           -5.54199219e-02, -3.92913818e-04, 9.03320312e-02, -1.52343750e-01, 6.25000000e-02, 1.58309937e-04,
-           -4.32128906e-02, 5.90820312e-02, 5.02929688e-02, 1.19628906e-01, -2.43164062e-01, -3.80859375e-02,
-           7.71484375e-02, 5.12695312e-02, -1.25000000e-01, -2.83203125e-01, 2.14843750e-01, 5.81054688e-02,
-           -7.51953125e-02, 1.02050781e-01, 1.66992188e-01, 1.59179688e-01, 1.96289062e-01, -3.34472656e-02,
-           4.76074219e-02, 2.51953125e-01, -1.63085938e-01, -1.95312500e-01, -3.14941406e-02, 2.38281250e-01,
-           2.50000000e-01, 1.63085938e-01, 1.12304688e-01, 2.49023438e-01, 2.59765625e-01, 8.15429688e-02,
-           1.78710938e-01, 9.27734375e-02, -8.39843750e-02, -1.63085938e-01, -3.05175781e-02, 4.37011719e-02,
-           9.27734375e-02, 6.83593750e-02, -2.05078125e-01, 1.37695312e-01, 1.51367188e-01, -4.95605469e-02,
-           7.71484375e-02, 1.16699219e-01, -2.85644531e-02, -2.25585938e-01, -4.15039062e-02, -1.09863281e-01,
-           -3.35937500e-01, 1.68945312e-01, 7.17773438e-02, -1.11816406e-01, 4.80957031e-02, 3.37890625e-01,
-           1.98242188e-01, 2.57812500e-01, 5.76171875e-02, -9.22851562e-02, -1.15234375e-01, 2.07031250e-01,
-           -1.67236328e-02, 2.89062500e-01, -1.61132812e-01, 2.53906250e-01, 2.40234375e-01, -2.79296875e-01,
-           -3.06640625e-01, -1.74713135e-03, -1.01928711e-02, 6.25000000e-02, 8.00781250e-02, -1.78710938e-01,
-           1.87500000e-01, -3.54003906e-02, 1.02050781e-01, 1.10473633e-02, -3.26171875e-01, 1.70898438e-01,
-           -6.25000000e-02, 3.02734375e-01, 8.83789062e-02, 2.67578125e-01, 1.41601562e-01, -2.49023438e-02,
-           1.97753906e-02, 1.48925781e-02, 4.51171875e-01, -3.90625000e-01, 1.03027344e-01, -5.46875000e-02]
-
-wander = [0.19433594, -0.01428223, -0.20214844, 0.60546875, -0.21289062, 0.03466797, -0.02502441, 0.11865234,
-          -0.10888672, 0.13769531, 0.05224609, -0.12011719, 0.05761719, 0.19238281, -0.21582031, -0.14648438,
-          0.0546875, 0.29492188, 0.13964844, -0.02526855, -0.06591797, 0.13378906, -0.140625, 0.296875, 0.08056641,
-          -0.0055542, 0.06396484, 0.265625, -0.0123291, -0.40039062, -0.25, -0.00335693, -0.43945312, -0.19824219,
-          -0.22460938, -0.35351562, -0.18945312, -0.4296875, -0.03540039, 0.17871094, -0.07568359, -0.0703125,
-          0.20410156, -0.234375, 0.05859375, 0.06738281, -0.08935547, -0.03076172, -0.19140625, 0.05810547,
-          -0.1640625, 0.13964844, 0.32226562, 0.02832031, 0.19140625, -0.15820312, 0.18554688, -0.40429688,
-          -0.03955078, 0.16113281, 0.21386719, 0.05371094, 0.20703125, -0.2578125, 0.05688477, -0.22265625,
-          -0.08740234, -0.06835938, -0.171875, 0.08154297, 0.23144531, 0.14648438, 0.14160156, -0.34570312,
-          -0.3203125, -0.14941406, -0.22070312, -0.18261719, 0.04296875, 0.02722168, -0.10693359, -0.03344727,
-          0.16015625, 0.16699219, 0.06030273, 0.26367188, 0.06835938, -0.18066406, -0.04858398, 0.20800781,
-          0.08886719, -0.04077148, -0.14550781, -0.03662109, 0.05639648, -0.28320312, 0.44921875, 0.22265625,
-          -0.16796875, -0.15039062, 0.05834961, -0.03515625, 0.08349609, 0.07568359, 0.24414062, -0.265625,
-          0.1640625, -0.11669922, -0.15820312, -0.07421875, 0.01434326, 0.09326172, 0.21582031, -0.32617188,
-          0.234375, -0.29296875, -0.14746094, -0.42382812, 0.140625, -0.15722656, -0.07128906, 0.26367188,
-          -0.12792969, 0.18457031, 0.08251953, -0.01538086, -0.26171875, -0.00494385, -0.0246582, -0.06982422,
-          -0.19726562, -0.09716797, 0.16113281, 0.37890625, -0.11865234, -0.0300293, 0.06591797, 0.09814453,
-          -0.00482178, 0.00939941, 0.22558594, -0.06103516, -0.1796875, 0.125, 0.09130859, 0.19433594, -0.21582031,
-          -0.11914062, -0.10302734, -0.22949219, -0.07470703, -0.14550781, 0.16796875, 0.02575684, -0.19628906,
-          0.03930664, 0.10058594, -0.14453125, -0.2734375, 0.1953125, 0.10449219, 0.07568359, 0.0246582,
-          -0.25390625, 0.171875, 0.02160645, 0.31445312, 0.13085938, -0.03369141, -0.04736328, -0.01226807,
-          0.20703125, -0.05151367, 0.0625, 0.04711914, -0.0612793, -0.0859375, -0.05444336, 0.203125, 0.07958984,
-          -0.45117188, -0.10888672, 0.09179688, 0.10302734, -0.06982422, -0.03393555, 0.19140625, 0.06933594,
-          0.05493164, -0.11425781, 0.06835938, -0.14648438, 0.23535156, 0.18554688, -0.01379395, 0.26953125,
-          -0.29296875, 0.00279236, -0.12207031, 0.265625, 0.23242188, 0.12597656, -0.21875, -0.2578125, 0.03588867,
-          0.03320312, 0.15820312, 0.05786133, 0.05615234, -0.00405884, -0.15136719, -0.10058594, 0.16601562,
-          -0.05371094, -0.3671875, -0.02734375, 0.11962891, -0.15527344, -0.10644531, -0.42382812, -0.15722656,
-          -0.05615234, -0.04663086, 0.01721191, 0.08496094, 0.12304688, 0.19628906, -0.00952148, -0.10791016,
-          -0.22753906, 0.12792969, -0.22167969, -0.16992188, 0.2578125, 0.29101562, 0.08691406, -0.06787109,
-          0.078125, -0.12060547, 0.00273132, 0.12353516, -0.14550781, 0.0534668, -0.16699219, 0.09716797,
-          0.02819824, 0.24609375, -0.05224609, -0.10205078, -0.13671875, 0.09814453, -0.15429688, 0.18847656,
-          0.18554688, 0.03637695, -0.18554688, 0.04785156, -0.11914062, -0.25, 0.09228516, 0.02270508, -0.25195312,
-          -0.07910156, 0.30273438, -0.00637817, 0.11767578, 0.11572266, 0.00421143, -0.33398438, 0.17382812,
-          -0.28125, 0.27539062, 0.12988281, 0.36132812, 0.19140625, -0.31445312, -0.11865234, 0.10595703, -0.0625,
-          0.08251953, 0.06079102, -0.18066406, 0.32226562, 0.15332031, 0.140625, 0.20800781, -0.24511719,
-          0.19824219, -0.09667969, 0.04638672, -0.01904297, 0.328125, 0.16894531, 0.16894531, 0.06640625,
-          0.01446533, 0.27929688, -0.33007812, 0.10839844, 0.00466919]
-
-jump = [0.05200195, 0.03613281, -0.10351562, 0.12890625, -0.00424194, -0.37304688, 0.03759766, 0.16894531,
-        0.09472656, 0.19335938, 0.15039062, -0.08203125, 0.20214844, -0.20214844, -0.21289062, 0.01708984,
-        0.27929688, 0.03295898, 0.01409912, -0.20800781, -0.05541992, 0.31054688, -0.03344727, 0.03613281,
-        -0.13574219, 0.05249023, -0.00231934, 0.06494141, -0.08935547, -0.06542969, -0.29296875, 0.09814453,
-        -0.03979492, -0.33007812, -0.02685547, -0.09277344, -0.05517578, 0.06445312, 0.12695312, 0.17285156, 0.25,
-        -0.07861328, 0.23925781, 0.05712891, -0.10449219, -0.24804688, -0.00196838, -0.17773438, 0.2421875, 0.09375,
-        0.22265625, -0.03735352, 0.11816406, 0.09667969, 0.1953125, -0.02758789, 0.24804688, -0.00218201,
-        -0.09570312, -0.23339844, -0.01696777, -0.17285156, -0.15332031, 0.01239014, 0.08984375, 0.05053711,
-        -0.11230469, -0.19238281, -0.18945312, 0.1171875, 0.04150391, -0.2734375, 0.18066406, 0.04077148,
-        0.10449219, 0.17285156, -0.07421875, 0.12109375, -0.15917969, 0.10888672, 0.10742188, -0.12060547, 0.109375,
-        0.01696777, 0.31835938, 0.03417969, 0.10888672, 0.10205078, -0.04858398, -0.11132812, 0.10302734,
-        0.18066406, -0.15136719, -0.10058594, 0.11767578, -0.00817871, 0.06933594, 0.39257812, 0.02087402,
-        0.01074219, 0.06738281, -0.0072937, 0.13378906, -0.12304688, 0.20214844, -0.05541992, -0.20117188,
-        -0.31054688, 0.125, 0.12890625, 0.15917969, -0.08984375, -0.05981445, 0.20117188, -0.02099609, 0.02783203,
-        -0.02539062, 0.16503906, -0.10791016, 0.13183594, -0.07470703, 0.01385498, -0.11816406, 0.06787109,
-        0.29296875, -0.01843262, 0.05151367, -0.08300781, -0.19140625, 0.06689453, -0.22363281, 0.33984375,
-        -0.05737305, -0.21289062, 0.09570312, 0.0402832, 0.2265625, -0.06396484, -0.24316406, 0.12353516,
-        -0.12890625, -0.01806641, -0.3359375, 0.10107422, -0.08203125, 0.30859375, -0.02331543, -0.33398438,
-        -0.02514648, 0.09863281, 0.09375, 0.14257812, -0.02307129, 0.10400391, 0.05737305, 0.13867188, 0.07080078,
-        0.16894531, -0.06542969, 0.06982422, -0.20214844, 0.06591797, 0.00741577, -0.265625, -0.04199219,
-        -0.00506592, 0.29101562, -0.19824219, 0.05541992, -0.10205078, -0.27539062, -0.15527344, 0.01989746,
-        -0.38085938, -0.10742188, 0.12988281, 0.11914062, -0.32421875, -0.09814453, 0.22753906, -0.05981445,
-        0.00415039, -0.14257812, -0.265625, 0.03125, -0.30078125, -0.03271484, 0.16894531, 0.06884766, -0.10888672,
-        0.39648438, -0.33007812, -0.07519531, 0.11181641, 0.07958984, -0.00463867, -0.07763672, 0.02734375,
-        -0.11621094, -0.04150391, 0.03125, -0.02807617, 0.02050781, -0.0267334, -0.02001953, -0.19628906,
-        -0.09521484, -0.52734375, -0.09130859, 0.07128906, -0.359375, -0.02441406, 0.03930664, 0.1875, -0.33007812,
-        0.08984375, 0.03515625, -0.17675781, 0.14160156, -0.203125, -0.22753906, 0.06933594, -0.06176758,
-        -0.07421875, 0.1171875, -0.18652344, 0.07714844, -0.06884766, 0.04638672, 0.0625, 0.22558594, -0.0213623,
-        -0.12597656, 0.14648438, -0.02172852, 0.16992188, -0.00393677, -0.14550781, 0.18359375, -0.11572266,
-        0.14550781, 0.20898438, -0.09960938, -0.01287842, 0.09814453, 0.06835938, -0.14160156, 0.08789062,
-        0.09423828, -0.26757812, -0.0378418, -0.16796875, -0.00300598, 0.07519531, 0.09375, 0.09179688, 0.15722656,
-        0.16210938, 0.03759766, 0.12792969, -0.00741577, -0.08154297, -0.06835938, 0.22753906, -0.01916504,
-        0.08056641, 0.20214844, 0.14160156, 0.07421875, 0.10253906, -0.11962891, 0.36523438, 0.25976562,
-        -0.15332031, 0.11914062, -0.24316406, -0.17480469, -0.20117188, 0.02392578, 0.0625, 0.08300781, 0.08447266,
-        -0.1953125, -0.00592041, -0.15820312, -0.17773438, -0.17285156, -0.06884766, -0.02990723, 0.05566406,
-        0.05078125, 0.18457031, -0.31054688, 0.03930664, -0.18066406, -0.33789062, -0.11083984, 0.10400391,
-        0.02453613, -0.05664062]
-
-move = [-0.061279297, 0.14355469, -0.2109375, 0.068847656, -0.18261719, -0.11230469, -0.049560547, -0.13867188,
-        0.11230469, 0.16210938, -0.084472656, -0.025268555, -0.05908203, -0.06640625, -0.14160156, -0.040771484,
-        0.0072631836, 0.076660156, -0.06347656, 0.0146484375, 0.107910156, 0.19824219, 0.064453125, -0.041992188,
-        0.110839844, 0.064453125, 0.07714844, 0.012939453, -0.07763672, 0.076660156, 0.03564453, 0.14550781,
-        -0.07373047, -0.20410156, 0.068359375, -0.16601562, 0.106933594, 0.13769531, -0.068359375, -0.048828125,
-        0.07470703, 0.011779785, 0.091308594, -0.10986328, -0.12695312, -0.10986328, -0.15625, -0.123046875,
-        -0.12109375, 0.10498047, 0.15039062, 0.049804688, 0.08105469, -0.03564453, 0.15917969, -0.06640625,
-        0.0035705566, -0.13574219, -0.0625, 0.039794922, -0.038330078, 0.0025634766, -0.18847656, -0.045898438,
-        -0.09082031, -0.119628906, -0.09814453, 0.14648438, -0.22167969, 0.14550781, -0.023925781, -0.033447266,
-        0.05493164, -0.123535156, -0.056396484, -0.07421875, -0.08203125, 0.046875, -0.10546875, -0.021362305,
-        0.20117188, -0.0008163452, 0.265625, 0.07910156, 0.37109375, 0.03564453, -0.080566406, 0.08300781,
-        0.03149414, 0.12988281, 0.21875, 0.09326172, -0.05859375, -0.1171875, 0.09033203, 0.07470703, -0.040527344,
-        0.21679688, -0.001663208, -0.051513672, -0.06298828, 0.11669922, 0.14648438, -0.018676758, 0.107421875,
-        -0.050048828, 0.12207031, -0.2578125, 0.021850586, -0.063964844, 0.20117188, -0.0071411133, 0.0049438477,
-        -0.032470703, 0.09082031, 0.05517578, 0.21289062, -0.025756836, 0.19726562, 0.04736328, -0.01574707,
-        0.06738281, -0.17089844, 0.1796875, -0.16015625, -0.010986328, -0.026977539, -0.22363281, -0.03491211,
-        -0.07080078, 0.09472656, 0.068359375, 0.18847656, 0.029418945, 0.16503906, -0.06640625, 0.07373047,
-        0.08642578, -0.13476562, 0.055664062, 0.12695312, -0.25585938, -0.19335938, -0.011657715, 0.11621094,
-        0.15039062, -0.072265625, -0.03149414, -0.06640625, -0.027709961, -0.022827148, 0.021972656, -0.001625061,
-        -0.0076904297, 0.0024719238, 0.010253906, -0.060546875, -0.042236328, -0.040527344, 0.060302734,
-        0.024291992, -0.014892578, 0.119628906, -0.12109375, -0.20214844, -0.13574219, 0.265625, -0.09667969,
-        0.18457031, -0.092285156, -0.09277344, -0.18164062, -0.03112793, -0.0012817383, 0.23339844, 0.007171631,
-        0.16992188, 0.0625, 0.18359375, 0.12451172, -0.17578125, -0.14453125, 0.104003906, -0.092285156, 0.19140625,
-        -0.11328125, 0.08154297, 0.28125, 0.21289062, -0.07373047, 0.1171875, -0.061767578, 0.31054688, 0.06933594,
-        -0.0046691895, -0.095703125, -0.087890625, 0.24023438, 0.114746094, -0.12158203, 0.022583008, -0.071777344,
-        0.12988281, 0.09423828, -0.075683594, 0.011291504, 0.17480469, -0.114746094, 0.2890625, -0.020141602,
-        -0.057617188, 0.114746094, 0.06689453, 0.25585938, -0.24902344, 0.05029297, 0.072265625, -0.012207031,
-        -0.09667969, -0.045654297, -0.06542969, -0.011291504, -0.06225586, -0.01574707, 0.017822266, -0.03466797,
-        0.04296875, -0.021484375, 0.08691406, 0.09375, 0.17089844, 0.09423828, 0.00049972534, 0.14746094,
-        0.08691406, 0.096191406, -0.39648438, -0.030029297, -0.009338379, 0.052734375, -0.012268066, -0.015197754,
-        -0.053955078, -0.29101562, -0.05029297, 0.16113281, -0.016723633, 0.020996094, 0.08984375, 0.12060547,
-        -0.022338867, 0.1328125, -0.171875, 0.109375, 0.17480469, 0.037597656, -0.00045967102, 0.23828125,
-        -0.20019531, 0.11425781, 0.09277344, 0.022460938, -0.08544922, 0.2578125, 0.23828125, 0.018310547,
-        0.14160156, -0.06640625, -0.14746094, 0.032226562, -0.02709961, 0.25390625, 0.140625, 0.024047852,
-        0.100097656, -0.080566406, -0.14746094, -0.08203125, -0.01159668, 0.07373047, -0.015625, 0.00065231323,
-        0.021972656, 0.21386719, 0.009643555, 0.009765625, -0.07763672, -0.0058288574, -0.064453125, 0.032958984,
-        -0.20507812, 0.32617188, -0.123535156, -0.006713867, 0.0018081665, 0.0055236816, 0.1875, 0.11816406,
-        0.03564453, -0.028076172]
-
-stop = [-0.05786133, 0.01318359, 0.11523438, 0.06982422, -0.30664062, -0.04467773, 0.04858398, 0.15234375,
-        0.07324219, -0.10009766, 0.15527344, -0.12158203, -0.00674438, 0.02819824, -0.17285156, 0.00075912,
-        -0.08496094, -0.06640625, 0.28125, -0.14648438, 0.17285156, 0.21191406, -0.21582031, 0.12695312, 0.11865234,
-        0.10205078, 0.09472656, 0.02612305, 0.21777344, -0.12060547, -0.0255127, -0.18164062, -0.33984375,
-        -0.11425781, -0.03564453, 0.01495361, 0.09277344, -0.10888672, 0.12890625, 0.14941406, 0.19140625,
-        0.01940918, 0.18457031, -0.17285156, -0.24902344, 0.11230469, -0.06982422, 0.0019989, 0.06689453,
-        0.21777344, 0.09619141, 0.26953125, 0.03466797, -0.09863281, -0.10107422, 0.01708984, -0.19140625,
-        -0.13085938, 0.08447266, -0.3828125, -0.0859375, -0.01538086, 0.05639648, 0.1328125, -0.00704956,
-        -0.05151367, -0.13378906, 0.05859375, -0.29492188, 0.23242188, -0.04174805, 0.06640625, 0.10595703,
-        0.07128906, -0.09619141, 0.00138855, -0.07128906, 0.08105469, 0.02661133, 0.16796875, -0.05395508,
-        0.11230469, 0.19433594, -0.26367188, 0.07714844, 0.16992188, 0.0177002, -0.02587891, 0.16503906,
-        -0.02636719, 0.03015137, -0.05249023, -0.00411987, -0.1484375, -0.1640625, -0.17675781, -0.08886719,
-        0.0201416, 0.05957031, -0.01501465, -0.07861328, 0.08691406, -0.01977539, 0.23730469, 0.12060547,
-        -0.21191406, 0.17578125, -0.15820312, 0.06396484, -0.02661133, 0.0378418, -0.1640625, -0.0559082,
-        -0.0456543, -0.0456543, -0.19726562, 0.03759766, 0.00120544, -0.06835938, -0.05712891, 0.10351562,
-        0.15136719, -0.12451172, -0.02709961, -0.00787354, -0.00717163, -0.06835938, -0.07080078, 0.3125,
-        -0.10058594, 0.04248047, -0.34960938, 0.14257812, -0.07177734, 0.01098633, -0.01391602, -0.01635742,
-        0.19140625, 0.01635742, 0.14648438, 0.20507812, -0.15820312, 0.06982422, -0.01049805, 0.01660156,
-        0.07714844, 0.08642578, -0.2109375, -0.06689453, -0.11669922, 0.18554688, 0.02404785, 0.03015137,
-        0.01538086, 0.05737305, 0.05444336, 0.08398438, -0.10205078, -0.24707031, -0.17089844, -0.02185059,
-        -0.01989746, -0.08886719, -0.23730469, -0.07470703, -0.09960938, 0.07666016, -0.30664062, 0.17578125,
-        -0.02355957, -0.15820312, -0.125, 0.12597656, -0.0703125, -0.06982422, 0.03857422, 0.17480469, 0.14355469,
-        -0.11181641, -0.16601562, -0.11572266, 0.01708984, 0.06933594, -0.0859375, -0.00396729, 0.16699219,
-        0.16210938, 0.06689453, -0.12060547, 0.09619141, 0.17871094, 0.07666016, 0.13085938, 0.22753906, 0.01928711,
-        0.00976562, 0.07275391, -0.09667969, -0.08642578, -0.16210938, 0.08154297, -0.16992188, -0.01928711,
-        0.20605469, 0.14941406, 0.12451172, -0.13085938, -0.07128906, 0.12402344, -0.14746094, 0.15820312,
-        0.21679688, -0.265625, 0.04272461, -0.01080322, 0.04907227, 0.1640625, -0.171875, -0.16796875, 0.07714844,
-        0.05981445, 0.04736328, 0.11572266, -0.11425781, 0.02001953, -0.04223633, 0.10595703, 0.11083984,
-        0.05786133, 0.11767578, 0.27539062, -0.05786133, -0.04125977, 0.08544922, 0.08203125, -0.20605469,
-        -0.08740234, 0.08300781, 0.08251953, 0.09765625, -0.03442383, 0.16015625, -0.17089844, -0.23242188,
-        0.00204468, 0.06933594, 0.05004883, 0.03637695, 0.00793457, -0.25585938, 0.3046875, -0.12353516, 0.06494141,
-        -0.02807617, 0.02282715, -0.27148438, 0.10693359, -0.00372314, 0.03955078, -0.05200195, 0.10839844,
-        0.14648438, 0.15429688, 0.00165558, -0.01123047, -0.10644531, -0.17578125, 0.07617188, -0.01379395,
-        -0.32421875, 0.14941406, 0.29882812, 0.24609375, 0.03027344, 0.234375, 0.03015137, -0.25585938, -0.28320312,
-        0.05517578, -0.27539062, 0.11669922, 0.0378418, 0.18066406, -0.01275635, -0.23535156, 0.13183594,
-        -0.22851562, -0.08886719, 0.19921875, -0.203125, 0.10009766, 0.171875, -0.11328125, 0.06445312, -0.11572266,
-        0.0480957, -0.00482178, 0.08642578, 0.02990723, 0.0078125]
-
-right = [1.45507812e-01, -1.89208984e-02, 9.61914062e-02, 1.28906250e-01, -1.22070312e-01, -2.01171875e-01,
-         2.05078125e-01, -1.28906250e-01, -5.32226562e-02, -3.73535156e-02, -1.19140625e-01, -8.10546875e-02,
-         4.24804688e-02, 7.03125000e-02, -1.96289062e-01, 4.76074219e-02, 9.17968750e-02, 4.24804688e-02,
-         3.17382812e-02, -1.67968750e-01, 4.95605469e-02, 1.43554688e-01, -1.70898438e-02, 7.47070312e-02,
-         1.00585938e-01, 2.27050781e-02, -3.78417969e-02, 2.51464844e-02, 8.00781250e-02, -6.53076172e-03,
-         -3.46679688e-02, 1.06933594e-01, 4.12597656e-02, 1.42822266e-02, -3.19824219e-02, 2.20947266e-02,
-         7.81250000e-02, 3.24707031e-02, -1.10351562e-01, 3.00598145e-03, -8.39843750e-02, -1.04492188e-01,
-         2.40234375e-01, -1.70898438e-01, -4.41894531e-02, 1.58203125e-01, 6.25000000e-02, -9.37500000e-02,
-         9.47265625e-02, -1.34765625e-01, -1.68945312e-01, 1.84570312e-01, 5.90820312e-02, -1.21093750e-01,
-         -1.62109375e-01, 5.98144531e-02, -4.61425781e-02, -9.71679688e-02, -9.61914062e-02, -1.28906250e-01,
-         -1.60156250e-01, 9.64355469e-03, -5.98144531e-02, -2.14843750e-01, -8.97216797e-03, -1.07421875e-01,
-         8.15429688e-02, 6.17675781e-02, -7.91015625e-02, 8.10546875e-02, 1.35742188e-01, -8.48388672e-03,
-         1.07421875e-01, -4.71191406e-02, -1.54296875e-01, -9.57031250e-02, 1.89453125e-01, 2.92968750e-02,
-         -1.83593750e-01, 2.47070312e-01, 7.56835938e-02, 1.27929688e-01, 1.03515625e-01, -4.05273438e-02,
-         9.13085938e-02, -1.74804688e-01, -4.17480469e-02, 1.57226562e-01, 7.42187500e-02, -7.91015625e-02,
-         -1.38671875e-01, 1.89453125e-01, 5.79833984e-03, -5.05371094e-02, -1.70898438e-01, -1.74804688e-01,
-         -2.41088867e-03, -3.68652344e-02, -3.63769531e-02, 8.54492188e-02, -4.46777344e-02, -8.60595703e-03,
-         1.46484375e-01, 4.54101562e-02, -1.31835938e-02, -2.75878906e-02, -7.51953125e-02, -3.95507812e-02,
-         5.61523438e-02, -1.41601562e-01, -5.44433594e-02, -1.55273438e-01, -1.97265625e-01, 1.02050781e-01,
-         2.08740234e-02, 1.45507812e-01, 1.18652344e-01, 6.83593750e-02, -8.83789062e-02, 2.40478516e-02,
-         -1.08398438e-01, 6.98242188e-02, -4.46777344e-02, 2.46093750e-01, -1.56250000e-01, -1.87500000e-01,
-         -1.63085938e-01, -1.37695312e-01, -8.25195312e-02, 1.26953125e-01, -1.06445312e-01, -1.15356445e-02,
-         -9.61914062e-02, 3.08837891e-02, 1.58691406e-02, -4.04296875e-01, 1.10351562e-01, 2.79296875e-01,
-         2.27539062e-01, 9.91821289e-04, 4.93164062e-02, 1.08398438e-01, 1.88476562e-01, 8.34960938e-02,
-         1.49536133e-03, 4.44335938e-02, 3.20434570e-03, -2.57568359e-02, 7.27539062e-02, -8.20312500e-02,
-         1.17187500e-01, 1.70898438e-01, -8.49609375e-02, 1.65039062e-01, 1.84570312e-01, 1.25000000e-01,
-         -1.56250000e-01, -2.05078125e-01, 8.54492188e-02, -3.11279297e-02, -1.80664062e-01, -2.61230469e-02,
-         1.61132812e-01, -3.07617188e-02, 3.02734375e-02, -1.68945312e-01, -7.71484375e-02, -9.52148438e-02,
-         -1.36718750e-01, -7.61718750e-02, -1.84570312e-01, -2.67333984e-02, -1.61743164e-03, 1.03759766e-02,
-         2.42614746e-03, 3.07617188e-02, 1.04980469e-01, -1.45507812e-01, -1.32812500e-01, 4.61578369e-04,
-         -2.71484375e-01, -1.02050781e-01, 3.75976562e-02, -1.41601562e-01, 3.19824219e-02, -2.55126953e-02,
-         -6.49414062e-02, 7.81250000e-02, 1.86523438e-01, -2.88085938e-02, 9.46044922e-03, 2.71484375e-01,
-         5.78613281e-02, -1.21093750e-01, -2.03857422e-02, -3.44238281e-02, -1.11328125e-01, 2.81982422e-02,
-         1.08886719e-01, -1.35498047e-02, -1.05957031e-01, -4.54101562e-02, 3.41796875e-02, -2.78320312e-02,
-         3.83300781e-02, -6.98242188e-02, -4.05273438e-02, -2.46582031e-02, 2.05078125e-02, 5.32226562e-02,
-         -1.04370117e-02, 6.44683838e-04, -6.93359375e-02, 1.04003906e-01, 2.74658203e-02, -6.83593750e-03,
-         2.16796875e-01, 6.40869141e-03, -2.53906250e-02, 1.03759766e-02, -1.88476562e-01, -9.88769531e-03,
-         -8.05664062e-02, -1.78710938e-01, 1.69921875e-01, -3.36914062e-02, 8.49609375e-02, 3.95507812e-02,
-         -7.44628906e-03, 1.03515625e-01, 1.35498047e-02, -1.05468750e-01, -9.42382812e-02, 4.76074219e-02,
-         5.05371094e-02, 1.55273438e-01, -2.27050781e-02, 1.46484375e-02, 3.03955078e-02, 2.73437500e-01,
-         4.83398438e-02, 2.11181641e-02, -1.21582031e-01, -2.41210938e-01, 5.34667969e-02, 5.93261719e-02,
-         6.20117188e-02, 1.12792969e-01, 1.46484375e-01, 3.24707031e-02, -2.50244141e-02, -2.16796875e-01,
-         1.67236328e-02, 1.39160156e-02, 2.26562500e-01, -2.30468750e-01, -4.39453125e-02, 1.55029297e-02,
-         -9.03320312e-02, -1.08886719e-01, -1.48437500e-01, -2.40325928e-04, -1.20117188e-01, 8.78906250e-02,
-         1.22558594e-01, 1.12792969e-01, 9.81445312e-02, -4.34570312e-02, -6.93359375e-02, 5.81054688e-02,
-         1.77001953e-03, 1.87500000e-01, 2.55859375e-01, 2.45666504e-03, -1.29882812e-01, -4.05273438e-02,
-         -7.03125000e-02, -1.29882812e-01, -1.04003906e-01, 8.93554688e-02, 8.34960938e-02, -9.22851562e-02,
-         2.27050781e-02, 1.60156250e-01, -3.25012207e-03, 1.44531250e-01, -2.45361328e-02, -1.12792969e-01,
-         -9.47265625e-02, -5.29785156e-02, 6.29882812e-02, 1.20605469e-01, -4.10156250e-02, 1.72119141e-02,
-         1.25000000e-01, 1.02539062e-01, 1.85546875e-01, -4.49218750e-02, -5.39550781e-02, 3.00292969e-02]
-
-left = [2.33398438e-01, 7.32421875e-02, 4.44335938e-02, -1.02539062e-02, -5.56640625e-02, -1.76757812e-01,
-        1.73339844e-02, -3.12500000e-01, 1.69921875e-01, 1.66015625e-02, -4.44335938e-02, -1.05468750e-01,
-        6.25000000e-02, 1.65039062e-01, -3.68652344e-02, -1.10351562e-01, 2.96630859e-02, 1.17675781e-01,
-        -3.24707031e-02, -2.40478516e-02, 1.28906250e-01, 2.79296875e-01, 5.59082031e-02, 2.20703125e-01,
-        4.90722656e-02, 2.22167969e-02, -5.15136719e-02, -4.95605469e-02, 1.22558594e-01, -5.68847656e-02,
-        2.72216797e-02, 6.04248047e-03, -1.60156250e-01, -5.20019531e-02, -1.46484375e-01, -3.29589844e-02,
-        4.66308594e-02, 1.25976562e-01, -1.63085938e-01, 1.00097656e-01, -8.34960938e-02, -1.80664062e-01,
-        1.04003906e-01, -1.45507812e-01, 6.49414062e-02, 1.69921875e-01, 4.15039062e-03, -1.06445312e-01,
-        1.13281250e-01, -8.44726562e-02, -1.88476562e-01, 6.49414062e-02, -6.78710938e-02, -1.25976562e-01,
-        -2.49023438e-02, 1.29882812e-01, -6.20117188e-02, 8.20312500e-02, -4.76074219e-02, -4.51660156e-02,
-        -7.95898438e-02, 1.50390625e-01, -1.25976562e-01, -2.17773438e-01, -1.52343750e-01, -1.37695312e-01,
-        1.67968750e-01, 7.71484375e-02, -6.68945312e-02, 4.17480469e-02, 1.50390625e-01, 8.98437500e-02,
-        -3.73535156e-02, 9.21630859e-03, -2.41210938e-01, -1.54296875e-01, -1.62353516e-02, 9.15527344e-03,
-        -1.82617188e-01, 1.77001953e-02, 1.70898438e-01, -2.73437500e-02, 3.78417969e-02, -7.17773438e-02,
-        7.08007812e-03, -1.49414062e-01, 1.89971924e-03, -6.73828125e-02, 1.37939453e-02, -7.17163086e-03,
-        -7.81250000e-02, 5.41992188e-02, 1.90429688e-01, 4.05273438e-02, -1.21582031e-01, -1.91406250e-01,
-        4.76074219e-02, 8.93554688e-02, -4.49218750e-02, 6.44531250e-02, -4.02832031e-02, -3.78417969e-02,
-        4.24804688e-02, 1.44531250e-01, 7.81250000e-02, -1.04003906e-01, 1.65039062e-01, -5.76171875e-02,
-        -2.65502930e-03, -1.59179688e-01, 1.75781250e-01, -7.66601562e-02, -2.51464844e-02, -2.53906250e-02,
-        -1.00097656e-01, 1.23535156e-01, 1.22558594e-01, -5.66406250e-02, 1.86523438e-01, 2.29492188e-01,
-        -1.19628906e-01, 7.12890625e-02, -7.95898438e-02, 1.66015625e-01, 3.17382812e-02, -1.01562500e-01,
-        -1.57470703e-02, -3.93066406e-02, -6.78710938e-02, 1.72851562e-01, 3.97949219e-02, 3.56674194e-04,
-        2.17285156e-02, 2.90527344e-02, -1.94335938e-01, -7.27539062e-02, 5.24902344e-03, 1.70898438e-01,
-        1.16577148e-02, -6.39648438e-02, -1.39648438e-01, 7.56835938e-02, 1.27929688e-01, 7.76367188e-02,
-        -8.72802734e-03, 2.15820312e-01, -2.89062500e-01, -8.10546875e-02, -1.06445312e-01, -1.02539062e-01,
-        7.95898438e-02, 9.91210938e-02, -2.63671875e-02, 8.93554688e-02, 1.54296875e-01, 1.45507812e-01,
-        -1.32812500e-01, -2.24609375e-01, 7.03125000e-02, -1.00097656e-02, -2.26562500e-01, 5.37109375e-02,
-        -2.30712891e-02, 5.17578125e-02, 4.61425781e-02, -1.13281250e-01, 9.03320312e-02, -1.44042969e-02,
-        -1.13769531e-01, -2.01171875e-01, -2.61718750e-01, -1.01318359e-02, -1.00585938e-01, -1.09375000e-01,
-        2.31933594e-02, 2.29492188e-02, 3.88183594e-02, -5.83496094e-02, 1.75781250e-02, 3.88183594e-02,
-        -1.00585938e-01, 9.32617188e-02, 2.39257812e-02, 7.12890625e-02, -1.62109375e-01, 5.39550781e-02,
-        5.12695312e-02, 1.05957031e-01, 1.95312500e-01, 3.83300781e-02, 4.27246094e-02, -7.37304688e-02,
-        1.95312500e-01, 9.27734375e-02, -4.22363281e-02, 3.59375000e-01, 1.06445312e-01, -4.71191406e-02,
-        8.11767578e-03, 1.48773193e-03, -9.91210938e-02, -1.59179688e-01, -1.20605469e-01, -4.02832031e-02,
-        1.66992188e-01, 6.56127930e-03, -6.34765625e-02, 2.00195312e-02, 8.05664062e-02, -1.87500000e-01,
-        -5.83496094e-02, -1.79687500e-01, 8.78906250e-02, 1.32812500e-01, 5.20019531e-02, -4.00390625e-02,
-        -6.12792969e-02, 3.29589844e-02, -1.22558594e-01, 5.06591797e-03, -7.91015625e-02, 1.89208984e-02,
-        -4.17480469e-02, -7.76367188e-02, 1.95312500e-01, -1.10839844e-01, 1.36718750e-02, 7.08007812e-02,
-        -9.13085938e-02, 5.15747070e-03, 1.47460938e-01, 5.34057617e-03, 1.34887695e-02, 1.68457031e-02,
-        5.44433594e-02, 4.27246094e-02, 1.44531250e-01, -1.76757812e-01, 2.08740234e-02, 8.00781250e-02,
-        -3.63769531e-02, -1.35498047e-02, 8.85009766e-03, -2.46093750e-01, -4.85839844e-02, 1.20605469e-01,
-        1.31835938e-01, -1.26953125e-02, 1.29882812e-01, 8.98437500e-02, 1.00585938e-01, -3.37890625e-01,
-        4.34570312e-02, 1.32812500e-01, 1.36718750e-01, -2.44140625e-01, 1.57226562e-01, -3.36914062e-02,
-        -1.49414062e-01, 2.19726562e-02, -2.05078125e-01, 8.93554688e-02, -4.02832031e-02, 1.13281250e-01,
-        -2.17285156e-02, 2.78320312e-02, 1.38671875e-01, 1.22070312e-01, 5.81054688e-02, 9.32617188e-02,
-        1.25000000e-01, -4.44335938e-02, -1.03027344e-01, -2.09960938e-01, -4.05273438e-02, -2.91748047e-02,
-        -5.49316406e-02, -6.39648438e-02, 3.39355469e-02, 1.29882812e-01, 1.21093750e-01, -1.45507812e-01,
-        -6.83593750e-02, 7.32421875e-02, 9.88769531e-03, 1.36718750e-02, -4.00390625e-02, 8.49609375e-02,
-        -2.18750000e-01, -3.93066406e-02, -1.46484375e-01, 2.49023438e-02, -6.05468750e-02, 9.61914062e-02,
-        1.02050781e-01, -9.09423828e-03, 8.54492188e-02, -1.62109375e-01, -1.23535156e-01, -3.05175781e-02]
-
-dont = [1.04980469e-01, -3.29589844e-02, 1.24023438e-01, 2.29492188e-01, -8.34960938e-02, 9.17968750e-02,
-        1.77001953e-02, -2.38281250e-01, 1.00585938e-01, -4.32128906e-02, -2.00195312e-01, -2.55859375e-01,
-        -2.83203125e-01, 1.23291016e-02, -4.95605469e-02, 1.71875000e-01, 4.56542969e-02, 3.53515625e-01,
-        -1.61132812e-01, -1.62109375e-01, -1.80664062e-01, -1.74804688e-01, 3.98437500e-01, -4.61425781e-02,
-        -5.00488281e-02, 5.98144531e-02, -1.96289062e-01, 3.27148438e-02, -1.70898438e-01, -1.89453125e-01,
-        1.06201172e-02, 1.82617188e-01, -2.01171875e-01, -1.50390625e-01, -1.55273438e-01, 1.51367188e-01,
-        -1.39648438e-01, 2.36328125e-01, 9.27734375e-03, 1.25976562e-01, 6.37817383e-03, -2.00195312e-01,
-        4.08203125e-01, 6.20117188e-02, 1.97753906e-02, -1.00097656e-01, 1.56250000e-01, -1.80664062e-01,
-        -6.25000000e-02, -3.28125000e-01, -2.20703125e-01, 1.05957031e-01, 1.20605469e-01, 9.22851562e-02,
-        9.27734375e-02, -9.58251953e-03, -2.27539062e-01, 1.14257812e-01, 1.08398438e-01, -8.49609375e-02,
-        7.27539062e-02, 8.30078125e-02, -2.69531250e-01, -2.31445312e-01, -1.27929688e-01, -3.53515625e-01,
-        -1.87500000e-01, 1.25976562e-01, -1.07910156e-01, -8.78906250e-03, 2.87109375e-01, 4.37500000e-01,
-        -1.00585938e-01, 9.17968750e-02, -6.09375000e-01, -2.10937500e-01, -2.45361328e-02, 1.58203125e-01,
-        4.24804688e-02, 8.15429688e-02, -3.82812500e-01, 1.52343750e-01, -1.41601562e-01, -1.59179688e-01,
-        -1.36718750e-01, -3.58886719e-02, -1.10839844e-01, 1.20605469e-01, 1.15722656e-01, 9.96093750e-02,
-        8.88671875e-02, 8.05664062e-02, -1.95312500e-01, -1.28906250e-01, -1.38671875e-01, -5.95703125e-02,
-        6.68945312e-02, 3.93676758e-03, 3.96484375e-01, 1.70898438e-01, -6.83593750e-02, 2.22656250e-01,
-        1.11328125e-01, 1.16210938e-01, -5.39550781e-02, 1.62109375e-01, -1.73828125e-01, -1.53198242e-02,
-        1.89453125e-01, -8.34960938e-02, -2.57812500e-01, -2.63671875e-01, -1.75781250e-01, 1.08398438e-01,
-        2.19726562e-01, -9.76562500e-02, 2.68554688e-02, -2.20703125e-01, -1.40625000e-01, -6.03027344e-02,
-        7.56835938e-02, 1.15722656e-01, -3.85742188e-02, 1.22558594e-01, 2.17773438e-01, -1.28906250e-01,
-        -4.08203125e-01, 7.56835938e-02, 8.64257812e-02, -2.92968750e-01, -1.54296875e-01, -1.07910156e-01,
-        7.37304688e-02, -9.81445312e-02, -1.66992188e-01, -2.37304688e-01, -1.65039062e-01, 6.10351562e-02,
-        4.61425781e-02, 4.17480469e-02, 1.49414062e-01, -2.81250000e-01, 2.89062500e-01, -1.69921875e-01,
-        -6.73828125e-02, -7.29370117e-03, 8.78906250e-02, -2.15820312e-01, 2.50000000e-01, -1.68945312e-01,
-        2.19726562e-01, -9.32617188e-02, -1.25976562e-01, -3.86718750e-01, -2.71484375e-01, 2.79541016e-02,
-        1.26953125e-01, 1.76757812e-01, -9.42382812e-02, 5.51757812e-02, 1.22558594e-01, 1.49414062e-01,
-        -2.26562500e-01, -7.08007812e-02, 2.66113281e-02, -3.49609375e-01, 5.41992188e-02, -1.33666992e-02,
-        -6.39648438e-02, -1.48315430e-02, -2.81250000e-01, 3.49121094e-02, -2.28271484e-02, 1.14257812e-01,
-        -8.98437500e-02, 7.22656250e-02, 2.79296875e-01, -1.93359375e-01, 1.42578125e-01, -1.32812500e-01,
-        2.56347656e-03, 1.07421875e-01, 7.03125000e-02, 1.34765625e-01, 3.90625000e-02, 1.70135498e-03,
-        -1.80664062e-01, 5.29785156e-02, 6.03027344e-02, 6.83593750e-02, 1.70898438e-01, 3.12500000e-02,
-        -1.45507812e-01, -1.63085938e-01, 4.76562500e-01, -1.50756836e-02, -3.11279297e-02, -8.15429688e-02,
-        -1.49414062e-01, -1.77734375e-01, -1.76757812e-01, 1.98242188e-01, -2.41210938e-01, -3.93066406e-02,
-        -1.43554688e-01, -7.91015625e-02, -5.46875000e-02, -1.47460938e-01, -1.36718750e-02, 2.22167969e-02,
-        6.88476562e-02, 3.14453125e-01, -2.22656250e-01, -1.72851562e-01, -1.43554688e-01, -1.17187500e-01,
-        3.14453125e-01, -3.22265625e-01, -1.20605469e-01, -1.31835938e-01, -3.22265625e-01, -1.12304688e-01,
-        -2.34375000e-02, 1.35742188e-01, -4.83398438e-02, -2.50000000e-01, 1.78710938e-01, -1.10839844e-01,
-        -2.59765625e-01, 7.01904297e-03, 2.06054688e-01, -2.74658203e-03, 3.05175781e-02, 1.32812500e-01,
-        1.61132812e-02, 2.15820312e-01, 1.92382812e-01, -6.93359375e-02, 8.44726562e-02, -3.01513672e-02,
-        1.48437500e-01, 1.77734375e-01, 1.17187500e-01, -5.15136719e-02, -2.73437500e-01, 1.81640625e-01,
-        -1.00097656e-01, 3.04687500e-01, -3.32031250e-02, -1.67968750e-01, 2.11914062e-01, 1.78710938e-01,
-        2.81250000e-01, 2.27539062e-01, 2.57812500e-01, -1.66015625e-01, 1.80664062e-02, 8.69140625e-02,
-        9.21630859e-03, -6.68945312e-02, -4.15039062e-02, -3.49121094e-02, 3.39355469e-02, -1.27929688e-01,
-        -1.10839844e-01, -6.59179688e-02, -3.47656250e-01, 2.06298828e-02, -4.54101562e-02, 9.25064087e-05,
-        -1.83593750e-01, -7.81250000e-02, 1.64062500e-01, 2.47070312e-01, -2.90527344e-02, -1.22680664e-02,
-        3.61328125e-02, -1.29882812e-01, -2.61718750e-01, 1.78710938e-01, -2.35595703e-02, -1.24511719e-01,
-        -9.86328125e-02, 2.47070312e-01, -1.56250000e-01, 8.05664062e-02, 1.09863281e-01, 1.44042969e-02,
-        2.34375000e-02, -2.10937500e-01, 8.39843750e-02, 3.00781250e-01, -1.49414062e-01, 1.69921875e-01,
-        -2.65625000e-01, -1.62109375e-01, -1.25000000e-01, -1.38671875e-01, -1.70898438e-01, 8.05664062e-02]
-
-forward = [0.041015625, 0.034423828, 0.24609375, 0.083496094, 0.046142578, -0.08105469, 0.17675781, -0.17480469,
-           0.14941406, 0.059814453, -0.017822266, 0.16308594, -0.011413574, 0.14550781, 0.12451172, -0.17089844,
-           0.14257812, 0.037109375, 0.052001953, -0.14941406, -0.050048828, 0.021362305, 0.025512695, -0.025024414,
-           0.033691406, 0.29882812, 0.04321289, -0.09667969, 0.02319336, 0.15234375, 0.15332031, 0.029174805,
-           0.08105469, 0.15039062, -0.10986328, -0.103515625, -0.040527344, 0.09814453, -0.1328125, 0.030883789,
-           0.032226562, -0.06542969, 0.087402344, 0.18457031, 0.14648438, -0.18359375, -0.10595703, -0.061279297,
-           0.12011719, -0.021850586, 0.171875, 0.21386719, -0.13867188, -0.057373047, -0.106933594, 0.18847656,
-           0.17871094, -0.05493164, 0.009338379, -0.03491211, -0.32421875, -0.12158203, -0.33789062, -0.11328125,
-           -0.095214844, 0.16113281, 0.21582031, 0.359375, -0.0029907227, 0.36523438, -0.13769531, -0.26757812,
-           0.0073547363, -0.053955078, 0.036621094, -0.020507812, 0.15039062, 0.028564453, 0.27734375, 0.16503906,
-           -0.0049438477, 0.03857422, 0.15527344, -0.18359375, 0.42382812, -0.16796875, -0.29492188, 0.044189453,
-           0.421875, 0.16015625, 0.1328125, 0.14257812, 0.0005607605, -0.14257812, 0.21289062, -0.057861328,
-           0.12597656, -0.05859375, -0.088378906, -0.103515625, -0.04345703, -0.041015625, 0.33789062, 0.095703125,
-           -0.13867188, -0.14746094, 0.16308594, -0.096191406, 0.09863281, 0.04711914, -0.07324219, 0.265625,
-           0.12060547, 0.17578125, 0.109375, 0.10107422, 0.17480469, 0.032958984, 0.15039062, 0.07910156,
-           0.01928711, -0.010864258, -0.16210938, 0.123046875, -0.27148438, -0.0625, -0.38476562, 0.024902344,
-           -0.12695312, 0.10205078, -0.21972656, -0.13867188, -0.11376953, 0.09814453, -0.15917969, 0.22851562,
-           0.27539062, 0.18457031, 0.052246094, 0.51171875, -0.02734375, -0.033691406, 0.0029907227, 0.1328125,
-           -0.055664062, -0.114746094, 0.0018310547, 0.029663086, 0.037353516, 0.092285156, 0.26367188, 0.21191406,
-           -0.21191406, 0.25585938, 0.2421875, 0.46484375, 0.014160156, -0.010559082, 0.12597656, 0.06689453,
-           -0.028076172, 0.13476562, 0.15136719, 0.19140625, 0.20214844, -0.048339844, 0.057617188, 0.043701172,
-           -0.03930664, 0.005554199, 0.027954102, -0.047607422, 0.042236328, 0.01361084, 0.15917969, -0.111328125,
-           0.27929688, 0.052734375, 0.031982422, 0.08496094, 0.0006790161, -0.0074768066, 0.15527344, -0.04663086,
-           -0.053955078, -0.18554688, 0.0045166016, 0.22363281, 0.0107421875, 0.04663086, 0.063964844, 0.14648438,
-           0.10449219, -0.16894531, 0.07324219, 0.1171875, -0.10498047, 0.20214844, -0.057373047, -0.24609375,
-           -0.044189453, -0.19335938, 0.18554688, 0.103027344, -0.09423828, -0.083984375, 0.16601562, -0.03112793,
-           0.044921875, 0.15136719, -0.0066223145, 0.07128906, 0.024169922, 0.12109375, -0.06225586, 0.03491211,
-           0.029541016, 0.03930664, -0.0007362366, 0.04663086, -0.06933594, -0.07421875, -0.16796875, 0.079589844,
-           0.09082031, -0.16308594, -0.036376953, 0.076171875, 0.13671875, -0.05908203, 0.125, 0.14355469,
-           0.14648438, -0.03930664, -0.10595703, 0.0023498535, -0.12109375, 0.07910156, 0.06738281, 0.3671875,
-           -0.16210938, 0.10839844, -0.17089844, -0.08300781, 0.08154297, 0.21679688, -0.08984375, -0.25195312,
-           -0.016601562, 0.122558594, -0.026367188, 0.100097656, 0.05102539, -0.022216797, -0.1328125, -0.13476562,
-           0.075683594, 0.18847656, -0.40039062, -0.16601562, 0.009399414, 0.056640625, -0.010925293, -0.07910156,
-           0.1875, 0.17089844, -0.008483887, 0.0099487305, -0.21777344, -0.21289062, 0.11767578, 0.19726562,
-           0.1953125, -0.07910156, 0.23242188, 0.079589844, -0.041015625, -0.19042969, 0.002029419, -0.13867188,
-           -0.23925781, -0.09667969, -0.15234375, 0.15722656, -0.0015487671, 0.24609375, -0.14648438, -0.22167969,
-           0.12695312, -0.09765625, 0.09277344, 0.09326172, -0.018798828, 0.007232666, -0.23730469, 0.18457031,
-           0.07910156, 0.3046875, -0.1953125, -0.20214844]
-
-foward = [0.14160156, 0.1796875, 0.21582031, -0.02368164, -0.064941406, 0.03540039, 0.24707031, -0.076171875,
-          0.02355957, 0.080078125, 0.0047912598, 0.040039062, -0.13183594, 0.20214844, 0.24804688, 0.07324219,
-          0.13476562, 0.046142578, 0.05126953, -0.2734375, 0.04638672, 0.1484375, 0.2421875, -0.109375, -0.037109375,
-          0.22070312, -0.07373047, 0.0007324219, 0.030517578, 0.140625, 0.13769531, 0.23828125, -0.021240234,
-          0.020019531, -0.23339844, -0.22558594, -0.071777344, 0.20800781, -0.25195312, 0.06738281, -0.017578125,
-          -0.29882812, 0.28125, 0.328125, 0.07324219, -0.14160156, -0.140625, -0.05078125, -0.09667969, -0.03955078,
-          0.27539062, 0.12695312, 0.064941406, -0.14550781, -0.018066406, 0.1328125, -0.003768921, 0.07421875,
-          0.21582031, 0.0025177002, -0.30859375, -0.052978516, -0.45117188, -0.0061035156, -0.041259766, 0.14160156,
-          0.015319824, 0.16308594, -0.059570312, 0.37304688, 0.018920898, -0.08886719, -0.05102539, -0.07470703,
-          -0.16699219, -0.060546875, 0.16210938, 0.09375, 0.19042969, 0.10253906, 0.032958984, 0.044921875, 0.08496094,
-          -0.19921875, 0.52734375, -0.001953125, -0.25, 0.16503906, 0.41601562, 0.18164062, -0.059570312, 0.05126953,
-          -0.064453125, -0.13867188, 0.022705078, 0.091796875, 0.20507812, -0.06542969, 0.080566406, -0.14257812,
-          -0.17675781, 0.18652344, 0.29492188, 0.051757812, 0.09033203, -0.19042969, 0.03491211, -0.18066406,
-          0.068359375, -0.095214844, -0.12792969, 0.19628906, 0.05834961, 0.15527344, -0.005065918, 0.07421875,
-          0.17871094, 0.076660156, 0.012390137, -0.06201172, 0.030151367, -0.032714844, -0.030761719, 0.017700195,
-          -0.15625, 0.014465332, -0.39257812, -0.029174805, -0.22070312, 0.13671875, -0.13085938, -0.13769531,
-          0.21386719, -0.022583008, -0.29296875, 0.15722656, 0.07910156, 0.13183594, -0.043701172, 0.44335938,
-          0.13574219, -0.033203125, -0.083984375, 0.17773438, -0.41601562, -0.06982422, 0.02331543, 0.03491211,
-          0.003616333, -0.096191406, 0.19238281, 0.15039062, -0.23339844, 0.09863281, 0.08935547, 0.25195312,
-          0.10449219, 0.06542969, 0.18066406, 0.005706787, 0.04321289, -0.041992188, 0.07128906, 0.06298828, 0.18847656,
-          -0.08984375, 0.10205078, 0.061035156, 0.095214844, 0.18945312, -0.061035156, -0.068359375, -0.042236328,
-          0.21777344, 0.16796875, 0.002609253, 0.32617188, -0.16894531, 0.06591797, 0.099609375, -0.10888672,
-          -0.099121094, 0.10253906, 0.059570312, -0.056152344, 0.13476562, -0.028808594, 0.25390625, 0.023071289,
-          -0.18554688, 0.21484375, 0.071777344, 0.075683594, -0.18261719, 0.11425781, 0.06933594, -0.06933594,
-          0.20703125, 0.03930664, -0.05883789, -0.38671875, -0.3046875, 0.21191406, -0.12158203, -0.118652344,
-          -0.17089844, -0.09667969, 0.05517578, 0.11230469, 0.3125, 0.021728516, 0.059814453, 0.023071289, 0.013916016,
-          -0.095703125, -0.045166016, 0.19042969, -0.041992188, -0.06738281, 0.17871094, -0.25585938, -0.04736328,
-          -0.067871094, 0.14257812, 0.05810547, -0.06640625, -0.004547119, 0.15722656, -0.125, -0.005493164,
-          0.119140625, 0.03857422, 0.068359375, -0.15820312, -0.04248047, 0.08496094, -0.03491211, -0.15722656,
-          0.11425781, 0.31445312, -0.048828125, 0.25, -0.16015625, 0.024047852, 0.0078125, 0.24414062, -0.20507812,
-          -0.091796875, -0.091796875, 0.23828125, -0.021484375, 0.36523438, -0.049560547, 0.17480469, -0.095703125,
-          -0.24902344, 0.104003906, 0.055664062, -0.114746094, -0.19433594, -0.16113281, -0.009460449, 0.015258789,
-          -0.20898438, 0.23339844, 0.06347656, -0.08886719, 0.15527344, -0.1953125, -0.11767578, 0.060058594, 0.1328125,
-          0.33203125, 0.092285156, 0.2890625, 0.13476562, -0.125, -0.2734375, 0.072753906, -0.024902344, -0.1875,
-          -0.0032043457, -0.10839844, 0.14160156, 0.05102539, 0.25390625, -0.059814453, -0.12597656, 0.23632812,
-          -0.122558594, -0.061523438, -0.028076172, 0.016113281, 0.12988281, -0.123535156, 0.06542969, 0.03955078,
-          0.34570312, -0.37109375, 0.011413574]
-
-backward = [0.12402344, -0.20996094, 0.27148438, 0.1640625, -0.3515625, -0.17578125, 0.16894531, -0.24511719,
-            -0.079589844, 0.16796875, 0.072265625, 0.02355957, 0.27929688, 0.20507812, -0.12597656, 0.010681152,
-            0.004425049, -0.044921875, 0.18066406, -0.103515625, 0.13574219, 0.026977539, 0.05029297, 0.13867188,
-            0.09326172, -0.1015625, -0.296875, -0.0078125, 0.35742188, 0.10986328, -0.33398438, 0.16503906,
-            0.09082031, 0.24414062, -0.084472656, 0.11279297, 0.24707031, -0.088378906, -0.095703125, 0.15722656,
-            0.0625, 0.13378906, 0.5234375, -0.18164062, -0.11230469, 0.15332031, -0.11621094, -0.1953125,
-            0.15917969, -0.21191406, -0.036376953, 0.04711914, -0.049072266, -0.25976562, -0.12158203, 0.22851562,
-            -0.06225586, 0.01977539, -0.05419922, 0.016967773, -0.22363281, -0.00064849854, -0.13671875, -0.5078125,
-            0.010986328, 0.0234375, 0.106933594, 0.32617188, 0.015136719, 0.18652344, -0.20605469, -0.123535156,
-            -0.13769531, -0.21484375, -0.107421875, 0.11035156, 0.11328125, -0.030151367, 0.28515625, 0.18164062,
-            0.328125, 0.16601562, -0.04272461, -0.14257812, 0.38085938, 0.06933594, -0.07714844, -0.19238281,
-            0.33203125, 0.09326172, -0.15722656, 0.15917969, -0.012390137, -0.22753906, -0.013061523, 0.13769531,
-            0.41210938, -0.10498047, -0.1328125, -0.061523438, -0.123046875, -0.25976562, -0.0625, -0.028686523,
-            0.029663086, 0.09423828, 0.14648438, -0.12597656, 0.32617188, 0.044921875, -0.296875, 0.09667969,
-            -0.04296875, -0.010070801, 0.020385742, 0.296875, 0.03125, 0.047607422, 0.104003906, 0.103027344,
-            -0.14746094, 0.21191406, -0.14160156, -0.03930664, -0.29296875, -0.029418945, 0.060058594, 0.067871094,
-            -0.08984375, -0.035888672, -0.20703125, 0.0107421875, -0.16210938, -0.008239746, 0.029418945,
-            0.05078125, 0.109375, 0.17871094, -0.020996094, 0.33007812, 0.23242188, -0.16601562, -0.1875,
-            0.37695312, -0.18652344, 0.12988281, 0.053466797, 0.19824219, 0.22070312, 0.19921875, 0.15917969,
-            -0.18945312, -0.265625, 0.21582031, -0.06542969, 0.42382812, -0.13378906, 0.07763672, 0.0859375,
-            -0.22851562, -0.23925781, -0.20117188, 0.11621094, -0.018798828, -0.018432617, -0.19726562, 0.31640625,
-            -0.003479004, -0.16113281, -0.19238281, -0.020874023, -0.14648438, -0.32226562, 0.21875, 0.33007812,
-            -0.16894531, 0.22753906, -0.14160156, -0.036621094, 0.092285156, -0.21191406, -0.25, 0.0010375977,
-            0.068847656, 0.15234375, 0.27148438, 0.203125, 0.38085938, 0.14257812, -0.029541016, 0.21289062,
-            -0.1171875, -0.07324219, -0.09423828, 0.010681152, -0.008605957, -0.10253906, 0.24316406, 0.359375,
-            0.09472656, 0.00680542, -0.14355469, 0.2578125, 0.03857422, 0.026000977, 0.025756836, 0.10498047,
-            -0.041259766, -0.1875, 0.24511719, 0.024414062, 0.025634766, 0.041503906, -0.03564453, 0.033203125,
-            0.15136719, 0.026611328, 0.20019531, 0.15722656, -0.027832031, 0.052978516, -0.06542969, -0.08984375,
-            -0.038330078, 0.002960205, -0.26757812, 0.37109375, -0.10058594, -0.21972656, 0.14648438, 0.26757812,
-            0.123046875, 0.019897461, 0.2109375, 0.11669922, 0.1875, 0.012390137, -0.057128906, 0.064453125,
-            0.12207031, 0.040771484, 0.23144531, 0.12597656, -0.23046875, 0.099609375, -0.021362305, -0.12451172,
-            -0.25585938, -0.25585938, -0.050048828, 0.075683594, -0.037597656, 0.114746094, 0.0703125, -0.020263672,
-            -0.34375, -0.05102539, 0.10058594, -0.2734375, -0.33203125, -0.2265625, 0.15722656, 0.07470703,
-            -0.08203125, 0.072753906, 0.08251953, 0.18457031, -0.13183594, -0.21777344, -0.107421875, 0.055664062,
-            0.34765625, 0.15820312, -0.0625, -0.07373047, -0.18945312, -0.19238281, -0.24804688, -0.05078125,
-            0.061767578, 0.032470703, -0.06542969, 0.030273438, -0.037841797, -0.13671875, 0.027954102, -0.24609375,
-            -0.01965332, -0.022705078, -0.23242188, -0.12597656, 0.12988281, -0.095214844, -0.038085938,
-            -0.27929688, 0.014953613, 0.05078125, 0.20214844, 0.030273438, 0.13183594]
-
-backwards = [0.0047912598, -0.119140625, -0.05102539, 0.1328125, -0.27929688, -0.3671875, 0.053466797, -0.15917969,
-             0.05859375, 0.296875, 0.11230469, 0.03466797, 0.071777344, 0.20507812, -0.13671875, 0.05053711, 0.16894531,
-             0.011474609, 0.18457031, -0.2734375, 0.20898438, 0.16503906, 0.18164062, -0.03173828, 0.14648438,
-             -0.01965332, -0.13574219, -0.059814453, 0.41796875, 0.05444336, -0.22265625, 0.20117188, 0.03515625,
-             0.20898438, -0.08691406, 0.08203125, 0.17285156, 0.11816406, -0.091308594, 0.024536133, 0.10644531,
-             -0.0009536743, 0.2734375, -0.18652344, -0.171875, 0.21679688, -0.01574707, -0.10498047, 0.16503906,
-             -0.15527344, -0.18066406, 0.15527344, -0.12597656, -0.40820312, -0.11230469, 0.20410156, -0.059326172,
-             0.0022125244, 0.09863281, -0.009277344, -0.14941406, 0.03491211, -0.01965332, -0.48828125, 0.12011719,
-             -0.08203125, 0.05517578, 0.16796875, -0.03149414, 0.123535156, -0.23339844, -0.13183594, -0.028198242,
-             -0.31835938, -0.31640625, 0.08544922, 0.23730469, 0.087402344, 0.16992188, 0.18164062, 0.296875,
-             0.008850098, -0.008972168, -0.20996094, 0.13671875, 0.04711914, -0.119140625, -0.16503906, 0.25195312,
-             0.21875, -0.0047302246, 0.19824219, -0.12207031, -0.28710938, -0.006164551, 0.064453125, 0.26953125,
-             -0.18945312, -0.057373047, -0.17773438, -0.14257812, -0.17871094, 0.021362305, 0.2109375, 0.038330078,
-             0.203125, -0.020874023, -0.16113281, 0.13671875, -0.043945312, -0.21386719, 0.044189453, 0.0056152344,
-             0.14550781, -0.020019531, 0.13183594, -0.041748047, 0.13867188, -0.04321289, 0.068359375, -0.17773438,
-             0.0062561035, 0.009399414, 0.061279297, -0.20898438, -0.07080078, -0.28515625, 0.057861328, -0.087402344,
-             0.08886719, -0.20117188, -0.19042969, -0.24804688, -0.04248047, -0.013916016, 0.007293701, 0.064941406,
-             0.083496094, -0.009033203, 0.36328125, 0.21289062, -0.032226562, -0.15332031, 0.20214844, 0.051757812,
-             0.20410156, 0.067871094, 0.09716797, 0.20898438, 0.17578125, 0.3125, -0.24414062, -0.079589844, 0.29296875,
-             -0.07324219, 0.47460938, -0.1953125, 0.1328125, -0.08935547, -0.08496094, -0.14257812, 0.057861328,
-             0.11328125, -0.029174805, 0.0033111572, -0.37695312, 0.10498047, -0.0625, -0.15527344, -0.16699219,
-             -0.020751953, 0.014221191, -0.41210938, 0.32617188, 0.17773438, -0.25195312, 0.40039062, -0.13183594,
-             0.055908203, 0.12695312, -0.09667969, -0.23730469, 0.13574219, -0.087890625, 0.20214844, 0.23632812,
-             0.23828125, 0.48632812, -0.056640625, -0.041015625, 0.35351562, 0.11669922, 0.05883789, 0.059326172,
-             0.14746094, 0.14746094, -0.012390137, 0.13769531, 0.09814453, -0.088378906, 0.012939453, -0.024780273,
-             0.24316406, 0.109375, 0.11767578, 0.068847656, 0.036376953, 0.1328125, -0.19628906, 0.26171875, 0.18554688,
-             -0.00340271, -0.11328125, -0.039794922, -0.08642578, 0.025878906, 0.041992188, -0.032226562, -0.053222656,
-             0.0390625, -0.021484375, -0.106933594, -0.17675781, 0.10058594, -0.1953125, -0.17382812, 0.29101562,
-             0.012573242, -0.041503906, 0.13476562, 0.16796875, -0.11279297, 0.09326172, 0.11376953, 0.037353516,
-             0.20996094, -0.07910156, 0.004699707, 0.03564453, 0.1796875, -0.111816406, 0.34375, 0.08886719,
-             -0.22949219, 0.14160156, -0.15625, -0.07080078, 0.10107422, -0.33789062, -0.11279297, 0.21582031,
-             0.044921875, 0.04321289, 0.08251953, -0.010009766, -0.27734375, -0.19140625, 0.14257812, -0.40625,
-             -0.14746094, -0.21289062, 0.030395508, 0.044433594, -0.083496094, -0.013183594, 0.03466797, -0.052978516,
-             -0.08691406, -0.14355469, -0.12158203, -0.022338867, 0.33398438, 0.265625, 0.05102539, -0.118652344,
-             -0.22558594, -0.20898438, -0.025146484, -0.024536133, 0.11035156, -0.12207031, -0.025024414, 0.15332031,
-             0.044189453, 0.06298828, 0.14453125, -0.20507812, -0.1484375, 0.1328125, -0.10449219, 0.033691406,
-             0.28320312, -0.14648438, 0.036865234, -0.42773438, 0.021606445, 0.10595703, 0.064941406, -0.26171875,
-             0.0027160645]
-
-halt = [-0.21972656, -0.088378906, 0.21386719, -0.0026245117, -0.119628906, -0.16699219, -0.123046875, 0.056640625,
-        0.47851562, -0.046142578, 0.08154297, 0.13867188, 0.10253906, -0.103515625, -0.16308594, 0.107421875,
-        0.036132812, -0.15625, 0.25585938, -0.04663086, 0.08691406, 0.17480469, 0.083496094, 0.19726562, 0.021850586,
-        0.061279297, -0.06982422, 0.018920898, 0.22167969, 0.044189453, 0.080078125, -0.15527344, -0.27734375,
-        -0.17675781, -0.029541016, -0.13476562, -0.15234375, -0.140625, 0.16601562, -0.004425049, 0.26757812,
-        -0.041259766, 0.018920898, -0.021118164, -0.21289062, 0.0859375, -0.107910156, -0.09765625, 0.22949219,
-        0.07373047, 0.059814453, 0.296875, -0.09375, 0.063964844, -0.17871094, 0.02746582, -0.3046875, -0.20800781,
-        0.02722168, -0.26953125, -0.18554688, -0.18457031, 0.080078125, 0.055908203, -0.18457031, -0.28320312,
-        0.114746094, 0.07080078, -0.22363281, 0.021972656, -0.020385742, -0.080566406, 0.12988281, 0.33984375,
-        0.048583984, -0.041015625, -0.07470703, -0.140625, -0.19042969, 0.1796875, 0.06640625, 0.03515625, 0.002243042,
-        -0.29296875, 0.390625, 0.27539062, 0.09765625, 0.20898438, -0.10253906, -0.14648438, 0.06347656, -0.107421875,
-        0.017456055, -0.4140625, -0.19726562, 0.028930664, -0.16796875, 0.057128906, -0.071777344, -0.096191406,
-        -0.029663086, 0.09716797, 0.014831543, 0.125, 0.21972656, -0.28515625, 0.24902344, -0.19238281, 0.018310547,
-        -0.044677734, 0.103515625, 0.0036621094, 0.10253906, -0.05102539, 0.010131836, -0.12792969, 0.014465332,
-        0.27148438, 0.038085938, 0.13671875, 0.14257812, 0.125, -0.031982422, 0.057128906, -0.19042969, -0.022949219,
-        0.063964844, -0.34570312, 0.28710938, -0.22460938, 0.359375, -0.2890625, 0.087890625, -0.099609375,
-        -0.002380371, 0.24121094, 0.080078125, 0.052490234, -0.38867188, -0.037841797, 0.0546875, -0.4921875,
-        0.21289062, 0.33984375, 0.029907227, -0.15234375, 0.060302734, -0.078125, -0.1640625, -0.036376953, 0.33398438,
-        -0.004425049, -0.11816406, 0.12060547, 0.06542969, 0.078125, 0.22363281, 0.047607422, -0.11230469, -0.06738281,
-        0.02319336, -0.025634766, -0.03930664, -0.15332031, -0.048828125, -0.33007812, 0.122558594, -0.171875,
-        0.008178711, 0.07373047, -0.014831543, -0.035888672, -0.051513672, 0.14453125, 0.24121094, -0.19335938,
-        0.28515625, -0.01586914, -0.28320312, -0.05419922, -0.17285156, 0.067871094, 0.30078125, -0.30078125,
-        0.29882812, 0.23144531, 0.375, 0.0234375, -0.13964844, 0.33203125, 0.07421875, 0.031982422, 0.15332031,
-        0.059326172, 0.0146484375, -0.021728516, 0.19433594, 0.08251953, -0.06201172, -0.22949219, 0.08251953,
-        -0.25976562, -0.068359375, 0.14355469, 0.29101562, 0.14355469, -0.15332031, 0.100097656, 0.23632812,
-        -0.22070312, -0.04736328, 0.13085938, -0.20996094, -0.022460938, -0.012756348, -0.11035156, -0.044189453,
-        -0.13378906, -0.028686523, 0.06640625, 0.4296875, 0.09326172, -0.083496094, 0.14160156, 0.07080078, -0.2734375,
-        0.29296875, -0.08935547, 0.12988281, 0.15917969, 0.42578125, 0.11669922, 0.10595703, 0.040283203, -0.007537842,
-        -0.27539062, -0.016967773, -0.14257812, 0.38085938, 0.025878906, -0.24023438, 0.25390625, -0.40429688,
-        -0.017456055, 0.028686523, -0.23730469, -0.16699219, 0.28125, 0.06542969, -0.005554199, 0.35351562, 0.13867188,
-        -0.06542969, -0.064453125, -0.16210938, -0.3203125, 0.25976562, -0.23242188, 0.15722656, 0.002609253,
-        0.104003906, 0.10205078, 0.048828125, 0.11767578, 0.20605469, -0.17382812, -0.25, -3.671646e-05, -0.032226562,
-        -0.26171875, 0.3046875, 0.36914062, 0.2734375, -0.43359375, 0.29492188, -0.049560547, -0.42578125, -0.1328125,
-        0.23828125, -0.12451172, 0.09716797, 0.16894531, 0.29882812, 0.16015625, -0.18554688, -0.12792969, -0.39648438,
-        0.10205078, 0.26953125, -0.37304688, -0.04638672, -0.10498047, -0.27734375, 0.12792969, 0.0037078857, 0.09375,
-        -0.17871094, 0.06298828, -0.030883789, 0.15820312]
-
-cease = [-0.2109375, -0.20019531, 0.296875, 0.17089844, -0.16992188, -0.07421875, -0.061767578, 0.07080078, 0.41601562,
-         -0.21777344, -0.053710938, 0.061279297, -0.34570312, 0.009277344, -0.06298828, 0.008605957, 0.009155273,
-         0.111816406, 0.21484375, -0.044189453, 0.10058594, -0.0052490234, 0.030517578, 0.123535156, 0.23242188,
-         0.13183594, 0.26953125, 0.18359375, 0.13671875, -0.3046875, -0.017944336, -0.31835938, -0.22558594, 0.14257812,
-         -0.18066406, 0.012329102, 0.16796875, -0.026977539, 0.24023438, 0.013671875, 0.32421875, -0.0001707077,
-         0.15527344, -0.19042969, 0.05444336, 0.00982666, -0.060302734, -0.08544922, -0.05029297, 0.14257812,
-         -0.00074768066, 0.14648438, -0.15429688, -0.029174805, -0.025268555, -0.22070312, -0.099121094, -0.44921875,
-         -0.07080078, -0.15820312, -0.03149414, 0.29492188, 0.013305664, 0.26757812, -0.32226562, -0.23535156,
-         -0.16992188, 0.1640625, -0.41601562, -0.032958984, 0.06201172, -0.30078125, 0.2109375, 0.2265625, -0.030151367,
-         -0.088378906, -0.13574219, -0.13964844, 0.040039062, -0.014465332, -0.047607422, 0.005340576, 0.06201172,
-         -0.11376953, -0.32226562, 0.13476562, 0.28515625, 0.14453125, 0.24316406, 0.1640625, 0.11621094, -0.37304688,
-         0.21875, -0.3125, -0.265625, 0.0029754639, -0.24511719, -0.01940918, 0.053710938, -0.07714844, -0.051757812,
-         0.015380859, -0.28515625, 0.12597656, 0.18457031, -0.203125, 0.024780273, -0.091796875, -0.033691406,
-         -0.030395508, -0.08642578, -0.19824219, 0.029907227, -0.08105469, 0.031982422, -0.18554688, 0.045166016,
-         0.17871094, 0.18261719, 0.02709961, 0.20507812, -0.04711914, -0.051757812, 0.029907227, -0.095214844,
-         0.08203125, -0.04736328, -0.11279297, 0.13867188, -0.07519531, 0.296875, -0.14453125, -0.025756836,
-         -0.008178711, -0.083984375, 0.06640625, -0.12158203, -0.39648438, 0.18554688, -0.20214844, 0.12695312,
-         -0.13378906, 0.07519531, 0.060546875, 0.052001953, 0.028320312, 0.20703125, -0.1328125, 0.018432617,
-         -0.037841797, 0.265625, 0.5546875, 0.09863281, -0.064453125, -0.123535156, -0.07080078, 0.20117188,
-         -0.05834961, -0.021972656, 0.020751953, 0.079589844, 0.07324219, -0.33398438, -0.18261719, -0.060302734,
-         -0.24316406, 0.08691406, 0.030395508, -0.08691406, 0.14355469, 0.111816406, -0.10839844, 0.083984375,
-         -0.07421875, 0.22851562, -0.04736328, 0.40625, 0.076660156, -0.26953125, -0.2421875, -0.46289062, -0.13085938,
-         0.05078125, 0.07373047, 0.09375, 0.16796875, 0.15722656, -0.07861328, 0.021118164, 0.40039062, -0.03564453,
-         0.16015625, 0.026855469, 0.3671875, 0.05102539, -0.16894531, -0.096191406, -0.028320312, 0.12597656,
-         -0.12207031, 0.060058594, -0.20996094, 0.09863281, 0.056884766, 0.040527344, 0.30078125, -0.13183594,
-         0.15722656, 0.12451172, -0.2578125, 0.05883789, -0.005432129, -0.13085938, 0.063964844, 0.091308594,
-         -0.20507812, 0.0027008057, -0.28320312, -0.10253906, -0.20605469, 0.4296875, 0.13574219, -0.40625, 0.10498047,
-         0.0859375, -0.080078125, 0.19335938, 0.042236328, -0.04663086, 0.019165039, 0.23632812, 0.049072266,
-         0.17480469, 0.103027344, 0.01928711, -0.09423828, -0.0154418945, -0.063964844, 0.16308594, -0.015319824,
-         -0.13769531, -0.095214844, -0.2578125, -0.21972656, -0.013549805, -0.16210938, -0.27734375, 0.21484375,
-         0.09423828, -0.0703125, 0.37304688, 0.056396484, 0.045410156, -0.30273438, 0.19726562, -0.25976562, 0.42773438,
-         0.21484375, 0.11376953, 0.18945312, 0.41210938, -0.111328125, 0.08886719, 0.28710938, 0.13964844, -0.17480469,
-         -0.2265625, 0.10986328, 0.10644531, -0.35546875, 0.5234375, 0.19042969, 0.19238281, -0.13964844, 0.30273438,
-         -0.029907227, -0.52734375, -0.09375, 0.099609375, -0.11621094, -0.035888672, 0.24511719, 0.2890625,
-         -0.22949219, 0.08984375, -0.07470703, -0.13183594, -0.21777344, 0.4765625, -0.12890625, 0.13769531, 0.203125,
-         -0.37695312, 0.003692627, 0.12597656, 0.044189453, 0.010803223, 0.083984375, -0.067871094, 0.18652344]
-
-suspend = [-0.21386719, -0.20507812, 0.38867188, -0.061279297, -0.02734375, -0.11425781, -0.05908203, -0.1875,
-           0.51953125, -0.14550781, -0.16308594, 0.15722656, -0.040527344, -0.0030670166, -0.11621094, 0.29882812,
-           0.203125, -0.11230469, -0.08544922, 0.115722656, -0.09277344, -0.07470703, 0.12792969, 0.35742188, 0.171875,
-           -0.115722656, 0.16796875, 0.19335938, 0.05517578, 0.107910156, 0.0076904297, 0.071777344, -0.09472656,
-           -0.007873535, 0.119140625, -0.13964844, -0.16601562, -0.106933594, -0.037109375, 0.25585938, 0.21972656,
-           -0.17089844, 0.11035156, -0.083496094, -0.20996094, 0.15332031, -0.13085938, -0.41796875, -0.018798828,
-           -0.028320312, -0.20507812, -0.052734375, 0.07861328, -0.0859375, -0.06542969, -0.12011719, -0.3046875,
-           -0.12207031, -0.13183594, -0.104003906, -0.13183594, -0.106933594, 0.19140625, 0.31445312, -0.013916016,
-           -0.26757812, -0.13378906, 0.17773438, -0.29101562, -0.026733398, 0.06225586, 0.007293701, -0.012084961,
-           0.36914062, -0.03466797, -0.107910156, 0.099609375, -0.044677734, 0.17480469, 0.04711914, 0.07519531,
-           -0.033691406, 0.0064697266, -0.16308594, 0.23828125, 0.020019531, -0.021362305, 0.12695312, -0.18652344,
-           0.041503906, 0.16015625, -0.09814453, 0.26757812, -0.17578125, -0.075683594, -0.0008544922, -0.013061523,
-           0.087890625, -0.06933594, -0.17089844, 0.05908203, 0.100097656, -0.09326172, 0.019042969, 0.095703125,
-           -0.15625, 0.33007812, -0.20605469, -0.022338867, -0.041992188, -0.05419922, -0.31640625, -0.08544922,
-           0.007598877, 0.16113281, -0.34765625, 0.21582031, 0.18457031, 0.20996094, 0.08203125, 0.33203125,
-           -0.016967773, -0.060302734, 0.40625, -0.09863281, 0.09814453, 0.037109375, -0.27734375, -0.0076293945,
-           -0.16699219, 0.0390625, 0.017089844, -0.07373047, -0.043945312, -0.22167969, 0.080566406, -0.06347656,
-           0.030029297, -0.15429688, -0.037597656, -0.0058898926, -0.3515625, -0.08300781, 0.19140625, 0.15039062,
-           -0.088378906, -0.11279297, -0.19140625, -0.10253906, -0.1484375, 0.39453125, 0.23730469, -0.30273438,
-           -0.0022277832, -0.0065307617, -0.27929688, 0.40820312, -0.007507324, 0.0067443848, 0.23339844, 0.026733398,
-           -0.19628906, 0.13769531, -0.17675781, -0.05029297, -0.080566406, 0.17480469, -0.0056762695, 0.1796875,
-           0.05053711, 0.10546875, 0.09082031, 0.026367188, 0.0859375, 0.33007812, -0.23046875, 0.40820312,
-           -0.0052490234, -0.36523438, -0.06591797, -0.328125, -0.083984375, 0.01940918, -0.1796875, 0.3203125,
-           0.119140625, 0.079589844, -0.107910156, -0.015625, 0.21972656, -0.14160156, 0.018920898, 0.092285156,
-           0.36914062, 0.09472656, -0.19140625, 0.22460938, -0.10546875, 0.107910156, 0.080566406, -0.024780273,
-           -0.10205078, -0.115722656, 0.14160156, 0.171875, -0.04345703, 0.04345703, 0.05517578, 0.234375, -0.20605469,
-           0.02734375, 0.24902344, 0.17773438, 0.23144531, -0.05908203, 0.03491211, 0.037353516, -0.13085938,
-           -0.11230469, -0.171875, 0.265625, -0.13867188, -0.15722656, 0.09326172, 0.19628906, -0.13574219,
-           -0.087890625, -0.04321289, 0.19042969, 0.06347656, 0.24316406, 0.18847656, 0.17089844, 0.125, 0.07910156,
-           -0.11376953, 0.15917969, -0.27929688, 0.12011719, -0.12402344, -0.4140625, 0.22851562, -0.38671875,
-           -0.12158203, -0.16503906, -0.22558594, -0.359375, 0.13671875, -0.028442383, -0.20800781, 0.2734375,
-           0.19726562, 0.006713867, -0.36523438, -0.044921875, -0.09326172, 0.39257812, 0.13085938, 0.16503906,
-           0.14550781, 0.21972656, -0.018432617, 0.053466797, 0.23632812, 0.087890625, -0.029296875, -0.056396484,
-           0.06542969, 0.08300781, -0.25, 0.30859375, 0.31054688, -0.0036010742, -0.14160156, 0.27929688, -0.059570312,
-           -0.609375, -0.17578125, -0.013244629, 0.022216797, 0.08251953, 0.1953125, 0.27539062, 0.22265625,
-           -0.15136719, 0.100097656, -0.38085938, -0.00074768066, 0.25195312, -0.14160156, 0.2578125, 0.19628906,
-           -0.075683594, 0.019897461, -0.17871094, -0.010925293, 0.029663086, 0.18261719, -0.080566406, 0.09814453]